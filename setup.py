@@ -103,6 +103,7 @@ setuptools.setup(
         'src/scs_analysis/organisation_user_paths.py',
         'src/scs_analysis/organisation_users.py',
         'src/scs_analysis/organisations.py',
+        'src/scs_analysis/pipeline.py',
         'src/scs_analysis/sample_aggregate.py',
         'src/scs_analysis/sample_average.py',
         'src/scs_analysis/sample_collator.py',
@@ -118,6 +119,7 @@ setuptools.setup(
         'src/scs_analysis/sample_max.py',
         'src/scs_analysis/sample_mdape.py',
         'src/scs_analysis/sample_median.py',
+        'src/scs_analysis/sample_merge.py',
         'src/scs_analysis/sample_midpoint.py',
         'src/scs_analysis/sample_min.py',
         'src/scs_analysis/sample_noise.py',
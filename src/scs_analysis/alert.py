@@ -28,6 +28,9 @@ If neither indicator is used, then the specified email address(es) replace the c
 The --credentials flag is only required where the user wishes to store multiple identities. Setting the credentials
 is done interactively using the command line interface.
 
+If a local byline index has been created by aws_byline --index, bylines are taken from the index while it is
+current, rather than from the service.
+
 SYNOPSIS
 alert.py { -z | [-c CREDENTIALS]  { -F | -R ID | -C | -U ID | -D ID } [-d DESCRIPTION] [-p TOPIC] [-f FIELD]
 [-l LOWER] [-u UPPER] [-n { 0 | 1 }] [{ -r INTERVAL UNITS TIMEZONE | -t START END TIMEZONE }]
@@ -64,13 +67,15 @@ import sys
 
 from scs_analysis.cmd.cmd_alert import CmdAlert
 
+from scs_analysis.handler.byline_index import BylineIndex
+from scs_analysis.handler.cognito_session_cache import CognitoSessionCache
+
 from scs_core.aws.monitor.alert.alert import AlertSpecification
 
 from scs_core.aws.monitor.alert.alert_specification_manager import AlertSpecificationManager
 from scs_core.aws.manager.byline.byline_finder import BylineFinder
 
 from scs_core.aws.security.cognito_client_credentials import CognitoClientCredentials
-from scs_core.aws.security.cognito_login_manager import CognitoLoginManager
 
 from scs_core.client.http_exception import HTTPException, HTTPNotFoundException
 
@@ -122,8 +127,7 @@ if __name__ == '__main__':
             if not credentials:
                 exit(1)
 
-            gatekeeper = CognitoLoginManager()
-            auth = gatekeeper.user_login(credentials)
+            auth = CognitoSessionCache.user_login(Host, credentials)
 
             if not auth.is_ok():
                 logger.error("login: %s." % auth.authentication_status.description)
@@ -133,7 +137,7 @@ if __name__ == '__main__':
         # ------------------------------------------------------------------------------------------------------------
         # resources...
 
-        byline_finder = BylineFinder()
+        byline_finder = BylineIndex.construct(Host, BylineFinder())
         specification_manager = AlertSpecificationManager()
 
 
@@ -12,6 +12,11 @@ The aws_byline utility is used to find the date / time of the most-recently publ
 or device. The user may specify a topic path (find all devices that have published to the given topic), or a device tag
 (find all topics which the given device has published to), but not both. A further option --all reports all bylines.
 
+The --index flag writes the bylines found to a local byline index, which is then consulted by utilities such as
+baseline, alert, device_monitor and gas_response_summary before the service is queried. The index is created by an
+--all search, and its entries are reused for the given time to live (TTL). An --index search for a single device
+replaces the entry for that device. Deleting a byline removes its device from the index.
+
 Output is in the form of zero or more JSON documents, indicating the device, topic and localised date / time for each
 latest sense event.
 
@@ -22,11 +27,12 @@ The --credentials flag is only required where the user wishes to store multiple
 is done interactively using the command line interface.
 
 SYNOPSIS
-aws_byline.py [-c CREDENTIALS] { -F { -d DEVICE | -t TOPIC [-l] | -a } [-x EXCLUDED] [-s] [-m] |
+aws_byline.py [-c CREDENTIALS] { -F { -d DEVICE | -t TOPIC [-l] | -a } [-x EXCLUDED] [-s] [-m] [-I TTL] |
 -D DEVICE TOPIC } [-i INDENT] [-v]
 
 EXAMPLES
 aws_byline.py -t south-coast-science-demo -v -x /control
+aws_byline.py -F -a -I 1:00 -v > /dev/null
 
 DOCUMENT EXAMPLE - OUTPUT
 {"device": "scs-bgx-401", "topic": "south-coast-science-demo/brighton/loc/1/climate",
@@ -46,12 +52,13 @@ import sys
 
 from scs_analysis.cmd.cmd_aws_byline import CmdAWSByline
 from scs_analysis.handler.batch_download_reporter import BatchDownloadReporter
+from scs_analysis.handler.byline_index import BylineIndex
+from scs_analysis.handler.cognito_session_cache import CognitoSessionCache
 
 from scs_core.aws.manager.byline.byline_finder import BylineFinder
 from scs_core.aws.manager.byline.byline_manager import BylineManager
 
 from scs_core.aws.security.cognito_client_credentials import CognitoClientCredentials
-from scs_core.aws.security.cognito_login_manager import CognitoLoginManager
 
 from scs_core.client.http_exception import HTTPException
 from scs_core.client.network import Network
@@ -92,8 +99,7 @@ if __name__ == '__main__':
         if not credentials:
             exit(1)
 
-        gatekeeper = CognitoLoginManager()
-        auth = gatekeeper.user_login(credentials)
+        auth = CognitoSessionCache.user_login(Host, credentials)
 
         if not auth.is_ok():
             logger.error("login: %s." % auth.authentication_status.description)
@@ -107,6 +113,8 @@ if __name__ == '__main__':
 
         manager = BylineManager()
 
+        index = BylineIndex.construct(Host, finder)
+
 
         # ------------------------------------------------------------------------------------------------------------
         # check...
@@ -123,6 +131,8 @@ if __name__ == '__main__':
 
         if cmd.delete:
             manager.delete(auth.id_token, cmd.delete_device, cmd.delete_topic)
+            index.invalidate(device=cmd.delete_device)
+
             group = finder.find_bylines_for_device(auth.id_token, cmd.delete_device, include_messages=False)
 
         elif cmd.find:
@@ -134,9 +144,16 @@ if __name__ == '__main__':
                 group = finder.find_bylines_for_device(auth.id_token, cmd.device, excluded=cmd.excluded,
                                                        include_messages=cmd.include_messages)
 
+                if cmd.index:
+                    index.update_device(cmd.device, group.bylines, cmd.include_messages)
+
             else:
                 group = finder.find_bylines(auth.id_token, excluded=cmd.excluded, include_messages=cmd.include_messages)
 
+                if cmd.index:
+                    index.populate(group.bylines, cmd.include_messages, ttl=cmd.index_ttl)
+                    logger.info("indexed: %s" % index.filename)
+
         # report...
         report = []
         for byline in group.bylines:
@@ -22,6 +22,22 @@ mode returns the most recent document, or none, prior to, or at the given dateti
 The --rec-only flag causes only the rec fields on the documents to be returned. This results in much faster data
 retrieval, and is useful if sampling continuity is being tested.
 
+The --parallel flag may be used with start / end or timedelta ranges. The range is split into contiguous time
+shards, and PARALLEL shards are fetched concurrently. Documents are written in rec order. Where a checkpoint is
+given, shard boundaries are aligned to checkpoints. The --parallel flag may not be used with the --fetch-last flag, or
+with the 'auto' checkpoint.
+
+The --cache flag causes complete UTC days within a start / end or timedelta range to be served from a local cache,
+if present. Days that are not present are fetched and cached, once they have been over for an hour. Partial days at
+the start and end of the range are always fetched from the service. Where a checkpoint is given, days are only cached
+if midnight UTC is a checkpoint. Cached days are evicted after 30 days, or when the cache exceeds 1 GB. The --cache
+flag may not be used with the --fetch-last flag, or with the 'auto' checkpoint.
+
+The --resume flag records the progress of a start / end or timedelta download in the given FILE. If the download is
+interrupted, running the same command again resumes the download after the last document written, so that output
+may be appended to the output of the interrupted run without duplication. The end of a timedelta range is that of
+the original run. Once the download is complete, re-running the command produces no output.
+
 Note that no check is made for the existence of the topic - if the topic does not exist, then no error is raised and
 no data is returned.
 
@@ -30,11 +46,15 @@ is done interactively using the command line interface.
 
 SYNOPSIS
 aws_topic_history.py [-c CREDENTIALS] { -l | -a LATEST_AT [-b BACK-OFF] | -t { [[DD-]HH:]MM[:SS] | :SS } |
--s START [-e END] } { -p HH:MM:SS [-m] [-x] | [-w] [-f] } [-r] [{ -v | -d }] TOPIC
+-s START [-e END] } { -p HH:MM:SS [-m] [-x] | [-w] [-f] } [-r] [-P PARALLEL] [-C] [-R FILE]
+[--flush { line | block | auto }] [{ -v | -d }] TOPIC
 
 EXAMPLES
 aws_topic_history.py south-coast-science-dev/production-test/loc/1/gases -t 1 -v -w
 
+aws_topic_history.py south-coast-science-dev/production-test/loc/1/gases -s 2025-01-01 -e 2026-01-01 -P 8 -C \
+-R gases-2025.json -v >> gases-2025.jsonl
+
 DOCUMENT EXAMPLE - OUTPUT
 {"device": "scs-bbe-401", "topic": "south-coast-science-demo/brighton/loc/1/climate", "upload": "2019-01-11T12:15:36Z",
 "payload": {"val": {"hmd": 68.4, "tmp": 12.3}, "rec": "2019-01-11T12:15:36Z", "tag": "scs-bgx-401"}}
@@ -51,12 +71,16 @@ import sys
 
 from scs_analysis.cmd.cmd_aws_topic_history import CmdAWSTopicHistory
 from scs_analysis.handler.batch_download_reporter import BatchDownloadReporter
+from scs_analysis.handler.cognito_session_cache import CognitoSessionCache
+from scs_analysis.handler.flush_policy import FlushPolicy
+from scs_analysis.handler.topic_history_cache import TopicHistoryCache
+from scs_analysis.handler.topic_history_progress import TopicHistoryProgress
+from scs_analysis.handler.topic_history_shards import TopicHistoryShards
 
 from scs_core.aws.manager.byline.byline_finder import BylineFinder
 from scs_core.aws.manager.topic_history.topic_history_finder import TopicHistoryFinder
 
 from scs_core.aws.security.cognito_client_credentials import CognitoClientCredentials
-from scs_core.aws.security.cognito_login_manager import CognitoLoginManager
 
 from scs_core.client.http_exception import HTTPException
 from scs_core.client.network import Network
@@ -70,12 +94,27 @@ from scs_core.sys.logging import Logging
 from scs_host.sys.host import Host
 
 
+# --------------------------------------------------------------------------------------------------------------------
+
+def fetch(fetch_start, fetch_end, exclude_remainder):
+    if shards:
+        return shards.find_for_topic(cmd.topic, fetch_start, fetch_end, cmd.checkpoint, cmd.include_wrapper,
+                                     cmd.rec_only, cmd.min_max, exclude_remainder)
+
+    return finder.find_for_topic(auth.id_token, cmd.topic, fetch_start, fetch_end, None, cmd.fetch_last,
+                                 cmd.checkpoint, cmd.include_wrapper, cmd.rec_only, cmd.min_max, exclude_remainder,
+                                 False, None)
+
+
 # --------------------------------------------------------------------------------------------------------------------
 
 if __name__ == '__main__':
 
     agent = None
     reporter = None
+    shards = None
+    cache = None
+    progress = None
     start_time = None
 
     # ----------------------------------------------------------------------------------------------------------------
@@ -112,6 +151,9 @@ if __name__ == '__main__':
 
     logger.info(cmd)
 
+    flush_policy = FlushPolicy.construct(cmd.flush)
+    logger.info(flush_policy)
+
     try:
         # ------------------------------------------------------------------------------------------------------------
         # authentication...
@@ -121,8 +163,7 @@ if __name__ == '__main__':
         if not credentials:
             exit(1)
 
-        gatekeeper = CognitoLoginManager()
-        auth = gatekeeper.user_login(credentials)
+        auth = CognitoSessionCache.user_login(Host, credentials)
 
         if not auth.is_ok():
             logger.error("login: %s." % auth.authentication_status.description)
@@ -139,6 +180,12 @@ if __name__ == '__main__':
         reporter = BatchDownloadReporter('')
         finder = TopicHistoryFinder(reporter=reporter)
 
+        shards = None if cmd.parallel is None else TopicHistoryShards(auth.id_token, cmd.parallel)
+        logger.info(shards)
+
+        cache = TopicHistoryCache.construct(Host, reporter) if cmd.cache else None
+        logger.info(cache)
+
 
         # ------------------------------------------------------------------------------------------------------------
         # check...
@@ -180,15 +227,66 @@ if __name__ == '__main__':
             end = LocalizedDatetime.now() if cmd.end is None else cmd.end
             start = cmd.start
 
+        # progress...
+        if cmd.resume:
+            progress = TopicHistoryProgress.load(cmd.resume)
+
+            if progress is None:
+                progress = TopicHistoryProgress(cmd.topic, cmd.checkpoint, cmd.include_wrapper, cmd.rec_only,
+                                                cmd.min_max, cmd.exclude_remainder, start, end)
+
+            elif not progress.is_for(cmd.topic, cmd.checkpoint, cmd.include_wrapper, cmd.rec_only, cmd.min_max,
+                                     cmd.exclude_remainder):
+                logger.error("the resume file '%s' is for a different request." % cmd.resume)
+                progress = None
+                exit(2)
+
+            elif progress.complete:
+                logger.info("the download recorded in '%s' is complete." % cmd.resume)
+                progress = None
+                exit(0)
+
+            else:
+                logger.info("resuming: %s" % progress)
+
+                start = progress.resume_start()
+                end = progress.end
+
+            if not progress.save(cmd.resume):
+                logger.error("the resume file '%s' cannot be written." % cmd.resume)
+                progress = None
+                exit(1)
+
         logger.info("start: %s" % start)
         logger.info("end: %s" % end)
 
         # messages...
-        for message in finder.find_for_topic(auth.id_token, cmd.topic, start, end, None, cmd.fetch_last,
-                                             cmd.checkpoint, cmd.include_wrapper, cmd.rec_only, cmd.min_max,
-                                             cmd.exclude_remainder, False, None):
+        if cache:
+            messages = cache.find_for_topic(fetch, cmd.topic, start, end, cmd.checkpoint, cmd.include_wrapper,
+                                            cmd.rec_only, cmd.min_max, cmd.exclude_remainder)
+        else:
+            messages = fetch(start, end, cmd.exclude_remainder)
+
+        for message in messages:
+            rec = None
+
+            if progress:
+                rec = progress.rec(message, cmd.include_wrapper)
+
+                if not progress.accepts(rec):
+                    continue
+
             print(JSONify.dumps(message))
-            sys.stdout.flush()
+            flush_policy.flush()
+
+            if progress:
+                progress.emitted(rec, cmd.resume, stream=sys.stdout)
+
+        if progress:
+            progress.complete = True
+
+        if cache:
+            cache.evict()
 
 
     # ----------------------------------------------------------------------------------------------------------------
@@ -206,9 +304,21 @@ if __name__ == '__main__':
         exit(1)
 
     finally:
-        if reporter:
+        if shards:
+            logger.info("blocks: %s" % shards.block_count)
+
+        elif reporter:
             logger.info("blocks: %s" % reporter.block_count)
 
+        if progress:
+            progress.add_blocks(shards.block_count if shards else reporter.block_count)
+            progress.save(cmd.resume, stream=sys.stdout)
+
+            logger.info("progress: %s" % progress)
+
+        if cache:
+            logger.info("cache hits: %s misses: %s" % (reporter.hit_count, reporter.miss_count))
+
         if start_time:
             elapsed_time = LocalizedDatetime.now() - start_time
             logger.info("elapsed time: %s" % elapsed_time.as_json())
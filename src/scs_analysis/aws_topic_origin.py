@@ -37,12 +37,12 @@ import sys
 
 from scs_analysis.cmd.cmd_aws_topic_origin import CmdAWSTopicOrigin
 from scs_analysis.handler.batch_download_reporter import BatchDownloadReporter
+from scs_analysis.handler.cognito_session_cache import CognitoSessionCache
 
 from scs_core.aws.manager.byline.byline_finder import BylineFinder
 from scs_core.aws.manager.topic_origin.topic_origin_finder import TopicOriginFinder
 
 from scs_core.aws.security.cognito_client_credentials import CognitoClientCredentials
-from scs_core.aws.security.cognito_login_manager import CognitoLoginManager
 
 from scs_core.client.http_exception import HTTPException
 from scs_core.client.network import Network
@@ -81,8 +81,7 @@ if __name__ == '__main__':
         if not credentials:
             exit(1)
 
-        gatekeeper = CognitoLoginManager()
-        auth = gatekeeper.user_login(credentials)
+        auth = CognitoSessionCache.user_login(Host, credentials)
 
         if not auth.is_ok():
             logger.error("login: %s." % auth.authentication_status.description)
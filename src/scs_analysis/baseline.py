@@ -28,13 +28,22 @@ Any number of named baseline_conf files may be stored.
 The --credentials flag is only required where the user wishes to store multiple identities. Setting the credentials
 is done interactively using the command line interface.
 
+If a local byline index has been created by aws_byline --index, bylines are taken from the index while it is
+current, rather than from the service.
+
+Devices are processed in turn, unless the --jobs flag specifies that up to JOBS devices may be processed
+concurrently. In this case, the log output and reports for each device are held until the device is complete, and
+are then written as a group, in the order in which the devices were given on the command line.
+
 SYNOPSIS
 Usage: baseline.py [-c CREDENTIALS] -n CONF_NAME -f { V | E } [{ -r | -u COMMAND }] [-s START] [-e END]
-[-p AGGREGATION] [-m GAS MINIMUM] [{ -o GAS | -x GAS }] [-v] DEVICE_TAG_1 .. DEVICE_TAG_N
+[-p AGGREGATION] [-m GAS MINIMUM] [{ -o GAS | -x GAS }] [-j JOBS] [-v] DEVICE_TAG_1 .. DEVICE_TAG_N
 
 EXAMPLES
 baseline.py -c super -n freshfield -e 07:00 -fV scs-bgb-410
 
+baseline.py -c super -n freshfield -fV -j 8 scs-bgb-410 scs-bgb-411 scs-bgb-412
+
 FILES
 ~/SCS/conf/baseline_conf/NAME_baseline_conf.json
 
@@ -52,9 +61,14 @@ scs_mfr/scd30_baseline
 import json
 import sys
 
+from concurrent.futures import ThreadPoolExecutor
+
 from scs_analysis.cmd.cmd_baseline import CmdBaseline
 
 from scs_analysis.handler.batch_download_reporter import BatchDownloadReporter
+from scs_analysis.handler.byline_index import BylineIndex
+from scs_analysis.handler.cognito_session_cache import CognitoSessionCache
+from scs_analysis.handler.grouped_output import GroupedOutput
 
 from scs_core.aws.client.device_control_client import DeviceControlClient
 
@@ -62,7 +76,6 @@ from scs_core.aws.manager.byline.byline_finder import BylineFinder
 from scs_core.aws.manager.topic_history.topic_history_finder import TopicHistoryFinder
 
 from scs_core.aws.security.cognito_client_credentials import CognitoClientCredentials
-from scs_core.aws.security.cognito_login_manager import CognitoLoginManager
 
 from scs_core.client.http_exception import HTTPGatewayTimeoutException
 
@@ -85,310 +98,334 @@ from scs_core.sys.logging import Logging
 from scs_host.sys.host import Host
 
 
-# TODO: review Ox handling
 # --------------------------------------------------------------------------------------------------------------------
 
-if __name__ == '__main__':
+def process_device(device_tag, cmd, auth, baseline_conf, byline_finder, client, output):    # True if processed
+    history_finder = TopicHistoryFinder(reporter=BatchDownloadReporter('history'))         # a reporter per device
+    logger = Logging.getLogger()
 
-    MQTT_TIMEOUT = 60           # seconds
+    logger.info("-")
+    logger.info("device: %s" % device_tag)
 
-    key = None
-    monitor_auth = None
-    mqtt_client = None
+    try:
+        device_updates = 0
 
-    processed_count = 0
+        # ------------------------------------------------------------------------------------------------------------
+        # configuration...
 
-    # ----------------------------------------------------------------------------------------------------------------
-    # cmd...
+        logger.info("configuration...")
 
-    cmd = CmdBaseline()
+        # topics...
+        group = byline_finder.find_bylines_for_device(auth.id_token, device_tag)
 
-    if not cmd.is_valid():
-        cmd.print_help(sys.stderr)
-        exit(2)
+        if not group:
+            logger.error("no bylines found for %s." % device_tag)
+            return False
 
-    Logging.config('baseline', verbose=cmd.verbose)
-    logger = Logging.getLogger()
+        gases_topic = group.latest_topic(suffix='/gases')
+        control_topic = group.latest_topic(suffix='/control')
 
-    logger.info(cmd)
+        if gases_topic is None:
+            logger.error("no gases topic found for %s." % device_tag)
+            return False
 
+        if control_topic is None:
+            logger.error("no control topic found for %s." % device_tag)
+            return False
 
-    try:
-        # ------------------------------------------------------------------------------------------------------------
-        # authentication...
+        logger.info("gases_topic: %s" % gases_topic)
+        logger.info("control_topic: %s" % control_topic)
 
-        credentials = CognitoClientCredentials.load_for_user(Host, name=cmd.credentials_name)
+        # configuration...
+        response = client.interact(auth.id_token, device_tag, ['configuration'])
+        command = response.command
 
-        if not credentials:
-            exit(1)
+        if command.return_code != 0:
+            logger.error("configuration cannot be retrieved: %s" % command.stderr[0])
+            return False
 
-        gatekeeper = CognitoLoginManager()
-        auth = gatekeeper.user_login(credentials)
+        jdict = json.loads(command.stdout[0])
+        device_conf = Configuration.construct_from_jdict(jdict.get('val'))
 
-        if not auth.is_ok():
-            logger.error("login: %s." % auth.authentication_status.description)
-            exit(1)
+        # noinspection PyUnresolvedReferences
+        ox_index = None if device_conf.afe_id is None else device_conf.afe_id.sensor_index('Ox')
 
+        # AFECalib...
+        if ox_index is None:
+            ox_sensor = None
 
-        # ------------------------------------------------------------------------------------------------------------
-        # validation...
+        else:
+            response = client.interact(auth.id_token, device_tag, ['afe_calib'])
+            command = response.command
 
-        if cmd.start is not None and not DiurnalPeriod.is_valid_time(cmd.start):
-            logger.error("the start time is invalid.")
-            exit(2)
+            if command.return_code != 0:
+                logger.error("AFECAlib cannot be retrieved: %s" % command.stderr[0])
+                return False
 
-        if cmd.end is not None and not DiurnalPeriod.is_valid_time(cmd.end):
-            logger.error("the end time is invalid.")
-            exit(2)
+            jdict = json.loads(command.stdout[0])
+            afe_calib = AFECalib.construct_from_jdict(jdict)
+
+            afe_baseline = AFEBaseline.null_datum() if device_conf.afe_baseline is None else \
+                device_conf.afe_baseline
+
+            ox_baseline = afe_baseline.sensor_baseline(ox_index)
+            ox_calib = afe_calib.sensor_calib(ox_index)
+
+            ox_sensor = ox_calib.sensor(ox_baseline)
+            # logger.error(ox_sensor)
+
+        logger.error("-")
 
 
         # ------------------------------------------------------------------------------------------------------------
-        # resources...
+        # analysis...
 
-        # BylineFinder...
-        byline_finder = BylineFinder(reporter=BatchDownloadReporter('bylines'))
+        # data...
+        logger.info("data...")
 
-        # MessageManager...
-        history_finder = TopicHistoryFinder(reporter=BatchDownloadReporter('history'))
+        now = LocalizedDatetime.now()
 
-        # DeviceControlClient...
-        client = DeviceControlClient()
+        start = baseline_conf.start_datetime(now)
+        end = baseline_conf.end_datetime(now)
 
+        if end > now:
+            start -= Timedelta(days=1)
+            end -= Timedelta(days=1)
+            logger.error("WARNING: testing previous day...")
 
-        # ------------------------------------------------------------------------------------------------------------
-        # run...
+        logger.info("start: %s end: %s" % (start.as_iso8601(), end.as_iso8601()))
 
-        for device_tag in cmd.device_tags:
-            logger.info("-")
-            logger.info("device: %s" % device_tag)
+        data = list(history_finder.find_for_topic(auth.id_token, gases_topic, start, end,
+                                                  None, False, baseline_conf.checkpoint(),
+                                                  False, False, False, False, False, None))
 
-            try:
-                device_updates = 0
+        if not data:
+            logger.error("no data found for %s." % gases_topic)
+            return False
 
-                # ----------------------------------------------------------------------------------------------------
-                # configuration...
+        logger.info("expected: %s retrieved: %s" % (baseline_conf.expected_data_points(start, end), len(data)))
+        logger.info("-")
 
-                logger.info("configuration...")
+        # corrections...
+        logger.info("correction...")
 
-                # BaselineConf...
-                baseline_conf = BaselineConf.load(Host, name=cmd.conf_name)
+        conf_minimums = baseline_conf.minimums
+        no2_correction = None
 
-                if baseline_conf is None:
-                    logger.error("the baseline configuration '%s' is not available." % cmd.conf_name)
-                    continue
+        for minimum in Minimum.find_minimums(data, cmd.fields):
+            gas = minimum.gas
 
-                try:
-                    baseline_conf = cmd.override(baseline_conf)
-                except KeyError as ex:
-                    logger.error("the gas %s is not in the baseline configuration." % ex)
-                    continue
+            if cmd.excludes_gas(gas):       # not "only this gas"
+                continue
 
-                # host name...
-                host_tag = Host.name()
+            logger.info("-")
+            logger.info("%s..." % minimum.path)
 
-                # topics...
-                group = byline_finder.find_bylines_for_device(auth.id_token, device_tag)
+            if gas == cmd.exclude_gas:      # is excluded gas
+                logger.error("%s is excluded - skipping" % gas)
+                continue
 
-                if not group:
-                    logger.error("no bylines found for %s." % device_tag)
-                    continue
+            if gas not in conf_minimums:
+                logger.error("%s has no specified minimum - skipping" % gas)
+                continue
 
-                gases_topic = group.latest_topic(suffix='/gases')
-                control_topic = group.latest_topic(suffix='/control')
+            # NO2...
+            if minimum.path == 'val.NO2.cnc':
+                no2_correction = conf_minimums['NO2'] - minimum.value
 
-                if gases_topic is None:
-                    logger.error("no gases topic found for %s." % device_tag)
+            try:
+                if 'vCal' not in minimum.path and minimum.update_already_done(device_conf, end):
+                    logger.error("%s has been updated since the latest test period - skipping" % minimum.path)
                     continue
 
-                if control_topic is None:
-                    logger.error("no control topic found for %s." % device_tag)
+            except ValueError as ex:
+                logger.error("sensor with serial number %s is not supported - skipping" % ex)
+                continue
+
+            # Ox...
+            # TODO: correction needs to happen on the big data set - before minimums are found?
+            if minimum.path == 'val.Ox.cnc':
+                if no2_correction is None:
+                    logger.error('NO2 minimum required for Ox, but none available - skipping')
                     continue
 
-                logger.info("gases_topic: %s" % gases_topic)
-                logger.info("control_topic: %s" % control_topic)
+                sample = GasesSample.construct_from_jdict(minimum.sample)
 
-                # configuration...
-                response = client.interact(auth.id_token, device_tag, ['configuration'])
-                command = response.command
+                temp = sample.sht_datum.temp
+                no2_sample = sample.electrochem_datum.sns['NO2']
+                ox_sample = sample.electrochem_datum.sns['Ox']
 
-                if command.return_code != 0:
-                    logger.error("configuration cannot be retrieved: %s" % command.stderr[0])
-                    continue
+                no2_cnc = no2_sample.cnc + no2_correction
+                corrected = ox_sensor.datum(temp, ox_sample.we_v, ox_sample.ae_v, no2_cnc=no2_cnc)
+                minimum.value = corrected.cnc
 
-                jdict = json.loads(command.stdout[0])
-                device_conf = Configuration.construct_from_jdict(jdict.get('val'))
+            # report...
+            output.print(JSONify.dumps(minimum.summary(gas)))
 
-                # noinspection PyUnresolvedReferences
-                ox_index = None if device_conf.afe_id is None else device_conf.afe_id.sensor_index('Ox')
+            # minimums...
+            if minimum.value == conf_minimums[gas]:
+                logger.error("%s matches the specified minimum - skipping" % minimum.path)
+                continue
 
-                # AFECalib...
-                if ox_index is None:
-                    ox_sensor = None
+            if minimum.index == 0:
+                logger.error("WARNING: the first datum for %s is the minimum value" % minimum.path)
 
-                else:
-                    response = client.interact(auth.id_token, device_tag, ['afe_calib'])
-                    command = response.command
+            elif minimum.index == len(data) - 1:
+                logger.error("WARNING: the last datum for %s is the minimum value" % minimum.path)
 
-                    if command.return_code != 0:
-                        logger.error("AFECAlib cannot be retrieved: %s" % command.stderr[0])
-                        continue
 
-                    jdict = json.loads(command.stdout[0])
-                    afe_calib = AFECalib.construct_from_jdict(jdict)
+            # --------------------------------------------------------------------------------------------------------
+            # update...
 
-                    afe_baseline = AFEBaseline.null_datum() if device_conf.afe_baseline is None else \
-                        device_conf.afe_baseline
+            cmd_tokens = minimum.cmd_tokens(conf_minimums)
+            logger.info(' '.join([str(token) for token in cmd_tokens]))
 
-                    ox_baseline = afe_baseline.sensor_baseline(ox_index)
-                    ox_calib = afe_calib.sensor_calib(ox_index)
+            if cmd.rehearse:
+                continue
 
-                    ox_sensor = ox_calib.sensor(ox_baseline)
-                    # logger.error(ox_sensor)
+            response = client.interact(auth.id_token, device_tag, cmd_tokens)
+            command = response.command
 
-                logger.error("-")
+            if command.stderr:
+                output.print(*command.stderr, sep='\n', file=sys.stderr)
+            if command.stdout:
+                output.print(*command.stdout, sep='\n', file=sys.stdout)
 
+            if command.return_code != 0:
+                logger.error("update could not be performed: %s" % command.stderr[0])
+                continue
 
-                # ----------------------------------------------------------------------------------------------------
-                # analysis...
+            device_updates += 1
 
-                # data...
-                logger.info("data...")
+        # if not device_updates:
+        #     continue
 
-                now = LocalizedDatetime.now()
+        # reboot...
+        logger.info("-")
 
-                start = baseline_conf.start_datetime(now)
-                end = baseline_conf.end_datetime(now)
+        logger.info(cmd.uptake)
 
-                if start == end:
-                    logger.error("the start and end hours may not be the same.")
-                    exit(1)
+        client.interact(auth.id_token, device_tag, [cmd.uptake])
 
-                if end > now:
-                    start -= Timedelta(days=1)
-                    end -= Timedelta(days=1)
-                    logger.error("WARNING: testing previous day...")
+    except HTTPGatewayTimeoutException:
+        logger.error("device '%s' is not available." % device_tag)
+        return False
 
-                logger.info("start: %s end: %s" % (start.as_iso8601(), end.as_iso8601()))
+    return True
 
-                data = list(history_finder.find_for_topic(auth.id_token, gases_topic, start, end,
-                                                          None, False, baseline_conf.checkpoint(),
-                                                          False, False, False, False, False, None))
 
-                if not data:
-                    logger.error("no data found for %s." % gases_topic)
-                    continue
 
-                logger.info("expected: %s retrieved: %s" % (baseline_conf.expected_data_points(start, end), len(data)))
-                logger.info("-")
+# TODO: review Ox handling
+# --------------------------------------------------------------------------------------------------------------------
 
-                # corrections...
-                logger.info("correction...")
+if __name__ == '__main__':
 
-                conf_minimums = baseline_conf.minimums
-                correction_applied = False
-                no2_correction = None
+    MQTT_TIMEOUT = 60           # seconds
 
-                for minimum in Minimum.find_minimums(data, cmd.fields):
-                    gas = minimum.gas
+    key = None
+    monitor_auth = None
+    mqtt_client = None
 
-                    if cmd.excludes_gas(gas):       # not "only this gas"
-                        continue
+    processed_count = 0
+
+    # ----------------------------------------------------------------------------------------------------------------
+    # cmd...
+
+    cmd = CmdBaseline()
+
+    if not cmd.is_valid():
+        cmd.print_help(sys.stderr)
+        exit(2)
 
-                    logger.info("-")
-                    logger.info("%s..." % minimum.path)
+    Logging.config('baseline', verbose=cmd.verbose)
+    logger = Logging.getLogger()
+
+    logger.info(cmd)
 
-                    if gas == cmd.exclude_gas:      # is excluded gas
-                        logger.error("%s is excluded - skipping" % gas)
-                        continue
 
-                    if gas not in conf_minimums:
-                        logger.error("%s has no specified minimum - skipping" % gas)
-                        continue
+    try:
+        # ------------------------------------------------------------------------------------------------------------
+        # authentication...
 
-                    # NO2...
-                    if minimum.path == 'val.NO2.cnc':
-                        no2_correction = conf_minimums['NO2'] - minimum.value
+        credentials = CognitoClientCredentials.load_for_user(Host, name=cmd.credentials_name)
 
-                    try:
-                        if 'vCal' not in minimum.path and minimum.update_already_done(device_conf, end):
-                            logger.error("%s has been updated since the latest test period - skipping" % minimum.path)
-                            continue
+        if not credentials:
+            exit(1)
 
-                    except ValueError as ex:
-                        logger.error("sensor with serial number %s is not supported - skipping" % ex)
-                        continue
+        auth = CognitoSessionCache.user_login(Host, credentials)
 
-                    # Ox...
-                    # TODO: correction needs to happen on the big data set - before minimums are found?
-                    if minimum.path == 'val.Ox.cnc':
-                        if no2_correction is None:
-                            logger.error('NO2 minimum required for Ox, but none available - skipping')
-                            continue
+        if not auth.is_ok():
+            logger.error("login: %s." % auth.authentication_status.description)
+            exit(1)
 
-                        sample = GasesSample.construct_from_jdict(minimum.sample)
 
-                        temp = sample.sht_datum.temp
-                        no2_sample = sample.electrochem_datum.sns['NO2']
-                        ox_sample = sample.electrochem_datum.sns['Ox']
+        # ------------------------------------------------------------------------------------------------------------
+        # validation...
 
-                        no2_cnc = no2_sample.cnc + no2_correction
-                        corrected = ox_sensor.datum(temp, ox_sample.we_v, ox_sample.ae_v, no2_cnc=no2_cnc)
-                        minimum.value = corrected.cnc
+        if cmd.start is not None and not DiurnalPeriod.is_valid_time(cmd.start):
+            logger.error("the start time is invalid.")
+            exit(2)
 
-                    # report...
-                    print(JSONify.dumps(minimum.summary(gas)))
-                    sys.stdout.flush()
+        if cmd.end is not None and not DiurnalPeriod.is_valid_time(cmd.end):
+            logger.error("the end time is invalid.")
+            exit(2)
 
-                    # minimums...
-                    if minimum.value == conf_minimums[gas]:
-                        logger.error("%s matches the specified minimum - skipping" % minimum.path)
-                        continue
+        # BaselineConf...
+        baseline_conf = BaselineConf.load(Host, name=cmd.conf_name)
 
-                    if minimum.index == 0:
-                        logger.error("WARNING: the first datum for %s is the minimum value" % minimum.path)
+        if baseline_conf is None:
+            logger.error("the baseline configuration '%s' is not available." % cmd.conf_name)
+            exit(1)
 
-                    elif minimum.index == len(data) - 1:
-                        logger.error("WARNING: the last datum for %s is the minimum value" % minimum.path)
+        try:
+            baseline_conf = cmd.override(baseline_conf)
+        except KeyError as ex:
+            logger.error("the gas %s is not in the baseline configuration." % ex)
+            exit(2)
 
+        now = LocalizedDatetime.now()
 
-                    # ------------------------------------------------------------------------------------------------
-                    # update...
+        if baseline_conf.start_datetime(now) == baseline_conf.end_datetime(now):
+            logger.error("the start and end hours may not be the same.")
+            exit(1)
 
-                    cmd_tokens = minimum.cmd_tokens(conf_minimums)
-                    logger.info(' '.join([str(token) for token in cmd_tokens]))
 
-                    if cmd.rehearse:
-                        continue
+        # ------------------------------------------------------------------------------------------------------------
+        # resources...
 
-                    response = client.interact(auth.id_token, device_tag, cmd_tokens)
-                    command = response.command
+        # BylineFinder...
+        byline_finder = BylineIndex.construct(Host, BylineFinder(reporter=BatchDownloadReporter('bylines')))
 
-                    if command.stderr:
-                        print(*command.stderr, sep='\n', file=sys.stderr)
-                    if command.stdout:
-                        print(*command.stdout, sep='\n', file=sys.stdout)
+        # DeviceControlClient...
+        client = DeviceControlClient()
 
-                    if command.return_code != 0:
-                        logger.error("update could not be performed: %s" % command.stderr[0])
-                        continue
+        # GroupedOutput...
+        output = GroupedOutput()
 
-                    device_updates += 1
 
-                # if not device_updates:
-                #     continue
+        # ------------------------------------------------------------------------------------------------------------
+        # run...
 
-                # reboot...
-                logger.info("-")
+        if cmd.jobs == 1:
+            for device_tag in cmd.device_tags:
+                if process_device(device_tag, cmd, auth, baseline_conf, byline_finder, client, output):
+                    processed_count += 1
 
-                logger.info(cmd.uptake)
+        else:
+            output.attach()
+            executor = ThreadPoolExecutor(max_workers=cmd.jobs)
 
-                client.interact(auth.id_token, device_tag, [cmd.uptake])
+            try:
+                futures = [output.submit(executor, process_device, device_tag, cmd, auth, baseline_conf, byline_finder,
+                                         client, output) for device_tag in cmd.device_tags]
 
-            except HTTPGatewayTimeoutException:
-                logger.error("device '%s' is not available." % device_tag)
-                continue
+                for future in futures:                  # output is released in input order
+                    if output.collect(future):
+                        processed_count += 1
 
-            processed_count += 1
+            finally:
+                executor.shutdown(wait=False, cancel_futures=True)
+                output.detach()
 
 
     # ----------------------------------------------------------------------------------------------------------------
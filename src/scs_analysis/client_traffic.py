@@ -59,12 +59,13 @@ import sys
 
 from scs_analysis.cmd.cmd_client_traffic import CmdClientTraffic
 
+from scs_analysis.handler.cognito_session_cache import CognitoSessionCache
+
 from scs_core.aws.client_traffic.client_traffic import ClientTrafficLocus
 from scs_core.aws.client_traffic.client_traffic_finder import ClientTrafficFinder
 from scs_core.aws.client_traffic.client_traffic_intercourse import ClientTrafficRequest
 
 from scs_core.aws.security.cognito_client_credentials import CognitoClientCredentials
-from scs_core.aws.security.cognito_login_manager import CognitoLoginManager
 from scs_core.aws.security.cognito_user_finder import CognitoUserFinder
 from scs_core.aws.security.organisation_manager import OrganisationManager
 
@@ -108,8 +109,7 @@ if __name__ == '__main__':
         if not credentials:
             exit(1)
 
-        gatekeeper = CognitoLoginManager()
-        auth = gatekeeper.user_login(credentials)
+        auth = CognitoSessionCache.user_login(Host, credentials)
 
         if not auth.is_ok():
             logger.error("login: %s." % auth.authentication_status.description)
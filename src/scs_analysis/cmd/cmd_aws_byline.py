@@ -10,6 +10,8 @@ import optparse
 
 from scs_analysis import version
 
+from scs_core.data.timedelta import Timedelta
+
 
 # --------------------------------------------------------------------------------------------------------------------
 
@@ -21,7 +23,8 @@ class CmdAWSByline(object):
         Constructor
         """
         self.__parser = optparse.OptionParser(usage="%prog [-c CREDENTIALS] { -F { -d DEVICE | -t TOPIC [-l] | -a } "
-                                                    "[-x EXCLUDED] [-s] [-m] | -D DEVICE TOPIC } [-i INDENT] [-v]",
+                                                    "[-x EXCLUDED] [-s] [-m] [-I TTL] | -D DEVICE TOPIC } "
+                                                    "[-i INDENT] [-v]",
                                               version=version())
 
         # identity...
@@ -59,6 +62,9 @@ class CmdAWSByline(object):
         self.__parser.add_option("--include-messages", "-m", action="store_true", dest="include_messages",
                                  default=False, help="report the message with each byline")
 
+        self.__parser.add_option("--index", "-I", type="string", action="store", dest="index",
+                                 help="write to the local byline index, with TTL [DD-]HH:MM[:SS] (--all or --device)")
+
         self.__parser.add_option("--indent", "-i", action="store", dest="indent", type=int,
                                  help="pretty-print the output with INDENT")
 
@@ -100,6 +106,13 @@ class CmdAWSByline(object):
             if self.latest and not bool(self.topic):
                 return False
 
+        if self.__opts.index is not None:
+            if not self.find or bool(self.topic) or self.excluded is not None or self.strict:
+                return False
+
+            if self.index_ttl is None:
+                return False
+
         if self.__args:
             return False
 
@@ -181,6 +194,16 @@ class CmdAWSByline(object):
         return self.__opts.include_messages
 
 
+    @property
+    def index(self):
+        return self.__opts.index is not None
+
+
+    @property
+    def index_ttl(self):
+        return Timedelta.construct_from_flag(self.__opts.index)
+
+
     @property
     def indent(self):
         return self.__opts.indent
@@ -199,6 +222,7 @@ class CmdAWSByline(object):
 
     def __str__(self, *args, **kwargs):
         return "CmdAWSByline:{credentials_name:%s, find:%s, delete:%s, device:%s, topic:%s, all:%s, " \
-                "excluded:%s, strict:%s, latest:%s, include_messages:%s, indent:%s, verbose:%s}" % \
+                "excluded:%s, strict:%s, latest:%s, include_messages:%s, index:%s, indent:%s, verbose:%s}" % \
                (self.credentials_name, self.find, self.__opts.delete, self.device, self.topic, self.all,
-                self.excluded, self.strict, self.latest, self.include_messages, self.indent, self.verbose)
+                self.excluded, self.strict, self.latest, self.include_messages, self.__opts.index, self.indent,
+                self.verbose)
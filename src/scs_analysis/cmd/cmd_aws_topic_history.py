@@ -27,7 +27,8 @@ class CmdAWSTopicHistory(object):
         """
         self.__parser = optparse.OptionParser(usage="%prog [-c CREDENTIALS] { -l | -a LATEST_AT [-b BACK-OFF] | "
                                                     "-t { [[DD-]HH:]MM[:SS] | :SS } | -s START [-e END] } "
-                                                    "{ -p HH:MM:SS [-m] [-x] | [-w] [-f] } [-r] [{ -v | -d }] TOPIC",
+                                                    "{ -p HH:MM:SS [-m] [-x] | [-w] [-f] } [-r] [-P PARALLEL] [-C] "
+                                                    "[-R FILE] [--flush { line | block | auto }] [{ -v | -d }] TOPIC",
                                               version=version())
 
         # identity...
@@ -73,6 +74,19 @@ class CmdAWSTopicHistory(object):
         self.__parser.add_option("--rec-only", "-r", action="store_true", dest="rec_only", default=False,
                                  help="retrieve only the rec field")
 
+        # mode...
+        self.__parser.add_option("--parallel", "-P", type="int", action="store", dest="parallel",
+                                 help="fetch PARALLEL time shards of a START / END or TIMEDELTA range concurrently")
+
+        self.__parser.add_option("--cache", "-C", action="store_true", dest="cache", default=False,
+                                 help="use the local cache for complete days of a START / END or TIMEDELTA range")
+
+        self.__parser.add_option("--resume", "-R", type="string", action="store", dest="resume",
+                                 help="record progress in FILE, and resume from FILE if present")
+
+        self.__parser.add_option("--flush", type="choice", choices=["line", "block", "auto"], action="store",
+                                 default="auto", dest="flush", help="flush output per line, block or auto (default)")
+
         self.__parser.add_option("--verbose", "-v", action="store_true", dest="verbose", default=False,
                                  help="report narrative to stderr")
 
@@ -126,6 +140,30 @@ class CmdAWSTopicHistory(object):
         if self.exclude_remainder and not self.checkpoint:
             return False
 
+        if self.parallel is not None:
+            if self.parallel < 1:
+                return False
+
+            if self.latest or self.__opts.latest_at is not None:
+                return False
+
+            if self.fetch_last or self.checkpoint == 'auto':
+                return False
+
+        if self.cache:
+            if self.latest or self.__opts.latest_at is not None:
+                return False
+
+            if self.fetch_last or self.checkpoint == 'auto':
+                return False
+
+        if self.resume is not None:
+            if self.latest or self.__opts.latest_at is not None:
+                return False
+
+            if self.fetch_last:
+                return False
+
         if self.verbose and self.debug:
             return False
 
@@ -243,6 +281,26 @@ class CmdAWSTopicHistory(object):
         return self.__opts.exclude_remainder
 
 
+    @property
+    def parallel(self):
+        return self.__opts.parallel
+
+
+    @property
+    def cache(self):
+        return self.__opts.cache
+
+
+    @property
+    def resume(self):
+        return self.__opts.resume
+
+
+    @property
+    def flush(self):
+        return self.__opts.flush
+
+
     @property
     def verbose(self):
         return self.__opts.verbose
@@ -267,7 +325,9 @@ class CmdAWSTopicHistory(object):
     def __str__(self, *args, **kwargs):
         return "CmdAWSTopicHistory:{credentials_name:%s, latest:%s, latest_at:%s, latest_at:%s, timedelta:%s, " \
                "start:%s, end:%s, fetch_last:%s, checkpoint:%s, include_wrapper:%s, rec_only:%s, " \
-               "min_max:%s, exclude_remainder:%s, verbose:%s, debug:%s, topic:%s}" % \
+               "min_max:%s, exclude_remainder:%s, parallel:%s, cache:%s, resume:%s, flush:%s, verbose:%s, " \
+               "debug:%s, topic:%s}" % \
                     (self.credentials_name, self.latest, self.__opts.latest_at, self.back_off, self.__opts.timedelta,
                      self.start, self.end, self.fetch_last, self.checkpoint, self.include_wrapper, self.rec_only,
-                     self.min_max, self.exclude_remainder, self.verbose, self.debug, self.topic)
+                     self.min_max, self.exclude_remainder, self.parallel, self.cache, self.resume, self.flush,
+                     self.verbose, self.debug, self.topic)
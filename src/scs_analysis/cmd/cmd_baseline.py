@@ -35,7 +35,8 @@ class CmdBaseline(object):
         self.__parser = optparse.OptionParser(usage="%prog [-c CREDENTIALS] -n CONF_NAME -f { V | E } "
                                                     "[{ -r | -u COMMAND }] "
                                                     "[-s START] [-e END] [-p AGGREGATION] [-m GAS MINIMUM] "
-                                                    "[{ -o GAS | -x GAS }] [-v] DEVICE_TAG_1 [..DEVICE_TAG_N]",
+                                                    "[{ -o GAS | -x GAS }] [-j JOBS] [-v] "
+                                                    "DEVICE_TAG_1 [..DEVICE_TAG_N]",
                                               version=version())
 
         # identity...
@@ -77,6 +78,10 @@ class CmdBaseline(object):
         self.__parser.add_option("--exclude-gas", "-x", type="string", action="store", dest="exclude_gas",
                                  help="exclude GAS")
 
+        # execution...
+        self.__parser.add_option("--jobs", "-j", type="int", action="store", dest="jobs", default=1,
+                                 help="process up to JOBS devices concurrently (default 1)")
+
         # output...
         self.__parser.add_option("--verbose", "-v", action="store_true", dest="verbose", default=False,
                                  help="report narrative to stderr")
@@ -104,6 +109,9 @@ class CmdBaseline(object):
         if self.only_gas is not None and self.exclude_gas is not None:
             return False
 
+        if self.jobs < 1:
+            return False
+
         if not self.__args:
             return False
 
@@ -197,6 +205,11 @@ class CmdBaseline(object):
         return self.__opts.exclude_gas
 
 
+    @property
+    def jobs(self):
+        return self.__opts.jobs
+
+
     @property
     def verbose(self):
         return self.__opts.verbose
@@ -215,8 +228,8 @@ class CmdBaseline(object):
 
     def __str__(self, *args, **kwargs):
         return "CmdBaseline:{credentials_name:%s, conf_name:%s, fields:%s, rehearse:%s, uptake:%s, start:%s, " \
-               "end:%s, aggregation_period:%s, minimum:%s, only_gas:%s, exclude_gas:%s, " \
+               "end:%s, aggregation_period:%s, minimum:%s, only_gas:%s, exclude_gas:%s, jobs:%s, " \
                "verbose:%s, device_tags:%s}" % \
                (self.credentials_name, self.conf_name, self.fields, self.rehearse, self.uptake, self.start,
                 self.end, self.interval, self.__opts.minimum, self.only_gas, self.exclude_gas,
-                self.verbose, self.device_tags)
+                self.jobs, self.verbose, self.device_tags)
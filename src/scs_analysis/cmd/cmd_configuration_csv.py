@@ -16,13 +16,15 @@ from scs_core.aws.manager.configuration.configuration_intercourse import Configu
 class CmdConfigurationCSV(object):
     """unix command line handler"""
 
+    __DEFAULT_JOBS = 4
+
     def __init__(self):
         """
         Constructor
         """
         self.__parser = optparse.OptionParser(usage="%prog [-c CREDENTIALS] { -n | -s | -l OUTPUT_CSV | "
-                                                    "{ -d | -f } [-o OUTPUT_CSV_DIR] } [-t DEVICE_TAG [-x]] "
-                                                    "[-v] [NODE_1..NODE_N]", version=version())
+                                                    "{ -d | -f } [-i] [-j JOBS] [-o OUTPUT_CSV_DIR] } "
+                                                    "[-t DEVICE_TAG [-x]] [-v] [NODE_1..NODE_N]", version=version())
 
         # identity...
         self.__parser.add_option("--credentials", "-c", type="string", action="store", dest="credentials_name",
@@ -45,6 +47,12 @@ class CmdConfigurationCSV(object):
         self.__parser.add_option("--full-histories", "-f", action="store_true", dest="full_histories", default=False,
                                  help="retrieve full configuration histories")
 
+        self.__parser.add_option("--incremental", "-i", action="store_true", dest="incremental", default=False,
+                                 help="retrieve only histories that have changed since the previous run")
+
+        self.__parser.add_option("--jobs", "-j", type="int", action="store", dest="jobs",
+                                 help="retrieve up to JOBS histories concurrently (default %s)" % self.__DEFAULT_JOBS)
+
         # filter...
         self.__parser.add_option("--device-tag", "-t", type="string", action="store", dest="device_tag",
                                  help="the device for the history report")
@@ -89,6 +97,12 @@ class CmdConfigurationCSV(object):
         if self.device_tag is None and self.exact_match:
             return False
 
+        if (self.incremental or self.__opts.jobs is not None) and not (self.diff_histories or self.full_histories):
+            return False
+
+        if self.jobs < 1:
+            return False
+
         return True
 
 
@@ -137,6 +151,16 @@ class CmdConfigurationCSV(object):
         return self.__opts.full_histories
 
 
+    @property
+    def incremental(self):
+        return self.__opts.incremental
+
+
+    @property
+    def jobs(self):
+        return self.__DEFAULT_JOBS if self.__opts.jobs is None else self.__opts.jobs
+
+
     @property
     def device_tag(self):
         return self.__opts.device_tag
@@ -170,6 +194,8 @@ class CmdConfigurationCSV(object):
 
     def __str__(self, *args, **kwargs):
         return "CmdConfigurationCSV:{credentials_name:%s, node_names:%s, separate:%s, latest:%s, diff_histories:%s, " \
-               "full_histories:%s, device_tag:%s, exact_match:%s, output_csv_dir:%s, verbose:%s, nodes:%s}" %  \
+               "full_histories:%s, incremental:%s, jobs:%s, device_tag:%s, exact_match:%s, output_csv_dir:%s, " \
+               "verbose:%s, nodes:%s}" %  \
                (self.credentials_name, self.node_names, self.separate, self.latest, self.diff_histories,
-                self.full_histories, self.device_tag, self.exact_match, self.output_csv_dir, self.verbose, self.nodes)
+                self.full_histories, self.incremental, self.jobs, self.device_tag, self.exact_match,
+                self.output_csv_dir, self.verbose, self.nodes)
@@ -9,6 +9,7 @@ source repo: scs_analysis
 import optparse
 
 from scs_analysis import version
+from scs_core.data.timedelta import Timedelta
 
 
 # --------------------------------------------------------------------------------------------------------------------
@@ -20,8 +21,8 @@ class CmdCSVJoin(object):
         """
         Constructor
         """
-        self.__parser = optparse.OptionParser(usage="%prog [-t TYPE] [-i] [-v] -l PREFIX PK FILENAME "
-                                                    "-r PREFIX PK FILENAME", version=version())
+        self.__parser = optparse.OptionParser(usage="%prog [-t TYPE] [-i] [{ -s | -x } [-n INTERVAL]] [-v] "
+                                                    "-l PREFIX PK FILENAME -r PREFIX PK FILENAME", version=version())
 
         # input...
         self.__parser.add_option("--left", "-l", type="string", nargs=3, action="store", dest="left",
@@ -37,6 +38,15 @@ class CmdCSVJoin(object):
         self.__parser.add_option("--iso8601", "-i", action="store_true", dest="iso8601", default=False,
                                  help="interpret the primary key as an ISO 8601 datetime")
 
+        self.__parser.add_option("--sorted", "-s", action="store_true", dest="sorted", default=False,
+                                 help="stream a merge join of files already sorted on their primary keys")
+
+        self.__parser.add_option("--indexed", "-x", action="store_true", dest="indexed", default=False,
+                                 help="index the smaller file, and stream the larger file against it")
+
+        self.__parser.add_option("--nearest", "-n", type="string", action="store", dest="nearest",
+                                 help="match the nearest ISO 8601 primary key within INTERVAL [DD-]HH:MM[:SS] or :SS")
+
         # output...
         self.__parser.add_option("--verbose", "-v", action="store_true", dest="verbose", default=False,
                                  help="report narrative to stderr")
@@ -53,9 +63,22 @@ class CmdCSVJoin(object):
         if self.__args:
             return False
 
+        if self.sorted and self.indexed:
+            return False
+
+        if self.__opts.nearest is not None and (not (self.sorted or self.indexed) or not self.iso8601):
+            return False
+
         return True
 
 
+    def is_valid_nearest(self):
+        if self.__opts.nearest is None:
+            return True
+
+        return self.nearest is not None
+
+
     # ----------------------------------------------------------------------------------------------------------------
 
     @property
@@ -98,6 +121,21 @@ class CmdCSVJoin(object):
         return self.__opts.iso8601
 
 
+    @property
+    def sorted(self):
+        return self.__opts.sorted
+
+
+    @property
+    def indexed(self):
+        return self.__opts.indexed
+
+
+    @property
+    def nearest(self):
+        return Timedelta.construct_from_flag(self.__opts.nearest)
+
+
     @property
     def verbose(self):
         return self.__opts.verbose
@@ -110,5 +148,7 @@ class CmdCSVJoin(object):
 
 
     def __str__(self, *args, **kwargs):
-        return "CmdCSVJoin:{type:%s, left:%s, right:%s, iso8601:%s, verbose:%s}" % \
-               (self.type, self.__opts.left, self.__opts.right, self.iso8601, self.verbose)
+        return "CmdCSVJoin:{type:%s, left:%s, right:%s, iso8601:%s, sorted:%s, indexed:%s, nearest:%s, " \
+               "verbose:%s}" % \
+               (self.type, self.__opts.left, self.__opts.right, self.iso8601, self.sorted, self.indexed, self.nearest,
+                self.verbose)
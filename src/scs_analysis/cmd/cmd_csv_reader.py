@@ -16,11 +16,13 @@ from scs_analysis import version
 class CmdCSVReader(object):
     """unix command line handler"""
 
-    def __init__(self):
+    def __init__(self, args=None):
         """
         Constructor
         """
-        self.__parser = optparse.OptionParser(usage="%prog [-s] [-n] [-l LIMIT] [-a] [-v] [FILENAME_1 ... FILENAME_N]",
+        self.__parser = optparse.OptionParser(usage="%prog [-s] [-n] [-k] [-j JOBS [-m ISO_PATH]] [-l LIMIT] "
+                                                    "[{ -a | -b }] [--flush { line | block | auto }] [-v] "
+                                                    "[FILENAME_1 ... FILENAME_N]",
                                               version=version())
 
         # mode...
@@ -30,17 +32,53 @@ class CmdCSVReader(object):
         self.__parser.add_option("--nullify", "-n", action="store_true", dest="nullify", default=False,
                                  help="convert empty or \"NULL\" strings to nulls")
 
+        self.__parser.add_option("--bulk", "-k", action="store_true", dest="bulk", default=False,
+                                 help="read in chunks, casting whole columns")
+
+        self.__parser.add_option("--jobs", "-j", type="int", action="store", dest="jobs", default=1,
+                                 help="number of files to parse concurrently (default 1)")
+
+        self.__parser.add_option("--merge", "-m", type="string", action="store", dest="merge",
+                                 help="interleave the files' documents by the ISO 8601 datetime field at ISO_PATH")
+
         # output...
         self.__parser.add_option("--limit", "-l", type="int", action="store", dest="limit",
-                                 help="output a maximum of LIMIT rows")
+                                 help="output a maximum of LIMIT rows from each file (not with --merge)")
 
         self.__parser.add_option("--array", "-a", action="store_true", dest="array", default=False,
                                  help="output JSON documents as array instead of a sequence")
 
+        self.__parser.add_option("--binary", "-b", action="store_true", dest="binary", default=False,
+                                 help="output binary frames instead of JSON documents")
+
+        self.__parser.add_option("--flush", type="choice", choices=["line", "block", "auto"], action="store",
+                                 default="auto", dest="flush", help="flush output per line, block or auto (default)")
+
         self.__parser.add_option("--verbose", "-v", action="store_true", dest="verbose", default=False,
                                  help="report narrative to stderr")
 
-        self.__opts, self.__args = self.__parser.parse_args()
+        self.__opts, self.__args = self.__parser.parse_args(args=args)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def is_valid(self):
+        if self.array and self.binary:
+            return False
+
+        if self.jobs < 1:
+            return False
+
+        if self.merge is not None and self.jobs < 2:
+            return False
+
+        if self.merge is not None and self.limit is not None:
+            return False
+
+        if self.jobs > 1 and self.filenames == [None]:
+            return False
+
+        return True
 
 
     # ----------------------------------------------------------------------------------------------------------------
@@ -62,6 +100,21 @@ class CmdCSVReader(object):
         return self.__opts.nullify
 
 
+    @property
+    def bulk(self):
+        return self.__opts.bulk
+
+
+    @property
+    def jobs(self):
+        return self.__opts.jobs
+
+
+    @property
+    def merge(self):
+        return self.__opts.merge
+
+
     @property
     def limit(self):
         return self.__opts.limit
@@ -72,6 +125,16 @@ class CmdCSVReader(object):
         return self.__opts.array
 
 
+    @property
+    def binary(self):
+        return self.__opts.binary
+
+
+    @property
+    def flush(self):
+        return self.__opts.flush
+
+
     @property
     def verbose(self):
         return self.__opts.verbose
@@ -89,5 +152,7 @@ class CmdCSVReader(object):
 
 
     def __str__(self, *args, **kwargs):
-        return "CmdCSVReader:{string:%s, nullify:%s, limit:%s, array:%s, verbose:%s, filenames:%s}" % \
-               (self.string, self.nullify, self.limit, self.array, self.verbose, self.filenames)
+        return "CmdCSVReader:{string:%s, nullify:%s, bulk:%s, jobs:%s, merge:%s, limit:%s, array:%s, binary:%s, " \
+               "flush:%s, verbose:%s, filenames:%s}" % \
+               (self.string, self.nullify, self.bulk, self.jobs, self.merge, self.limit, self.array, self.binary,
+                self.flush, self.verbose, self.filenames)
@@ -16,11 +16,12 @@ from scs_analysis import version
 class CmdCSVWriter(object):
     """unix command line handler"""
 
-    def __init__(self):
+    def __init__(self, args=None):
         """
         Constructor
         """
-        self.__parser = optparse.OptionParser(usage="%prog [{ -a | -x | -s }] [-l LIMIT] [-q] [-e] [-v] [FILENAME]",
+        self.__parser = optparse.OptionParser(usage="%prog [{ -a | -x | -s }] [-l LIMIT] [-q] [-e] "
+                                                    "[--flush { line | block | auto }] [-v] [FILENAME]",
                                               version=version())
 
         # mode...
@@ -43,10 +44,13 @@ class CmdCSVWriter(object):
         self.__parser.add_option("--echo", "-e", action="store_true", dest="echo", default=False,
                                  help="echo stdin to stdout")
 
+        self.__parser.add_option("--flush", type="choice", choices=["line", "block", "auto"], action="store",
+                                 default="auto", dest="flush", help="flush output per line, block or auto (default)")
+
         self.__parser.add_option("--verbose", "-v", action="store_true", dest="verbose", default=False,
                                  help="report narrative to stderr")
 
-        self.__opts, self.__args = self.__parser.parse_args()
+        self.__opts, self.__args = self.__parser.parse_args(args=args)
 
 
     # ----------------------------------------------------------------------------------------------------------------
@@ -101,6 +105,11 @@ class CmdCSVWriter(object):
         return self.__opts.echo
 
 
+    @property
+    def flush(self):
+        return self.__opts.flush
+
+
     @property
     def verbose(self):
         return self.__opts.verbose
@@ -119,6 +128,6 @@ class CmdCSVWriter(object):
 
     def __str__(self, *args, **kwargs):
         return "CmdCSVWriter:{append:%s, exclude_header:%s, header_scan:%s, limit:%s, " \
-                "quote_all:%s, echo:%s, verbose:%s, filename:%s}" % \
+                "quote_all:%s, echo:%s, flush:%s, verbose:%s, filename:%s}" % \
                 (self.append, self.exclude_header, self.header_scan, self.limit,
-                 self.quote_all, self.echo, self.verbose, self.filename)
+                 self.quote_all, self.echo, self.flush, self.verbose, self.filename)
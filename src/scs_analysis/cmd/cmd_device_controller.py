@@ -16,12 +16,15 @@ from scs_analysis import version
 class CmdDeviceController(object):
     """unix message line handler"""
 
+    __DEFAULT_JOBS = 8
+
     def __init__(self):
         """
         Constructor
         """
-        self.__parser = optparse.OptionParser(usage="%prog [-c CREDENTIALS] -t DEVICE_TAG "
-                                                    "{ [-s] -m CMD_TOKENS | [-w] [-i INDENT] } [-v] ",
+        self.__parser = optparse.OptionParser(usage="%prog [-c CREDENTIALS] { -t DEVICE_TAG "
+                                                    "{ [-s] -m CMD_TOKENS | [-w] [-i INDENT] } | -b [-j JOBS] [-w] } "
+                                                    "[-v] ",
                                               version=version())
 
         # identity...
@@ -35,6 +38,13 @@ class CmdDeviceController(object):
         self.__parser.add_option("--message", "-m", type="string", action="store", dest="message",
                                  help="send the given command(s)")
 
+        self.__parser.add_option("--batch", "-b", action="store_true", dest="batch", default=False,
+                                 help="run the device commands read from stdin")
+
+        self.__parser.add_option("--jobs", "-j", type="int", action="store", dest="jobs",
+                                 help="in batch mode, run commands for up to JOBS devices concurrently (default %s)" %
+                                      self.__DEFAULT_JOBS)
+
         # output...
         self.__parser.add_option("--std", "-s", action="store_true", dest="std", default=False,
                                  help="write to stderr and stdout")
@@ -54,10 +64,20 @@ class CmdDeviceController(object):
     # ----------------------------------------------------------------------------------------------------------------
 
     def is_valid(self):
+        if self.batch and (self.device_tag is not None or self.message is not None or self.std or
+                           self.indent is not None):
+            return False
+
+        if self.__opts.jobs is not None and (not self.batch or self.jobs < 1):
+            return False
+
         if self.std and (self.indent is not None or self.wrapper):
             return False
 
-        if (self.wrapper or self.indent or self.std) and not self.message:
+        if (self.indent or self.std) and not self.message:
+            return False
+
+        if self.wrapper and not (self.message or self.batch):
             return False
 
         if self.__args:
@@ -87,6 +107,16 @@ class CmdDeviceController(object):
         return self.__opts.message
 
 
+    @property
+    def batch(self):
+        return self.__opts.batch
+
+
+    @property
+    def jobs(self):
+        return self.__DEFAULT_JOBS if self.__opts.jobs is None else self.__opts.jobs
+
+
     # ----------------------------------------------------------------------------------------------------------------
     # properties: output
 
@@ -122,7 +152,7 @@ class CmdDeviceController(object):
 
 
     def __str__(self, *args, **kwargs):
-        return "CmdDeviceController:{credentials_name:%s, device_tag:%s, message:%s, wrapper:%s, std:%s, " \
-               "indent:%s, verbose:%s}" % \
-               (self.credentials_name, self.device_tag, self.message, self.wrapper, self.std,
+        return "CmdDeviceController:{credentials_name:%s, device_tag:%s, message:%s, batch:%s, jobs:%s, wrapper:%s, " \
+               "std:%s, indent:%s, verbose:%s}" % \
+               (self.credentials_name, self.device_tag, self.message, self.batch, self.jobs, self.wrapper, self.std,
                 self.indent, self.verbose)
@@ -19,7 +19,8 @@ class CmdGasResponseSummary(object):
         Constructor
         """
         self.__parser = optparse.OptionParser(usage="%prog [-c CREDENTIALS] [-s START] [-e END] "
-                                                    "[-i INDENT] [-v] DEVICE_TAG_1 [... DEVICE_TAG_N]",
+                                                    "[-j JOBS] [-i INDENT] [--flush { line | block | auto }] "
+                                                    "[-v] DEVICE_TAG_1 [... DEVICE_TAG_N]",
                                               version=version())
 
         # identity...
@@ -33,10 +34,17 @@ class CmdGasResponseSummary(object):
         self.__parser.add_option("--end", "-e", type="string", action="store", dest="end",
                                  help="end time (default now)")
 
+        # mode...
+        self.__parser.add_option("--jobs", "-j", type="int", action="store", dest="jobs", default=4,
+                                 help="number of devices to process concurrently (default 4)")
+
         # output...
         self.__parser.add_option("--indent", "-i", type="int", action="store", dest="indent",
                                  help="pretty-print the output with INDENT")
 
+        self.__parser.add_option("--flush", type="choice", choices=["line", "block", "auto"], action="store",
+                                 default="auto", dest="flush", help="flush output per line, block or auto (default)")
+
         self.__parser.add_option("--verbose", "-v", action="store_true", dest="verbose", default=False,
                                  help="report narrative to stderr")
 
@@ -49,6 +57,9 @@ class CmdGasResponseSummary(object):
         if len(self.__args) < 1:
             return False
 
+        if self.jobs < 1:
+            return False
+
         return True
 
 
@@ -69,11 +80,21 @@ class CmdGasResponseSummary(object):
         return self.__opts.end
 
 
+    @property
+    def jobs(self):
+        return self.__opts.jobs
+
+
     @property
     def indent(self):
         return self.__opts.indent
 
 
+    @property
+    def flush(self):
+        return self.__opts.flush
+
+
     @property
     def verbose(self):
         return self.__opts.verbose
@@ -91,7 +112,7 @@ class CmdGasResponseSummary(object):
 
 
     def __str__(self, *args, **kwargs):
-        return "CmdGasResponseSummary:{credentials_name:%s, start:%s, end:%s, indent:%s, verbose:%s, " \
-                "device_tags:%s}" % \
-               (self.credentials_name, self.start, self.end, self.indent, self.verbose,
+        return "CmdGasResponseSummary:{credentials_name:%s, start:%s, end:%s, jobs:%s, indent:%s, flush:%s, " \
+                "verbose:%s, device_tags:%s}" % \
+               (self.credentials_name, self.start, self.end, self.jobs, self.indent, self.flush, self.verbose,
                 self.device_tags)
@@ -18,12 +18,13 @@ from scs_core.data.path_dict import PathDict
 class CmdNode(object):
     """unix command line handler"""
 
-    def __init__(self):
+    def __init__(self, args=None):
         """
         Constructor
         """
-        self.__parser = optparse.OptionParser(usage="%prog [-r FROM TO] [-m A B JOIN] [-x] [-a] [-s] [-f FILE] "
-                                                    "[-i INDENT] [-v] [NODE_1 .. NODE_N]", version=version())
+        self.__parser = optparse.OptionParser(usage="%prog [-r FROM TO] [-m A B JOIN] [-x] [{ -a | -b }] [-s] "
+                                                    "[-f FILE] [-i INDENT] [--flush { line | block | auto }] [-v] "
+                                                    "[NODE_1 .. NODE_N]", version=version())
 
         # mode...
         self.__parser.add_option("--rename", "-r", type="string", nargs=2, action="store", dest="rename",
@@ -38,6 +39,9 @@ class CmdNode(object):
         self.__parser.add_option("--array", "-a", action="store_true", dest="array", default=False,
                                  help="output the sequence of input JSON documents as array")
 
+        self.__parser.add_option("--binary", "-b", action="store_true", dest="binary", default=False,
+                                 help="output binary frames instead of JSON documents")
+
         self.__parser.add_option("--sequence", "-s", action="store_true", dest="sequence", default=False,
                                  help="output the contents of the input array node(s) as a sequence")
 
@@ -48,16 +52,21 @@ class CmdNode(object):
         self.__parser.add_option("--indent", "-i", type="int", action="store", dest="indent",
                                  help="pretty-print the output with INDENT")
 
+        self.__parser.add_option("--flush", type="choice", choices=["line", "block", "auto"], action="store",
+                                 default="auto", dest="flush", help="flush output per line, block or auto (default)")
+
         self.__parser.add_option("--verbose", "-v", action="store_true", dest="verbose", default=False,
                                  help="report narrative to stderr")
 
-        self.__opts, self.__args = self.__parser.parse_args()
+        self.__opts, self.__args = self.__parser.parse_args(args=args)
 
 
     # ----------------------------------------------------------------------------------------------------------------
 
-    @classmethod
-    def is_valid(cls):
+    def is_valid(self):
+        if self.binary and (self.array or self.indent is not None):
+            return False
+
         return True
 
 
@@ -87,12 +96,12 @@ class CmdNode(object):
 
     @property
     def rename_from(self):
-        return self.__opts.move[0] if self.__opts.move else None
+        return self.__opts.rename[0] if self.__opts.rename else None
 
 
     @property
     def rename_to(self):
-        return self.__opts.move[1] if self.__opts.move else None
+        return self.__opts.rename[1] if self.__opts.rename else None
 
 
     @property
@@ -120,6 +129,11 @@ class CmdNode(object):
         return self.__opts.array
 
 
+    @property
+    def binary(self):
+        return self.__opts.binary
+
+
     @property
     def sequence(self):
         return self.__opts.sequence
@@ -135,6 +149,11 @@ class CmdNode(object):
         return self.__opts.indent
 
 
+    @property
+    def flush(self):
+        return self.__opts.flush
+
+
     @property
     def verbose(self):
         return self.__opts.verbose
@@ -163,7 +182,7 @@ class CmdNode(object):
 
 
     def __str__(self, *args, **kwargs):
-        return "CmdNode:{rename:%s, merge:%s, exclude:%s, array:%s, sequence:%s, filename:%s, " \
-                "indent:%s, verbose:%s, sub_paths:%s}" %  \
-               (self.__opts.rename, self.__opts.merge, self.exclude, self.array, self.sequence, self.filename,
-                self.indent, self.verbose, self.__args)
+        return "CmdNode:{rename:%s, merge:%s, exclude:%s, array:%s, binary:%s, sequence:%s, filename:%s, " \
+                "indent:%s, flush:%s, verbose:%s, sub_paths:%s}" %  \
+               (self.__opts.rename, self.__opts.merge, self.exclude, self.array, self.binary, self.sequence,
+                self.filename, self.indent, self.flush, self.verbose, self.__args)
@@ -17,12 +17,13 @@ from scs_core.data.timedelta import Timedelta
 class CmdSampleAggregate(object):
     """unix command line handler"""
 
-    def __init__(self):
+    def __init__(self, args=None):
         """
         Constructor
         """
         self.__parser = optparse.OptionParser(usage="%prog [-p HH:MM:SS [-x] [-r { [DD-]HH:MM[:SS]] | :SS }]] "
-                                                    "[-m] [-i ISO] [-v] [PATH_1..PATH_N]", version=version())
+                                                    "[-m] [-i ISO] [-g PATH] [--flush { line | block | auto }] [-v] "
+                                                    "[PATH_1..PATH_N]", version=version())
 
         # operation...
         self.__parser.add_option("--checkpoint", "-p", type="string", action="store", dest="checkpoint",
@@ -35,6 +36,9 @@ class CmdSampleAggregate(object):
         self.__parser.add_option("--iso-path", "-i", type="string", action="store", default="rec", dest="iso",
                                  help="path for ISO 8601 datetime field (default 'rec')")
 
+        self.__parser.add_option("--group-by", "-g", type="string", action="store", dest="group_by",
+                                 help="aggregate independently for each value of the field at PATH, such as 'tag'")
+
         self.__parser.add_option("--rule", "-r", type="string", action="store", dest="rule",
                                  help="apply 75% rule with sampling INTERVAL")
 
@@ -42,10 +46,13 @@ class CmdSampleAggregate(object):
                                  help="ignore data points after the last complete period")
 
         # output...
+        self.__parser.add_option("--flush", type="choice", choices=["line", "block", "auto"], action="store",
+                                 default="auto", dest="flush", help="flush output per line, block or auto (default)")
+
         self.__parser.add_option("--verbose", "-v", action="store_true", dest="verbose", default=False,
                                  help="report narrative to stderr")
 
-        self.__opts, self.__args = self.__parser.parse_args()
+        self.__opts, self.__args = self.__parser.parse_args(args=args)
 
 
     # ----------------------------------------------------------------------------------------------------------------
@@ -85,6 +92,11 @@ class CmdSampleAggregate(object):
         return self.__opts.iso
 
 
+    @property
+    def group_by(self):
+        return self.__opts.group_by
+
+
     @property
     def rule_interval(self):
         return Timedelta.construct_from_flag(self.__opts.rule)
@@ -95,6 +107,11 @@ class CmdSampleAggregate(object):
         return self.__opts.exclude_remainder
 
 
+    @property
+    def flush(self):
+        return self.__opts.flush
+
+
     @property
     def verbose(self):
         return self.__opts.verbose
@@ -112,7 +129,7 @@ class CmdSampleAggregate(object):
 
 
     def __str__(self, *args, **kwargs):
-        return "CmdSampleAggregate:{checkpoint:%s, min_max:%s, iso:%s, rule_interval:%s, exclude_remainder:%s, " \
-               "verbose:%s, nodes:%s}" %  \
-               (self.checkpoint, self.min_max, self.iso, self.rule_interval, self.exclude_remainder,
-                self.verbose, self.nodes)
+        return "CmdSampleAggregate:{checkpoint:%s, min_max:%s, iso:%s, group_by:%s, rule_interval:%s, " \
+               "exclude_remainder:%s, flush:%s, verbose:%s, nodes:%s}" %  \
+               (self.checkpoint, self.min_max, self.iso, self.group_by, self.rule_interval, self.exclude_remainder,
+                self.flush, self.verbose, self.nodes)
@@ -23,7 +23,8 @@ class CmdSampleCollator(object):
         Constructor
         """
         self.__parser = optparse.OptionParser(usage="%prog -x IND_PATH [-n NAME] -y DEP_PATH "
-                                                    "[-l LOWER_BOUND] -u UPPER_BOUND -d DELTA [-v]",
+                                                    "[-l LOWER_BOUND] -u UPPER_BOUND -d DELTA "
+                                                    "[--flush { line | block | auto }] [-v]",
                                               version=version())
 
         # compulsory...
@@ -47,6 +48,9 @@ class CmdSampleCollator(object):
                                  help="lower bound of dataset (default 0)")
 
         # output...
+        self.__parser.add_option("--flush", type="choice", choices=["line", "block", "auto"], action="store",
+                                 default="auto", dest="flush", help="flush output per line, block or auto (default)")
+
         self.__parser.add_option("--verbose", "-v", action="store_true", dest="verbose", default=False,
                                  help="report narrative to stderr")
 
@@ -98,6 +102,11 @@ class CmdSampleCollator(object):
         return self.__opts.delta
 
 
+    @property
+    def flush(self):
+        return self.__opts.flush
+
+
     @property
     def verbose(self):
         return self.__opts.verbose
@@ -110,5 +119,6 @@ class CmdSampleCollator(object):
 
 
     def __str__(self, *args, **kwargs):
-        return "CmdSampleCollator:{ind_path:%s, name:%s, dep_path:%s, lower:%s, upper:%s, delta:%s, verbose:%s}" % \
-               (self.ind_path, self.name, self.dep_path, self.lower, self.upper, self.delta, self.verbose)
+        return "CmdSampleCollator:{ind_path:%s, name:%s, dep_path:%s, lower:%s, upper:%s, delta:%s, flush:%s, " \
+               "verbose:%s}" % \
+               (self.ind_path, self.name, self.dep_path, self.lower, self.upper, self.delta, self.flush, self.verbose)
@@ -20,7 +20,8 @@ class CmdSampleDuplicates(object):
         """
         Constructor
         """
-        self.__parser = optparse.OptionParser(usage="%prog [{ -x | -c }] [-v] [PATH]", version=version())
+        self.__parser = optparse.OptionParser(usage="%prog [{ -x | -c }] [{ -s | -b CAPACITY }] [-v] [PATH]",
+                                              version=version())
 
         # mode...
         self.__parser.add_option("--exclude", "-x", action="store_true", dest="exclude", default=False,
@@ -29,6 +30,12 @@ class CmdSampleDuplicates(object):
         self.__parser.add_option("--counts", "-c", action="store_true", dest="counts", default=False,
                                  help="only list the count of matching documents")
 
+        self.__parser.add_option("--sorted", "-s", action="store_true", dest="sorted", default=False,
+                                 help="input is sorted on PATH - only adjacent duplicates are found")
+
+        self.__parser.add_option("--bloom", "-b", type="int", action="store", dest="bloom",
+                                 help="use a Bloom filter sized for CAPACITY unique values")
+
         # output...
         self.__parser.add_option("--verbose", "-v", action="store_true", dest="verbose", default=False,
                                  help="report narrative to stderr")
@@ -42,6 +49,12 @@ class CmdSampleDuplicates(object):
         if self.exclude and self.counts:
             return False
 
+        if self.sorted and self.bloom is not None:
+            return False
+
+        if self.bloom is not None and (self.bloom < 1 or self.counts):
+            return False
+
         if self.__args and len(self.__args) != 1:
             return False
 
@@ -60,6 +73,16 @@ class CmdSampleDuplicates(object):
         return self.__opts.counts
 
 
+    @property
+    def sorted(self):
+        return self.__opts.sorted
+
+
+    @property
+    def bloom(self):
+        return self.__opts.bloom
+
+
     @property
     def verbose(self):
         return self.__opts.verbose
@@ -77,5 +100,5 @@ class CmdSampleDuplicates(object):
 
 
     def __str__(self, *args, **kwargs):
-        return "CmdSampleDuplicates:{exclude:%s, counts:%s, verbose:%s, path:%s}" % \
-            (self.exclude, self.counts, self.verbose, self.path)
+        return "CmdSampleDuplicates:{exclude:%s, counts:%s, sorted:%s, bloom:%s, verbose:%s, path:%s}" % \
+            (self.exclude, self.counts, self.sorted, self.bloom, self.verbose, self.path)
@@ -22,7 +22,8 @@ class CmdSampleError(object):
         """
         Constructor
         """
-        self.__parser = optparse.OptionParser(usage="%prog { -l | -s } [-p PRECISION] [-v] "
+        self.__parser = optparse.OptionParser(usage="%prog { -l | -s } [-p PRECISION] "
+                                                    "[--flush { line | block | auto }] [-v] "
                                                     "REFERENCE_PATH REPORTED_PATH ERROR_PATH", version=version())
 
         # mode...
@@ -36,6 +37,9 @@ class CmdSampleError(object):
         self.__parser.add_option("--prec", "-p", type="int", action="store", default=3, dest="precision",
                                  help="precision (default 3 decimal places)")
 
+        self.__parser.add_option("--flush", type="choice", choices=["line", "block", "auto"], action="store",
+                                 default="auto", dest="flush", help="flush output per line, block or auto (default)")
+
         self.__parser.add_option("--verbose", "-v", action="store_true", dest="verbose", default=False,
                                  help="report narrative to stderr")
 
@@ -71,6 +75,11 @@ class CmdSampleError(object):
         return self.__opts.precision
 
 
+    @property
+    def flush(self):
+        return self.__opts.flush
+
+
     @property
     def verbose(self):
         return self.__opts.verbose
@@ -98,7 +107,7 @@ class CmdSampleError(object):
 
 
     def __str__(self, *args, **kwargs):
-        return "CmdSampleError:{linear:%s, scaling:%s, precision:%s, verbose:%s, " \
+        return "CmdSampleError:{linear:%s, scaling:%s, precision:%s, flush:%s, verbose:%s, " \
                "reference_path:%s, reported_path:%s, error_path:%s}" % \
-               (self.linear, self.scaling, self.precision, self.verbose,
+               (self.linear, self.scaling, self.precision, self.flush, self.verbose,
                 self.reference_path, self.reported_path, self.error_path)
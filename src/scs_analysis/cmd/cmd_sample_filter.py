@@ -20,12 +20,16 @@ class CmdSampleFilter(object):
         """
         Constructor
         """
-        self.__parser = optparse.OptionParser(usage="%prog [-p PRECISION] [-v] [PATH]", version=version())
+        self.__parser = optparse.OptionParser(usage="%prog [-p PRECISION] [--flush { line | block | auto }] [-v] "
+                                                    "[PATH]", version=version())
 
         # output...
         self.__parser.add_option("--prec", "-p", type="int", action="store", default=None, dest="precision",
                                  help="precision (default 0 decimal places)")
 
+        self.__parser.add_option("--flush", type="choice", choices=["line", "block", "auto"], action="store",
+                                 default="auto", dest="flush", help="flush output per line, block or auto (default)")
+
         self.__parser.add_option("--verbose", "-v", action="store_true", dest="verbose", default=False,
                                  help="report narrative to stderr")
 
@@ -48,6 +52,11 @@ class CmdSampleFilter(object):
         return self.__opts.precision
 
 
+    @property
+    def flush(self):
+        return self.__opts.flush
+
+
     @property
     def verbose(self):
         return self.__opts.verbose
@@ -65,4 +74,5 @@ class CmdSampleFilter(object):
 
 
     def __str__(self, *args, **kwargs):
-        return "CmdSampleFilter:{precision:%s, verbose:%s, path:%s}" % (self.precision, self.verbose, self.path)
+        return "CmdSampleFilter:{precision:%s, flush:%s, verbose:%s, " \
+               "path:%s}" % (self.precision, self.flush, self.verbose, self.path)
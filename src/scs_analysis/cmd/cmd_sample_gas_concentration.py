@@ -21,7 +21,8 @@ class CmdSampleGasConcentration(object):
         """
         Constructor
         """
-        self.__parser = optparse.OptionParser(usage="%prog [-v] GAS DENSITY_PATH T_PATH [{P_PATH | -p PRESSURE}]",
+        self.__parser = optparse.OptionParser(usage="%prog [--flush { line | block | auto }] "
+                                                    "[-v] GAS DENSITY_PATH T_PATH [{P_PATH | -p PRESSURE}]",
                                               version=version())
 
         # mode...
@@ -30,6 +31,9 @@ class CmdSampleGasConcentration(object):
                                                                 "(default %s)" % Gas.STP_PRESSURE)
 
         # output...
+        self.__parser.add_option("--flush", type="choice", choices=["line", "block", "auto"], action="store",
+                                 default="auto", dest="flush", help="flush output per line, block or auto (default)")
+
         self.__parser.add_option("--verbose", "-v", action="store_true", dest="verbose", default=False,
                                  help="report narrative to stderr")
 
@@ -55,6 +59,11 @@ class CmdSampleGasConcentration(object):
         return self.__opts.pressure
 
 
+    @property
+    def flush(self):
+        return self.__opts.flush
+
+
     @property
     def verbose(self):
         return self.__opts.verbose
@@ -87,5 +96,6 @@ class CmdSampleGasConcentration(object):
 
 
     def __str__(self, *args, **kwargs):
-        return "CmdSampleGasConcentration:{pressure:%s, verbose:%s, gas:%s, density_path:%s, t_path:%s, p_path:%s}" % \
-               (self.pressure, self.verbose, self.gas, self.density_path, self.t_path, self.p_path)
+        return "CmdSampleGasConcentration:{pressure:%s, flush:%s, verbose:%s, gas:%s, density_path:%s, t_path:%s, " \
+               "p_path:%s}" % \
+               (self.pressure, self.flush, self.verbose, self.gas, self.density_path, self.t_path, self.p_path)
@@ -22,12 +22,16 @@ class CmdSampleInterval(object):
         """
         Constructor
         """
-        self.__parser = optparse.OptionParser(usage="%prog [-p PRECISION] [-v] [PATH]", version=version())
+        self.__parser = optparse.OptionParser(usage="%prog [-p PRECISION] [--flush { line | block | auto }] [-v] "
+                                                    "[PATH]", version=version())
 
         # output...
         self.__parser.add_option("--prec", "-p", type="int", action="store", default=3, dest="precision",
                                  help="precision (default 3 decimal places)")
 
+        self.__parser.add_option("--flush", type="choice", choices=["line", "block", "auto"], action="store",
+                                 default="auto", dest="flush", help="flush output per line, block or auto (default)")
+
         self.__parser.add_option("--verbose", "-v", action="store_true", dest="verbose", default=False,
                                  help="report narrative to stderr")
 
@@ -50,6 +54,11 @@ class CmdSampleInterval(object):
         return self.__opts.precision
 
 
+    @property
+    def flush(self):
+        return self.__opts.flush
+
+
     @property
     def verbose(self):
         return self.__opts.verbose
@@ -67,4 +76,5 @@ class CmdSampleInterval(object):
 
 
     def __str__(self, *args, **kwargs):
-        return "CmdSampleInterval:{precision:%s, verbose:%s, path:%s}" % (self.precision, self.verbose, self.path)
+        return "CmdSampleInterval:{precision:%s, flush:%s, verbose:%s, " \
+               "path:%s}" % (self.precision, self.flush, self.verbose, self.path)
@@ -22,7 +22,8 @@ class CmdSampleISO8601(object):
         """
         self.__parser = optparse.OptionParser(usage="%prog { -z | { -o | -f DATE_FORMAT } "
                                                     "[-t TIMEZONE_NAME [-u]] [-i ISO_PATH] "
-                                                    "{ DATETIME_PATH [-n] | DATE_PATH TIME_PATH } } [-s] [-v]",
+                                                    "{ DATETIME_PATH [-n] | DATE_PATH TIME_PATH } } [-s] "
+                                                    "[--flush { line | block | auto }] [-v]",
                                               version=version())
 
         # helper...
@@ -53,6 +54,9 @@ class CmdSampleISO8601(object):
                                  help="ignore rows with malformed datetimes")
 
         # output...
+        self.__parser.add_option("--flush", type="choice", choices=["line", "block", "auto"], action="store",
+                                 default="auto", dest="flush", help="flush output per line, block or auto (default)")
+
         self.__parser.add_option("--verbose", "-v", action="store_true", dest="verbose", default=False,
                                  help="report narrative to stderr")
 
@@ -146,6 +150,11 @@ class CmdSampleISO8601(object):
         return self.__opts.skip_malformed
 
 
+    @property
+    def flush(self):
+        return self.__opts.flush
+
+
     @property
     def verbose(self):
         return self.__opts.verbose
@@ -174,6 +183,6 @@ class CmdSampleISO8601(object):
 
     def __str__(self, *args, **kwargs):
         return "CmdSampleISO8601:{zones:%s, oad:%s, format:%s, no_time:%s, timezone:%s, utc:%s, iso:%s, " \
-               "skip_malformed:%s, verbose:%s, datetime_paths:%s}" % \
+               "skip_malformed:%s, flush:%s, verbose:%s, datetime_paths:%s}" % \
                (self.zones, self.oad, self.format, self.no_time, self.timezone, self.utc, self.iso,
-                self.skip_malformed, self.verbose, self.datetime_paths())
+                self.skip_malformed, self.flush, self.verbose, self.datetime_paths())
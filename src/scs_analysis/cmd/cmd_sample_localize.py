@@ -20,7 +20,8 @@ class CmdSampleLocalize(object):
         """
         Constructor
         """
-        self.__parser = optparse.OptionParser(usage="%prog { -z | -t TIMEZONE_NAME [-i ISO_PATH] [-v]",
+        self.__parser = optparse.OptionParser(usage="%prog { -z | -t TIMEZONE_NAME [-i ISO_PATH] "
+                                                    "[--flush { line | block | auto }] [-v]",
                                               version=version())
 
         # helper...
@@ -35,6 +36,9 @@ class CmdSampleLocalize(object):
                                  help="path for ISO 8601 datetime input (default 'rec')")
 
         # output...
+        self.__parser.add_option("--flush", type="choice", choices=["line", "block", "auto"], action="store",
+                                 default="auto", dest="flush", help="flush output per line, block or auto (default)")
+
         self.__parser.add_option("--verbose", "-v", action="store_true", dest="verbose", default=False,
                                  help="report narrative to stderr")
 
@@ -70,6 +74,11 @@ class CmdSampleLocalize(object):
         return self.__opts.iso
 
 
+    @property
+    def flush(self):
+        return self.__opts.flush
+
+
     @property
     def verbose(self):
         return self.__opts.verbose
@@ -82,5 +91,5 @@ class CmdSampleLocalize(object):
 
 
     def __str__(self, *args, **kwargs):
-        return "CmdSampleLocalize:{zones:%s, timezone:%s, iso:%s, verbose:%s}" % \
-               (self.zones, self.timezone, self.iso, self.verbose)
+        return "CmdSampleLocalize:{zones:%s, timezone:%s, iso:%s, flush:%s, verbose:%s}" % \
+               (self.zones, self.timezone, self.iso, self.flush, self.verbose)
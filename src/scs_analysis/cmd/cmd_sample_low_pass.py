@@ -22,7 +22,8 @@ class CmdLowPass(object):
         """
         Constructor
         """
-        self.__parser = optparse.OptionParser(usage="%prog -d DELTA_T -c CUT_OFF [-p PRECISION] [-v] [PATH]",
+        self.__parser = optparse.OptionParser(usage="%prog -d DELTA_T -c CUT_OFF [-p PRECISION] "
+                                                    "[--flush { line | block | auto }] [-v] [PATH]",
                                               version=version())
 
         # compulsory...
@@ -36,6 +37,9 @@ class CmdLowPass(object):
         self.__parser.add_option("--prec", "-p", type="int", action="store", default=None, dest="precision",
                                  help="precision (default 0 decimal places)")
 
+        self.__parser.add_option("--flush", type="choice", choices=["line", "block", "auto"], action="store",
+                                 default="auto", dest="flush", help="flush output per line, block or auto (default)")
+
         self.__parser.add_option("--verbose", "-v", action="store_true", dest="verbose", default=False,
                                  help="report narrative to stderr")
 
@@ -71,6 +75,11 @@ class CmdLowPass(object):
         return self.__opts.precision
 
 
+    @property
+    def flush(self):
+        return self.__opts.flush
+
+
     @property
     def verbose(self):
         return self.__opts.verbose
@@ -88,5 +97,5 @@ class CmdLowPass(object):
 
 
     def __str__(self, *args, **kwargs):
-        return "CmdLowPassFilter:{delta:%s, cut_off:%s, precision:%s, verbose:%s, path:%s}" % \
-               (self.delta, self.cut_off, self.precision, self.verbose, self.path)
+        return "CmdLowPassFilter:{delta:%s, cut_off:%s, precision:%s, flush:%s, verbose:%s, path:%s}" % \
+               (self.delta, self.cut_off, self.precision, self.flush, self.verbose, self.path)
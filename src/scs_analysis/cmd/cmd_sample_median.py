@@ -22,7 +22,8 @@ class CmdSampleMedian(object):
         """
         Constructor
         """
-        self.__parser = optparse.OptionParser(usage="%prog [-w SIZE] [-p PRECISION] [-v] [PATH]",
+        self.__parser = optparse.OptionParser(usage="%prog [-w SIZE] [-p PRECISION] [--flush { line | block | auto }] "
+                                                    "[-v] PATH_1 [.. PATH_N]",
                                               version=version())
 
         # optional...
@@ -33,6 +34,9 @@ class CmdSampleMedian(object):
         self.__parser.add_option("--prec", "-p", type="int", action="store", default=None, dest="precision",
                                  help="precision (default 0 decimal places)")
 
+        self.__parser.add_option("--flush", type="choice", choices=["line", "block", "auto"], action="store",
+                                 default="auto", dest="flush", help="flush output per line, block or auto (default)")
+
         self.__parser.add_option("--verbose", "-v", action="store_true", dest="verbose", default=False,
                                  help="report narrative to stderr")
 
@@ -42,10 +46,10 @@ class CmdSampleMedian(object):
     # ----------------------------------------------------------------------------------------------------------------
 
     def is_valid(self):
-        if self.window is not None and self.window % 2 == 0:
+        if len(self.__args) < 1:
             return False
 
-        if self.__args and len(self.__args) != 1:
+        if self.window is not None and self.window % 2 == 0:
             return False
 
         return True
@@ -63,14 +67,19 @@ class CmdSampleMedian(object):
         return self.__opts.precision
 
 
+    @property
+    def flush(self):
+        return self.__opts.flush
+
+
     @property
     def verbose(self):
         return self.__opts.verbose
 
 
     @property
-    def path(self):
-        return self.__args[0] if len(self.__args) > 0 else None
+    def paths(self):
+        return self.__args
 
 
     # ----------------------------------------------------------------------------------------------------------------
@@ -80,5 +89,5 @@ class CmdSampleMedian(object):
 
 
     def __str__(self, *args, **kwargs):
-        return "CmdSampleMedian:{window:%s, verbose:%s, precision:%s, path:%s}" % \
-               (self.window, self.verbose, self.precision, self.path)
+        return "CmdSampleMedian:{window:%s, flush:%s, verbose:%s, precision:%s, paths:%s}" % \
+               (self.window, self.flush, self.verbose, self.precision, self.paths)
@@ -0,0 +1,88 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+source repo: scs_analysis
+"""
+
+import optparse
+
+from scs_analysis import version
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class CmdSampleMerge(object):
+    """unix command line handler"""
+
+    def __init__(self, args=None):
+        """
+        Constructor
+        """
+        self.__parser = optparse.OptionParser(usage="%prog [-k KEY_PATH] [-s SOURCE_PATH] "
+                                                    "[--flush { line | block | auto }] [-v] "
+                                                    "FILENAME_1 [.. FILENAME_N]", version=version())
+
+        # input...
+        self.__parser.add_option("--key", "-k", type="string", action="store", default="rec", dest="key",
+                                 help="path of the field by which inputs are ordered (default 'rec')")
+
+        # output...
+        self.__parser.add_option("--source", "-s", type="string", action="store", dest="source",
+                                 help="add the name of each document's input file at SOURCE_PATH")
+
+        self.__parser.add_option("--flush", type="choice", choices=["line", "block", "auto"], action="store",
+                                 default="auto", dest="flush", help="flush output per line, block or auto (default)")
+
+        self.__parser.add_option("--verbose", "-v", action="store_true", dest="verbose", default=False,
+                                 help="report narrative to stderr")
+
+        self.__opts, self.__args = self.__parser.parse_args(args=args)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def is_valid(self):
+        if len(self.filenames) < 1:
+            return False
+
+        return True
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def key(self):
+        return self.__opts.key
+
+
+    @property
+    def source(self):
+        return self.__opts.source
+
+
+    @property
+    def flush(self):
+        return self.__opts.flush
+
+
+    @property
+    def verbose(self):
+        return self.__opts.verbose
+
+
+    @property
+    def filenames(self):
+        return self.__args
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def print_help(self, file):
+        self.__parser.print_help(file)
+
+
+    def __str__(self, *args, **kwargs):
+        return "CmdSampleMerge:{key:%s, source:%s, flush:%s, verbose:%s, filenames:%s}" % \
+               (self.key, self.source, self.flush, self.verbose, self.filenames)
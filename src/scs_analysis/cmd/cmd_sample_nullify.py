@@ -21,7 +21,7 @@ class CmdSampleNullify(object):
         Constructor
         """
         self.__parser = optparse.OptionParser(usage="%prog -t TARGET_PATH -s SOURCE_PATH [-l LOWER] [-u UPPER]"
-                                                    " [-v]", version=version())
+                                                    " [--flush { line | block | auto }] [-v]", version=version())
 
         # input...
         self.__parser.add_option("--target", "-t", type="string", action="store", dest="target",
@@ -38,6 +38,9 @@ class CmdSampleNullify(object):
                                  help="upper bound")
 
         # output...
+        self.__parser.add_option("--flush", type="choice", choices=["line", "block", "auto"], action="store",
+                                 default="auto", dest="flush", help="flush output per line, block or auto (default)")
+
         self.__parser.add_option("--verbose", "-v", action="store_true", dest="verbose", default=False,
                                  help="report narrative to stderr")
 
@@ -81,6 +84,11 @@ class CmdSampleNullify(object):
         return self.__opts.upper
 
 
+    @property
+    def flush(self):
+        return self.__opts.flush
+
+
     @property
     def verbose(self):
         return self.__opts.verbose
@@ -93,5 +101,5 @@ class CmdSampleNullify(object):
 
 
     def __str__(self, *args, **kwargs):
-        return "CmdSampleNullify:{target:%s, source:%s, lower:%s, upper:%s, verbose:%s}" % \
-               (self.target, self.source, self.lower, self.upper, self.verbose)
+        return "CmdSampleNullify:{target:%s, source:%s, lower:%s, upper:%s, flush:%s, verbose:%s}" % \
+               (self.target, self.source, self.lower, self.upper, self.flush, self.verbose)
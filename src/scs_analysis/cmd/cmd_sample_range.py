@@ -16,7 +16,7 @@ from scs_analysis import version
 class CmdSampleRange(object):
     """unix command line handler"""
 
-    def __init__(self):
+    def __init__(self, args=None):
         """
         Constructor
         """
@@ -37,7 +37,7 @@ class CmdSampleRange(object):
         self.__parser.add_option("--verbose", "-v", action="store_true", dest="verbose", default=False,
                                  help="report narrative to stderr")
 
-        self.__opts, self.__args = self.__parser.parse_args()
+        self.__opts, self.__args = self.__parser.parse_args(args=args)
 
 
     # ----------------------------------------------------------------------------------------------------------------
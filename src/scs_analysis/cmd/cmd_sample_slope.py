@@ -22,7 +22,8 @@ class CmdSampleSlope(object):
         Constructor
         """
         self.__parser = optparse.OptionParser(usage="%prog -n NAME [-i ISO] [-t TALLY] [-m [DD-]HH:MM[:SS]] [-x] "
-                                                    "[-p PRECISION] [-v] PATH", version=version())
+                                                    "[-p PRECISION] [--flush { line | block | auto }] "
+                                                    "[-v] PATH_1 [.. PATH_N]", version=version())
 
         # identity...
         self.__parser.add_option("--name", "-n", type="string", action="store", dest="name",
@@ -45,6 +46,9 @@ class CmdSampleSlope(object):
         self.__parser.add_option("--prec", "-p", type="int", action="store", default=6, dest="precision",
                                  help="precision (default 6 decimal places)")
 
+        self.__parser.add_option("--flush", type="choice", choices=["line", "block", "auto"], action="store",
+                                 default="auto", dest="flush", help="flush output per line, block or auto (default)")
+
         self.__parser.add_option("--verbose", "-v", action="store_true", dest="verbose", default=False,
                                  help="report narrative to stderr")
 
@@ -60,7 +64,7 @@ class CmdSampleSlope(object):
         if self.tally < 1:
             return False
 
-        if self.path is None:
+        if len(self.paths) < 1:
             return False
 
         return True
@@ -105,14 +109,19 @@ class CmdSampleSlope(object):
         return self.__opts.precision
 
 
+    @property
+    def flush(self):
+        return self.__opts.flush
+
+
     @property
     def verbose(self):
         return self.__opts.verbose
 
 
     @property
-    def path(self):
-        return self.__args[0] if len(self.__args) > 0 else None
+    def paths(self):
+        return self.__args
 
 
     # ----------------------------------------------------------------------------------------------------------------
@@ -122,7 +131,7 @@ class CmdSampleSlope(object):
 
 
     def __str__(self, *args, **kwargs):
-        return "CmdSampleSlope:{name:%s, iso:%s, tally:%s, exclude_incomplete:%s, precision:%s, verbose:%s, " \
-               "path:%s}" % \
-               (self.name, self.iso, self.tally, self.exclude_incomplete, self.precision, self.verbose,
-                self.path)
+        return "CmdSampleSlope:{name:%s, iso:%s, tally:%s, exclude_incomplete:%s, precision:%s, flush:%s, " \
+               "verbose:%s, paths:%s}" % \
+               (self.name, self.iso, self.tally, self.exclude_incomplete, self.precision, self.flush, self.verbose,
+                self.paths)
@@ -16,16 +16,24 @@ from scs_analysis import version
 class CmdSampleSort(object):
     """unix command line handler"""
 
+    DEFAULT_MEMORY = 256                            # MB
+
     def __init__(self):
         """
         Constructor
         """
-        self.__parser = optparse.OptionParser(usage="%prog [-r] [-v] SORT_PATH_1 [...SORT_PATH_N]", version=version())
+        self.__parser = optparse.OptionParser(usage="%prog [-r] [-m MEGABYTES] [-v] SORT_PATH_1 [...SORT_PATH_N]",
+                                              version=version())
 
         # function...
         self.__parser.add_option("--reverse", "-r", action="store_true", dest="reverse", default=False,
                                  help="sort in reverse order")
 
+        self.__parser.add_option("--memory", "-m", type="int", action="store", dest="memory",
+                                 default=self.DEFAULT_MEMORY,
+                                 help="memory budget in MB, beyond which sorted runs are spilled to temporary files "
+                                      "(default %s)" % self.DEFAULT_MEMORY)
+
         # output...
         self.__parser.add_option("--verbose", "-v", action="store_true", dest="verbose", default=False,
                                  help="report narrative to stderr")
@@ -39,6 +47,9 @@ class CmdSampleSort(object):
         if len(self.__args) < 1:
             return False
 
+        if self.memory < 1:
+            return False
+
         return True
 
 
@@ -49,6 +60,11 @@ class CmdSampleSort(object):
         return self.__opts.reverse
 
 
+    @property
+    def memory(self):
+        return self.__opts.memory
+
+
     @property
     def verbose(self):
         return self.__opts.verbose
@@ -66,5 +82,5 @@ class CmdSampleSort(object):
 
 
     def __str__(self, *args, **kwargs):
-        return ("CmdSampleSort:{reverse:%s, verbose:%s, sort_paths:%s}" %
-                (self.reverse, self.verbose, self.sort_paths))
+        return ("CmdSampleSort:{reverse:%s, memory:%s, verbose:%s, sort_paths:%s}" %
+                (self.reverse, self.memory, self.verbose, self.sort_paths))
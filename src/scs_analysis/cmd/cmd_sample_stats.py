@@ -20,13 +20,17 @@ class CmdSampleStats(object):
         """
         Constructor
         """
-        self.__parser = optparse.OptionParser(usage="%prog [-t TAG] [-i] [-p PRECISION] [-a] [-r] [-v] "
+        self.__parser = optparse.OptionParser(usage="%prog [-t TAG] [-e] [-i] [-p PRECISION] [-a] [-r] [-v] "
                                                     "PATH_1 [..PATH_N]", version=version())
 
         # input...
         self.__parser.add_option("--tag", "-t", type="string", action="store", default='tag', dest="tag",
                                  help="name of the tag field (default 'tag')")
 
+        # mode...
+        self.__parser.add_option("--exact", "-e", action="store_true", dest="exact", default=False,
+                                 help="hold all values in memory, for an exact median")
+
         # output...
         self.__parser.add_option("--include-tag", "-i", action="store_true", dest="include_tag", default=False,
                                  help="include the device tag")
@@ -62,6 +66,11 @@ class CmdSampleStats(object):
         return self.__opts.tag
 
 
+    @property
+    def exact(self):
+        return self.__opts.exact
+
+
     @property
     def include_tag(self):
         return self.__opts.include_tag
@@ -99,5 +108,7 @@ class CmdSampleStats(object):
 
 
     def __str__(self, *args, **kwargs):
-        return "CmdSampleStats:{tag:%s, include_tag:%s, precision:%s, analytic:%s, rows:%s, verbose:%s, paths:%s}" % \
-               (self.tag, self.include_tag, self.precision, self.analytic, self.rows, self.verbose, self.paths)
+        return "CmdSampleStats:{tag:%s, exact:%s, include_tag:%s, precision:%s, analytic:%s, rows:%s, verbose:%s, " \
+               "paths:%s}" % \
+               (self.tag, self.exact, self.include_tag, self.precision, self.analytic, self.rows, self.verbose,
+                self.paths)
@@ -24,7 +24,8 @@ class CmdSampleSubset(object):
         Constructor
         """
         self.__parser = optparse.OptionParser(usage="%prog { -i | -n | -s } { [-e EQUAL] | [-l LOWER] [-u UPPER] } "
-                                                    "[-t] [-x] [-v] PATH", version=version())
+                                                    "[-t] [-x] [--flush { line | block | auto }] "
+                                                    "[-v] PATH", version=version())
 
         # casting...
         self.__parser.add_option("--iso8601", "-i", action="store_true", dest="iso8601", default=False,
@@ -53,6 +54,9 @@ class CmdSampleSubset(object):
         self.__parser.add_option("--exclusions", "-x", action="store_true", dest="exclusions", default=False,
                                  help="output exclusions instead of inclusions")
 
+        self.__parser.add_option("--flush", type="choice", choices=["line", "block", "auto"], action="store",
+                                 default="auto", dest="flush", help="flush output per line, block or auto (default)")
+
         self.__parser.add_option("--verbose", "-v", action="store_true", dest="verbose", default=False,
                                  help="report narrative to stderr")
 
@@ -132,6 +136,11 @@ class CmdSampleSubset(object):
         return self.__cast(self.__opts.upper)
 
 
+    @property
+    def flush(self):
+        return self.__opts.flush
+
+
     @property
     def verbose(self):
         return self.__opts.verbose
@@ -172,6 +181,6 @@ class CmdSampleSubset(object):
 
     def __str__(self, *args, **kwargs):
         return "CmdSampleSubset:{iso8601:%s, numeric:%s, string:%s, equal:%s, lower:%s, upper:%s, " \
-               "strict:%s, exclusions:%s, verbose:%s, path:%s}" % \
+               "strict:%s, exclusions:%s, flush:%s, verbose:%s, path:%s}" % \
                (self.iso8601, self.numeric, self.string, self.__opts.equal, self.__opts.lower, self.__opts.upper,
-                self.strict, self.exclusions, self.verbose, self.path)
+                self.strict, self.exclusions, self.flush, self.verbose, self.path)
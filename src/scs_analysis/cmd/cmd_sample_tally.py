@@ -20,7 +20,8 @@ class CmdSampleTally(object):
         """
         Constructor
         """
-        self.__parser = optparse.OptionParser(usage="%prog [-t TALLY] [-p PRECISION] [-v] [PATH]", version=version())
+        self.__parser = optparse.OptionParser(usage="%prog [-t TALLY] [-p PRECISION] [--flush { line | block | auto }] "
+                                                    "[-v] [PATH]", version=version())
 
         # mode...
         self.__parser.add_option("--tally", "-t", type="int", action="store", dest="tally",
@@ -30,6 +31,9 @@ class CmdSampleTally(object):
         self.__parser.add_option("--prec", "-p", type="int", action="store", default=None, dest="precision",
                                  help="precision (default 0 decimal places)")
 
+        self.__parser.add_option("--flush", type="choice", choices=["line", "block", "auto"], action="store",
+                                 default="auto", dest="flush", help="flush output per line, block or auto (default)")
+
         self.__parser.add_option("--verbose", "-v", action="store_true", dest="verbose", default=False,
                                  help="report narrative to stderr")
 
@@ -60,6 +64,11 @@ class CmdSampleTally(object):
         return self.__opts.precision
 
 
+    @property
+    def flush(self):
+        return self.__opts.flush
+
+
     @property
     def verbose(self):
         return self.__opts.verbose
@@ -77,5 +86,5 @@ class CmdSampleTally(object):
 
 
     def __str__(self, *args, **kwargs):
-        return "CmdSampleTally:{tally:%s, precision:%s, verbose:%s, path:%s}" % \
-                    (self.tally, self.precision, self.verbose, self.path)
+        return "CmdSampleTally:{tally:%s, precision:%s, flush:%s, verbose:%s, path:%s}" % \
+                    (self.tally, self.precision, self.flush, self.verbose, self.path)
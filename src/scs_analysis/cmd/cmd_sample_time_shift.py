@@ -23,7 +23,8 @@ class CmdSampleTimeShift(object):
         """
         Constructor
         """
-        self.__parser = optparse.OptionParser(usage="%prog -t { + | - } [[DD-]HH:]MM[:SS] [-v] [PATH]",
+        self.__parser = optparse.OptionParser(usage="%prog -t { + | - } [[DD-]HH:]MM[:SS] "
+                                                    "[--flush { line | block | auto }] [-v] [PATH]",
                                               version=version())
 
         # operation...
@@ -31,6 +32,9 @@ class CmdSampleTimeShift(object):
                                  help="sign and offset in days / hours / minutes / seconds")
 
         # output...
+        self.__parser.add_option("--flush", type="choice", choices=["line", "block", "auto"], action="store",
+                                 default="auto", dest="flush", help="flush output per line, block or auto (default)")
+
         self.__parser.add_option("--verbose", "-v", action="store_true", dest="verbose", default=False,
                                  help="report narrative to stderr")
 
@@ -74,6 +78,11 @@ class CmdSampleTimeShift(object):
         return Timedelta.construct_from_flag(self.__opts.timedelta[1])
 
 
+    @property
+    def flush(self):
+        return self.__opts.flush
+
+
     @property
     def verbose(self):
         return self.__opts.verbose
@@ -91,5 +100,5 @@ class CmdSampleTimeShift(object):
 
 
     def __str__(self, *args, **kwargs):
-        return "CmdSampleTimeShift:{timedelta:%s, verbose:%s, path:%s}" % \
-               (self.__opts.timedelta, self.verbose, self.path)
+        return "CmdSampleTimeShift:{timedelta:%s, flush:%s, verbose:%s, path:%s}" % \
+               (self.__opts.timedelta, self.flush, self.verbose, self.path)
@@ -81,6 +81,8 @@ import sys
 
 from scs_analysis.cmd.cmd_cognito_users import CmdCognitoUsers
 
+from scs_analysis.handler.cognito_session_cache import CognitoSessionCache
+
 from scs_core.aws.security.cognito_client_credentials import CognitoClientCredentials
 from scs_core.aws.security.cognito_login_manager import CognitoLoginManager
 from scs_core.aws.security.cognito_membership import CognitoMembership
@@ -141,7 +143,7 @@ if __name__ == '__main__':
                 exit(1)
 
             gatekeeper = CognitoLoginManager()
-            auth = gatekeeper.user_login(credentials)
+            auth = CognitoSessionCache.user_login(Host, credentials, gatekeeper=gatekeeper)
 
             if not auth.is_ok():
                 logger.error("login: %s." % auth.authentication_status.description)
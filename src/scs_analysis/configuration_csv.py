@@ -35,19 +35,26 @@ be included in the CSV file)
 
 For diff-histories and full-histories modes, a single rec value is included, equivalent to rec.update.
 
+In the history modes, up to --jobs device histories are downloaded concurrently. Files are written in device tag
+order. If the --incremental flag is set, the latest configuration of each device is downloaded first. A history is then
+downloaded only if the device's rec.update has changed since its CSV file was written by a previous incremental run,
+or if the file is missing. The rec.update values are recorded in the file .configuration_csv_state.json, in the output
+directory. This state is discarded if the mode or nodes differ from those of the previous run.
+
 Output CSV cell values are always wrapped in quotes ('"').
 
 The --credentials flag is only required where the user wishes to store multiple identities. Setting the credentials
 is done interactively using the command line interface.
 
 SYNOPSIS
-configuration_csv.py [-c CREDENTIALS] { -n | -s | -l OUTPUT_CSV | { -d | -f } [-o OUTPUT_CSV_DIR] }
+configuration_csv.py [-c CREDENTIALS] { -n | -s | -l OUTPUT_CSV | { -d | -f } [-i] [-j JOBS] [-o OUTPUT_CSV_DIR] }
 [-t DEVICE_TAG [-x]] [-v] [NODE_1..NODE_N]
 
 EXAMPLES
 configuration_csv.py -vs configs.csv
 configuration_csv.py -vdo afe_ids afe-id
 configuration_csv.py -vft scs-bgx-431
+configuration_csv.py -vdi -j 8 -o afe_ids afe-id
 
 SEE ALSO
 scs_analysis/cognito_user_credentials
@@ -60,9 +67,13 @@ scs_mfr/configuration
 import os
 import sys
 
+from concurrent.futures import ThreadPoolExecutor
+
 from scs_analysis.cmd.cmd_configuration_csv import CmdConfigurationCSV
 from scs_analysis.handler.batch_download_reporter import BatchDownloadReporter
+from scs_analysis.handler.cognito_session_cache import CognitoSessionCache
 from scs_analysis.handler.configuration_csv_generator import ConfigurationCSVGenerator
+from scs_analysis.handler.configuration_csv_state import ConfigurationCSVState
 
 from scs_core.aws.manager.configuration.configuration_finder import ConfigurationFinder
 from scs_core.aws.manager.configuration.configuration_intercourse import ConfigurationRequest
@@ -71,7 +82,6 @@ from scs_core.aws.manager.configuration.configuration_check_finder import Config
 from scs_core.aws.manager.configuration.configuration_check_intercourse import ConfigurationCheckRequest
 
 from scs_core.aws.security.cognito_client_credentials import CognitoClientCredentials
-from scs_core.aws.security.cognito_login_manager import CognitoLoginManager
 
 from scs_core.client.http_exception import HTTPException
 
@@ -85,6 +95,18 @@ from scs_core.sys.logging import Logging
 from scs_host.sys.host import Host
 
 
+# --------------------------------------------------------------------------------------------------------------------
+
+def history_path(device_tag):
+    filename = device_tag + '-configs.csv'
+
+    return filename if cmd.output_csv_dir is None else os.path.join(cmd.output_csv_dir, filename)
+
+
+def find_history(device_tag):
+    return sorted(history_finder.find(auth.id_token, device_tag, True, cmd.request_mode()))
+
+
 # --------------------------------------------------------------------------------------------------------------------
 
 if __name__ == '__main__':
@@ -124,8 +146,7 @@ if __name__ == '__main__':
         if not credentials:
             exit(1)
 
-        gatekeeper = CognitoLoginManager()
-        auth = gatekeeper.user_login(credentials)
+        auth = CognitoSessionCache.user_login(Host, credentials)
 
         if not auth.is_ok():
             logger.error("login: %s." % auth.authentication_status.description)
@@ -142,6 +163,7 @@ if __name__ == '__main__':
         # ConfigurationFinder...
         configuration_finder = ConfigurationFinder(reporter=BatchDownloadReporter('configurations'))
         check_finder = ConfigurationCheckFinder()
+        history_finder = ConfigurationFinder()                  # no reporter - histories are found concurrently
 
         # ConfigurationCSVGenerator...
         csv_generator = ConfigurationCSVGenerator(cmd.verbose)
@@ -175,21 +197,43 @@ if __name__ == '__main__':
             if cmd.output_csv_dir is not None:
                 Filesystem.mkdir(cmd.output_csv_dir)
 
-            logger.info("retrieving device tags...")
-            tag_response = configuration_finder.find(auth.id_token, cmd.device_tag, cmd.exact_match,
-                                                     ConfigurationRequest.Mode.TAGS_ONLY)
+            if cmd.incremental:
+                state = ConfigurationCSVState.load(cmd.output_csv_dir, cmd.request_mode(), cmd.nodes)
+                logger.info(state)
 
-            for tag in sorted(tag_response):
-                filename = tag + '-configs.csv'
-                path = filename if cmd.output_csv_dir is None else os.path.join(cmd.output_csv_dir, filename)
+                logger.info("retrieving latest configurations...")
+                response = configuration_finder.find(auth.id_token, cmd.device_tag, cmd.exact_match,
+                                                     ConfigurationRequest.Mode.LATEST)
+                updates = {item.tag: item.rec for item in response}
 
-                logger.info("-")
-                logger.info(path)
+                tags = [tag for tag in sorted(updates) if not state.is_current(tag, updates[tag], history_path(tag))]
+                logger.info("changed: %d unchanged: %d" % (len(tags), len(updates) - len(tags)))
+
+            else:
+                state = None
+                updates = None
+
+                logger.info("retrieving device tags...")
+                tag_response = configuration_finder.find(auth.id_token, cmd.device_tag, cmd.exact_match,
+                                                         ConfigurationRequest.Mode.TAGS_ONLY)
+                tags = sorted(tag_response)
+
+            executor = ThreadPoolExecutor(max_workers=cmd.jobs)
+
+            try:
+                for tag, configs in zip(tags, executor.map(find_history, tags)):       # in tag order
+                    path = history_path(tag)
+
+                    logger.info("-")
+                    logger.info(path)
+
+                    csv_generator.generate(configs, cmd.nodes, path, sortable=True)
 
-                response = configuration_finder.find(auth.id_token, tag, True, cmd.request_mode())
-                configs = sorted(response)
+                    if state is not None:
+                        state.record(tag, updates[tag])
 
-                csv_generator.generate(configs, cmd.nodes, path, sortable=True)
+            finally:
+                executor.shutdown(wait=False, cancel_futures=True)
 
 
     # ----------------------------------------------------------------------------------------------------------------
@@ -23,15 +23,29 @@ useful where data sets use alternate datetime formats such as 2019-02-22T01:00:0
 
 If the --verbose flag is used, a summary of the join operation is written to stderr.
 
+If the --sorted flag is used, the files are read together, and joined on a single pass. In this case, each file must
+already be in the order of its primary key, and memory use does not grow with the size of the files. The --nearest
+flag may then be used with ISO 8601 primary keys: each row is matched to the row of the other file with the nearest
+datetime within the given interval. The anchor file is the right file for RIGHT joins, otherwise the left. Rows of
+the other file may be matched more than once, and - for FULL joins - rows of the right file that are not matched are
+also output.
+
+If the --indexed flag is used, the files may be in any order. Only the smaller file is held in memory - the larger
+file is streamed against it, and output is in the order of the larger file. Rows of the larger file that share a
+primary key are each joined, rather than being collapsed. The --nearest flag may also be used in this mode - here, the
+file that is not the anchor is always the one held in memory.
+
 Warning: if LEFT, RIGHT or FULL joins are used, the first document written to stdout may not contain all of the fields
 of the input CSV pair. In these cases, if the output is piped to the csv_writer utility, then the csv_writer must be
 used in header-scan mode.
 
 SYNOPSIS
-csv_join.py [-t TYPE] -l PREFIX PK FILENAME -r PREFIX PK FILENAME [-i] [-v]
+csv_join.py [-t TYPE] [-i] [{ -s | -x } [-n INTERVAL]] [-v] -l PREFIX PK FILENAME -r PREFIX PK FILENAME
 
 EXAMPLES
 csv_join.py -i -v -l praxis rec praxis_301/praxis_301_2018-08.csv -r ref rec ref/ref_2018-08.csv
+csv_join.py -i -s -n :30 -t LEFT -l praxis rec praxis_301/praxis_301_2018.csv -r ref rec ref/ref_2018.csv
+csv_join.py -i -x -n :05 -l praxis rec praxis_301/praxis_301_2018.csv -r ref rec ref/ref_2018-08.csv
 
 DOCUMENT EXAMPLE - INPUT
 left:
@@ -52,9 +66,12 @@ RESOURCES
 https://www.w3schools.com/sql/sql_join.asp
 """
 
+import os
 import sys
 
 from scs_analysis.cmd.cmd_csv_join import CmdCSVJoin
+from scs_analysis.handler.indexed_join import IndexedJoin
+from scs_analysis.handler.streaming_join import StreamingJoin
 
 from scs_core.csv.csv_reader import CSVReader
 
@@ -63,6 +80,35 @@ from scs_core.data.json import JSONify
 from scs_core.data.path_dict import PathDict
 
 
+# --------------------------------------------------------------------------------------------------------------------
+
+def csv_documents(filename, pk):
+    try:
+        csv_reader = CSVReader.construct_for_file(filename)
+    except FileNotFoundError:
+        print("csv_join: file not found: %s" % filename, file=sys.stderr)
+        exit(1)
+
+    try:
+        for csv_row in csv_reader.rows():
+            document = PathDict.construct_from_jstr(csv_row)
+
+            if document is None:
+                continue
+
+            if pk not in document.paths():
+                print("csv_join: pk '%s' missing: %s" % (pk, csv_row.strip()), file=sys.stderr)
+                exit(1)
+
+            if document.node(pk) == '':
+                continue
+
+            yield document
+
+    finally:
+        csv_reader.close()
+
+
 # --------------------------------------------------------------------------------------------------------------------
 
 if __name__ == '__main__':
@@ -91,102 +137,132 @@ if __name__ == '__main__':
         print("csv_join: invalid join type: %s" % cmd.type, file=sys.stderr)
         exit(2)
 
+    if not cmd.is_valid_nearest():
+        print("csv_join: invalid format for nearest interval.", file=sys.stderr)
+        exit(2)
+
     if cmd.verbose:
         print("csv_join: %s" % cmd, file=sys.stderr)
 
+    join = None
+
     try:
         # ------------------------------------------------------------------------------------------------------------
         # resources...
 
-        join = Join.construct(cmd.left_prefix, cmd.left_pk, cmd.right_prefix, cmd.right_pk, cmd.iso8601)
+        tolerance = None if cmd.nearest is None else cmd.nearest.total_seconds()
 
-        # read left CSV file...
-        try:
-            reader = CSVReader.construct_for_file(cmd.left_filename)
-        except FileNotFoundError:
-            print("csv_join: file not found: %s" % cmd.left_filename, file=sys.stderr)
-            exit(1)
+        if cmd.sorted:
+            join = StreamingJoin(cmd.type, cmd.left_prefix, cmd.left_pk, cmd.right_prefix, cmd.right_pk, cmd.iso8601,
+                                 tolerance=tolerance)
 
-        for row in reader.rows():
-            jstr = row.strip()
-            datum = PathDict.construct_from_jstr(row)
-
-            if datum is None:
-                continue
+        elif cmd.indexed:
+            try:
+                left_size = os.path.getsize(cmd.left_filename)
+                right_size = os.path.getsize(cmd.right_filename)
+            except FileNotFoundError as ex:
+                print("csv_join: file not found: %s" % ex.filename, file=sys.stderr)
+                exit(1)
 
-            left_document_count += 1
+            indexed = IndexedJoin.indexed_side(cmd.type, tolerance, left_size, right_size)
 
-            if cmd.left_pk not in datum.paths():
-                print("csv_join: pk '%s' missing: %s" % (cmd.left_pk, jstr), file=sys.stderr)
-                exit(1)
+            join = IndexedJoin(cmd.type, cmd.left_prefix, cmd.left_pk, cmd.right_prefix, cmd.right_pk, cmd.iso8601,
+                               indexed=indexed, tolerance=tolerance)
 
-            if datum.node(cmd.left_pk) == '':
-                continue
+        else:
+            join = Join.construct(cmd.left_prefix, cmd.left_pk, cmd.right_prefix, cmd.right_pk, cmd.iso8601)
 
+            # read left CSV file...
             try:
-                join.append_to_left(datum)
-            except ValueError as ex:
-                print("csv_join: invalid pk '%s' in: %s" % (datum.node(cmd.left_pk), jstr), file=sys.stderr)
+                reader = CSVReader.construct_for_file(cmd.left_filename)
+            except FileNotFoundError:
+                print("csv_join: file not found: %s" % cmd.left_filename, file=sys.stderr)
                 exit(1)
 
-            left_processed_count += 1
+            for row in reader.rows():
+                jstr = row.strip()
+                datum = PathDict.construct_from_jstr(row)
 
-        reader.close()
+                if datum is None:
+                    continue
 
-        # read right CSV file...
-        try:
-            reader = CSVReader.construct_for_file(cmd.right_filename)
-        except FileNotFoundError:
-            print("csv_join: file not found: %s" % cmd.right_filename, file=sys.stderr)
-            exit(1)
+                left_document_count += 1
 
-        for row in reader.rows():
-            jstr = row.strip()
-            datum = PathDict.construct_from_jstr(row)
+                if cmd.left_pk not in datum.paths():
+                    print("csv_join: pk '%s' missing: %s" % (cmd.left_pk, jstr), file=sys.stderr)
+                    exit(1)
 
-            if datum is None:
-                continue
+                if datum.node(cmd.left_pk) == '':
+                    continue
 
-            right_document_count += 1
+                try:
+                    join.append_to_left(datum)
+                except ValueError as ex:
+                    print("csv_join: invalid pk '%s' in: %s" % (datum.node(cmd.left_pk), jstr), file=sys.stderr)
+                    exit(1)
 
-            if cmd.right_pk not in datum.paths():
-                print("csv_join: pk '%s' missing: %s" % (cmd.right_pk, jstr), file=sys.stderr)
-                exit(1)
+                left_processed_count += 1
 
-            if datum.node(cmd.right_pk) == '':
-                continue
+            reader.close()
 
+            # read right CSV file...
             try:
-                join.append_to_right(datum)
-            except (TypeError, ValueError) as ex:
-                print("csv_join: invalid pk '%s' in: %s" % (datum.node(cmd.right_pk), jstr), file=sys.stderr)
+                reader = CSVReader.construct_for_file(cmd.right_filename)
+            except FileNotFoundError:
+                print("csv_join: file not found: %s" % cmd.right_filename, file=sys.stderr)
                 exit(1)
 
-            right_processed_count += 1
+            for row in reader.rows():
+                jstr = row.strip()
+                datum = PathDict.construct_from_jstr(row)
 
-        reader.close()
+                if datum is None:
+                    continue
 
-        if cmd.verbose:
-            print("csv_join: %s" % join, file=sys.stderr)
-            sys.stderr.flush()
+                right_document_count += 1
+
+                if cmd.right_pk not in datum.paths():
+                    print("csv_join: pk '%s' missing: %s" % (cmd.right_pk, jstr), file=sys.stderr)
+                    exit(1)
+
+                if datum.node(cmd.right_pk) == '':
+                    continue
+
+                try:
+                    join.append_to_right(datum)
+                except (TypeError, ValueError) as ex:
+                    print("csv_join: invalid pk '%s' in: %s" % (datum.node(cmd.right_pk), jstr), file=sys.stderr)
+                    exit(1)
+
+                right_processed_count += 1
+
+            reader.close()
+
+            if cmd.verbose:
+                print("csv_join: %s" % join, file=sys.stderr)
+                sys.stderr.flush()
 
 
         # ------------------------------------------------------------------------------------------------------------
         # run...
 
-        if cmd.type == 'LEFT':
-            operation = join.left
+        if cmd.sorted or cmd.indexed:
+            joined = join.join(csv_documents(cmd.left_filename, cmd.left_pk),
+                               csv_documents(cmd.right_filename, cmd.right_pk))
+
+        elif cmd.type == 'LEFT':
+            joined = join.left()
 
         elif cmd.type == 'RIGHT':
-            operation = join.right
+            joined = join.right()
 
         elif cmd.type == 'FULL':
-            operation = join.full
+            joined = join.full()
 
         else:
-            operation = join.inner
+            joined = join.inner()
 
-        for datum in operation():
+        for datum in joined:
             print(JSONify.dumps(datum))
             sys.stdout.flush()
 
@@ -203,11 +279,25 @@ if __name__ == '__main__':
         print("csv_join: %s" % repr(ex), file=sys.stderr)
         exit(1)
 
+    except ValueError as ex:
+        print("csv_join: %s" % ex, file=sys.stderr)
+        exit(1)
+
     finally:
-        if cmd.verbose:
+        if cmd.verbose and (cmd.sorted or cmd.indexed):
+            print("csv_join: %s" % join, file=sys.stderr)
+
+            # documents are counted by the join, once rows without a pk have been skipped...
+            if join is not None:
+                print("csv_join: left: processed: %d" % join.left_count, file=sys.stderr)
+                print("csv_join: right: processed: %d" % join.right_count, file=sys.stderr)
+
+        elif cmd.verbose:
             print("csv_join: left: documents: %d processed: %d" % (left_document_count, left_processed_count),
                   file=sys.stderr)
             print("csv_join: right: documents: %d processed: %d" % (right_document_count, right_processed_count),
                   file=sys.stderr)
+
+        if cmd.verbose:
             print("csv_join: joined: %d" % joined_count,
                   file=sys.stderr)
@@ -21,11 +21,39 @@ By default, output is in the form of a sequence of JSON documents, separated by
 selected, output is in the form of a JSON array - the output opens with a '[' character, documents are separated by
 the ',' character, and the output is terminated by a ']' character.
 
+If the binary (-b) option is selected, output is in the form of compact, columnar binary frames. Binary frames are
+much smaller than JSON, and are read without JSON parsing by node, csv_writer and all of the sample_ utilities, which
+detect the format automatically. As with CSV, empty objects and arrays are not represented in binary frames.
+
+In the --bulk mode, the CSV is read in large chunks, and output is written in blocks rather than document by document.
+Each column is cast to a single type - integer, float, boolean or string - inferred from the first 1000 rows of the
+file. As in the default mode, a value such as 42 in a float column is output as 42. Where a chunk contains a value that
+does not conform to the type of its column, the values in that column are cast individually, as in the default mode. The
+bulk mode is much faster than the default mode for large files, but is not suitable for following a growing file.
+
+If the --jobs option is greater than one, then files are parsed concurrently, in a pool of JOBS processes. By default,
+documents are output in the order of the files, as if the files had been read one after another. If the --merge
+option is used, then the documents of all the files are interleaved, in order of the ISO 8601 datetime field at the
+given path - each file must already be in datetime order. In either case, parsed files are spooled to temporary files,
+so memory use does not grow with the number of files. Concurrent parsing is not available for stdin.
+
+The --limit option applies to each file, whether files are read one after another or concurrently. It may not be
+used with the --merge option.
+
+Output is flushed after every document where stdout is a terminal or a socket. Otherwise, output is buffered, and is
+written in blocks of 64 kB, or when output has been held for one second. The --flush option may be used to override
+this behaviour.
+
 SYNOPSIS
-csv_reader.py [-s] [-n] [-l LIMIT] [-a] [-v] [FILENAME_1 ... FILENAME_N]
+csv_reader.py [-s] [-n] [-k] [-j JOBS [-m ISO_PATH]] [-l LIMIT] [{ -a | -b }] [--flush { line | block | auto }]
+[-v] [FILENAME_1 ... FILENAME_N]
 
 EXAMPLES
 csv_reader.py -v scs-ph1-10-status-2019-07-*.csv
+csv_reader.py -b gases.csv | sample_aggregate.py -p '**:/1:00'
+csv_reader.py -k -n ref-2023.csv | sample_stats.py val.NO2.cnc
+csv_reader.py -v -j 16 scs-ph1-10-status-2019-07-*.csv
+csv_reader.py -v -j 8 -m rec praxis-*-gases-2023-12.csv | sample_aggregate.py -g tag -p '**:00:00'
 
 DOCUMENT EXAMPLE - INPUT
 tag,rec,val.hmd,val.tmp
@@ -51,10 +79,17 @@ https://jsonlines.org
 import sys
 
 from scs_analysis.cmd.cmd_csv_reader import CmdCSVReader
+from scs_analysis.handler.binary_frame import BinaryFrameWriter
+from scs_analysis.handler.csv_bulk_reader import CSVBulkReader
+from scs_analysis.handler.csv_parallel_reader import CSVParallelReader, CSVParallelReaderError
+from scs_analysis.handler.flush_policy import FlushPolicy
 
 from scs_core.csv.csv_reader import CSVReader, CSVReaderException
 from scs_core.csv.csv_dict import CSVHeaderError
 
+from scs_core.data.json import JSONify
+from scs_core.data.path_dict import PathDict
+
 from scs_core.sys.logging import Logging
 
 
@@ -66,84 +101,171 @@ if __name__ == '__main__':
     total_rows = 0
 
     reader = None
+    frame_writer = None
 
     # ----------------------------------------------------------------------------------------------------------------
     # cmd...
 
     cmd = CmdCSVReader()
 
+    if not cmd.is_valid():
+        cmd.print_help(sys.stderr)
+        exit(2)
+
     Logging.config('csv_reader', verbose=cmd.verbose)
     logger = Logging.getLogger()
 
     logger.info(cmd)
 
+    flush_policy = FlushPolicy.construct(cmd.flush)
+    logger.info(flush_policy)
+
     if cmd.array:
         print('[', end='')
 
-    try:
-        for filename in cmd.filenames:
+    if cmd.binary:
+        frame_writer = BinaryFrameWriter()
 
-            file_count += 1
-            rows = 0
+    encoder = JSONify(ensure_ascii=False)
+
+    try:
+        # ------------------------------------------------------------------------------------------------------------
+        # concurrent...
 
-            # --------------------------------------------------------------------------------------------------------
-            # resources...
+        if cmd.jobs > 1:
+            reader = CSVParallelReader(cmd.filenames, cmd.jobs, cast=cmd.cast, nullify=cmd.nullify, bulk=cmd.bulk,
+                                       merge_path=cmd.merge, limit=cmd.limit)
+            logger.info(reader)
 
             try:
-                reader = CSVReader.construct_for_file(filename, cast=cmd.cast, nullify=cmd.nullify)
+                for jstr in reader.jstrs():
+                    if frame_writer:
+                        frame_writer.write(PathDict.construct_from_jstr(jstr))
 
-            except FileNotFoundError:
-                logger.error("file not found: '%s'." % filename)
-                exit(1)
+                    elif cmd.array:
+                        print(jstr if total_rows == 0 else ", %s" % jstr, end='')
 
-            except KeyError as ex:
-                logger.error("empty header cell in: %s." % ex)
-                exit(1)
+                    else:
+                        print(jstr)
+
+                    flush_policy.flush()
+
+                    total_rows += 1
 
-            except ValueError as ex:
-                logger.error("duplicate column names in: %s." % ex)
+            except CSVParallelReaderError as ex:
+                logger.error(ex)
                 exit(1)
 
-            logger.info(reader)
+            finally:
+                for note in reader.notes:
+                    logger.info(note)
 
+            file_count = len(reader.file_rows)
 
-            # --------------------------------------------------------------------------------------------------------
-            # run...
+            for filename, rows in reader.file_rows.items():
+                logger.info("%s: rows: %d" % (filename, rows))
 
-            try:
-                for datum in reader.rows():
-                    if cmd.limit is not None and rows >= cmd.limit:
-                        break
+        # ------------------------------------------------------------------------------------------------------------
+        # sequential...
 
-                    if cmd.array:
-                        if rows == 0:
-                            print(datum, end='')
+        else:
+            for filename in cmd.filenames:
 
-                        else:
-                            print(", %s" % datum, end='')
+                file_count += 1
+                rows = 0
 
+                # ------------------------------------------------------------------------------------------------------
+                # resources...
+
+                try:
+                    if cmd.bulk:
+                        reader = CSVBulkReader.construct_for_file(filename, cast=cmd.cast, nullify=cmd.nullify)
                     else:
-                        print(datum)
+                        reader = CSVReader.construct_for_file(filename, cast=cmd.cast, nullify=cmd.nullify)
 
-                    sys.stdout.flush()
+                except FileNotFoundError:
+                    logger.error("file not found: '%s'." % filename)
+                    exit(1)
 
-                    rows += 1
+                except KeyError as ex:
+                    logger.error("empty header cell in: %s." % ex)
+                    exit(1)
 
-            except CSVHeaderError as ex:
-                logger.error("clashing column names: '%s' and '%s'" % (ex.left, ex.right))
-                exit(1)
+                except ValueError as ex:
+                    logger.error("duplicate column names in: %s." % ex)
+                    exit(1)
 
-            except CSVReaderException as ex:
-                logger.info("ending file on row %d: %s" % (rows, ex))
-                continue
+                except CSVHeaderError as ex:
+                    logger.error("clashing column names: '%s' and '%s'" % (ex.left, ex.right))
+                    exit(1)
 
-            finally:
-                if reader is not None:
-                    reader.close()
+                logger.info(reader)
+
+
+                # ------------------------------------------------------------------------------------------------------
+                # run...
+
+                try:
+                    if cmd.bulk:
+                        for frame in reader.frames(limit=cmd.limit):
+                            if frame_writer:
+                                frame_writer.write_frame(frame)
+
+                            else:
+                                jstrs = [encoder.encode(node) for node in frame.nodes()]
+
+                                if cmd.array:
+                                    sys.stdout.write((', ' if total_rows or rows else '') + ', '.join(jstrs))
+                                else:
+                                    sys.stdout.write('\n'.join(jstrs) + '\n')
+
+                                flush_policy.flush()
+
+                            rows += len(frame)
+
+                    else:
+                        for datum in reader.rows():
+                            if cmd.limit is not None and rows >= cmd.limit:
+                                break
+
+                            if frame_writer:
+                                frame_writer.write(PathDict.construct_from_jstr(datum))
+                                rows += 1
+                                continue
 
-            logger.info("rows: %d" % rows)
+                            if cmd.array:
+                                if rows == 0:
+                                    print(datum, end='')
 
-            total_rows += rows
+                                else:
+                                    print(", %s" % datum, end='')
+
+                            else:
+                                print(datum)
+
+                            flush_policy.flush()
+
+                            rows += 1
+
+                except CSVHeaderError as ex:
+                    logger.error("clashing column names: '%s' and '%s'" % (ex.left, ex.right))
+                    exit(1)
+
+                except CSVReaderException as ex:
+                    logger.info("ending file on row %d: %s" % (rows, ex))
+                    continue
+
+                except ValueError as ex:
+                    logger.error(ex)
+                    exit(1)
+
+                finally:
+                    if reader is not None:
+                        reader.close()
+
+                logger.info("rows: %d" % rows)
+
+                total_rows += rows
 
 
     # ----------------------------------------------------------------------------------------------------------------
@@ -156,5 +278,8 @@ if __name__ == '__main__':
         if cmd.array:
             print(']')
 
+        if frame_writer:
+            frame_writer.close()
+
         if file_count > 1:
             logger.info("files: %d total rows: %d" % (file_count, total_rows))
@@ -27,10 +27,14 @@ header-scan mode:
 
 All input documents are scanned in order to build an inclusive hearer row. Any documents that do not contain a header
 fields are given a null value for that field. Any values bound to paths that become internal nodes are discarded.
-Warning: the header-scan mode requires memory proportional to the size of its input.
+Documents are spooled to a temporary file while the header row is built, so the header-scan mode requires disk space,
+but not memory, proportional to the size of its input.
+
+Input may be either JSON documents or binary frames, as produced by csv_reader or node - the format is detected
+automatically.
 
 SYNOPSIS
-csv_writer.py [{ -a | -x | -s }] [-l LIMIT] [-q] [-e] [-v] [FILENAME]
+csv_writer.py [{ -a | -x | -s }] [-l LIMIT] [-q] [-e] [--flush { line | block | auto }] [-v] [FILENAME]
 
 EXAMPLES
 socket_receiver.py | csv_writer.py temp.csv -e
@@ -54,6 +58,9 @@ import os
 import sys
 
 from scs_analysis.cmd.cmd_csv_writer import CmdCSVWriter
+from scs_analysis.handler.csv_header_scan_writer import CSVHeaderScanWriter
+from scs_analysis.handler.document_reader import DocumentReader
+from scs_analysis.handler.flush_policy import FlushPolicy
 
 from scs_core.csv.csv_writer import CSVWriter
 
@@ -84,6 +91,9 @@ if __name__ == '__main__':
 
     logger.info(cmd)
 
+    flush_policy = FlushPolicy.construct(cmd.flush)
+    logger.info(flush_policy)
+
     try:
         # ------------------------------------------------------------------------------------------------------------
         # resources...
@@ -93,8 +103,11 @@ if __name__ == '__main__':
         else:
             append = cmd.append
 
-        writer = CSVWriter(filename=cmd.filename, append=append, exclude_header=cmd.exclude_header,
-                           header_scan=cmd.header_scan, quote_all=cmd.quote_all)
+        if cmd.header_scan:
+            writer = CSVHeaderScanWriter(filename=cmd.filename, append=append, quote_all=cmd.quote_all)
+        else:
+            writer = CSVWriter(filename=cmd.filename, append=append, exclude_header=cmd.exclude_header,
+                               quote_all=cmd.quote_all)
 
         logger.info(writer)
 
@@ -102,12 +115,10 @@ if __name__ == '__main__':
         # ------------------------------------------------------------------------------------------------------------
         # run...
 
-        for line in sys.stdin:
+        for jstr in DocumentReader.jstrs():
             if cmd.limit is not None and processed_count >= cmd.limit:
                 continue
 
-            jstr = line.strip()
-
             document_count += 1
 
             if not writer.write(jstr):
@@ -116,7 +127,7 @@ if __name__ == '__main__':
             # echo...
             if cmd.echo:
                 print(jstr)
-                sys.stdout.flush()
+                flush_policy.flush()
 
             processed_count += 1
 
@@ -24,15 +24,32 @@ message. Typically, message tokens are presented on the command line wrapped in
 A maximum of 30 seconds is available for the device to respond to the published message. After this time, the
 device_controller utility will terminate.
 
+In the --batch mode, device commands are read from stdin, as JSON documents of the form {"device": DEVICE_TAG,
+"message": CMD_TOKENS}. As in the batch message mode, a message may hold several commands separated by semicolons, which
+are sent as separate messages. Commands for the same device are sent one at a time, in the order in which they are read.
+Commands for different devices are sent concurrently, up to the number of devices specified by the --jobs flag. A JSON
+document is written to stdout as each command completes, giving the index of its message in the input, the device, the
+message and either the device's response or an error. The batch continues if a command fails.
+
 The --credentials flag is only required where the user wishes to store multiple identities. Setting the credentials
 is done interactively using the command line interface.
 
 SYNOPSIS
-device_controller.py [-c CREDENTIALS] -t DEVICE_TAG { [-s] -m CMD_TOKENS | [-w] [-i INDENT] } [-v]
+device_controller.py [-c CREDENTIALS] { -t DEVICE_TAG { [-s] -m CMD_TOKENS | [-w] [-i INDENT] } |
+-b [-j JOBS] [-w] } [-v]
 
 EXAMPLES
 device_controller.py -c super -t scs-be2-3 -s -m "vcal_baseline -i4; gas_baseline"
 
+device_controller.py -c super -b -j 16 < fleet_commands.jsonl
+
+DOCUMENT EXAMPLE - BATCH INPUT
+{"device": "scs-be2-3", "message": "vcal_baseline -i4"}
+
+DOCUMENT EXAMPLE - BATCH OUTPUT
+{"index": 0, "device": "scs-be2-3", "message": "vcal_baseline -i4", "response": {"cmd": "vcal_baseline",
+"params": ["-i4"], "stdout": ["..."], "stderr": [], "ret": 0}}
+
 SEE ALSO
 scs_analysis/cognito_user_credentials
 
@@ -46,9 +63,16 @@ https://stackoverflow.com/questions/58479686/permissionerror-errno-1-operation-n
 import json
 import os
 import sys
+import time
+
+from threading import Lock
 
 from scs_analysis.cmd.cmd_device_controller import CmdDeviceController
 
+from scs_analysis.handler.cognito_session_cache import CognitoSessionCache
+from scs_analysis.handler.device_command_batch import DeviceCommand, DeviceCommandBatch
+from scs_analysis.handler.pooled_device_control_client import PooledDeviceControlClient
+
 from scs_core.aws.client.device_control_client import DeviceControlClient
 from scs_core.aws.security.cognito_client_credentials import CognitoClientCredentials
 from scs_core.aws.security.cognito_login_manager import CognitoLoginManager
@@ -69,6 +93,8 @@ from scs_host.sys.host import Host
 
 EXIT_COMMANDS = ['reboot', 'restart', 'shutdown']
 
+AUTH_CHECK_INTERVAL = 300       # seconds - a cached session is renewed well before it expires
+
 
 # --------------------------------------------------------------------------------------------------------------------
 
@@ -82,6 +108,31 @@ def print_output(command):
         sys.stdout.flush()
 
 
+def device_commands():
+    for index, line in enumerate(sys.stdin):
+        try:
+            command = DeviceCommand.construct_from_jdict(json.loads(line), index=index)
+        except (TypeError, ValueError, AttributeError):
+            command = None
+
+        if command is None:
+            logger.error("invalid command: %s" % line.strip())
+            continue
+
+        yield from command.split()
+
+
+def id_token():
+    global auth, auth_time
+
+    with auth_lock:
+        if time.time() - auth_time > AUTH_CHECK_INTERVAL:
+            auth = CognitoSessionCache.user_login(Host, credentials, gatekeeper=gatekeeper)
+            auth_time = time.time()
+
+        return auth.id_token
+
+
 # --------------------------------------------------------------------------------------------------------------------
 
 if __name__ == '__main__':
@@ -113,33 +164,41 @@ if __name__ == '__main__':
             exit(1)
 
         gatekeeper = CognitoLoginManager()
-        auth = gatekeeper.user_login(credentials)
+        auth = CognitoSessionCache.user_login(Host, credentials, gatekeeper=gatekeeper)
 
         if not auth.is_ok():
             logger.error("login: %s." % auth.authentication_status.description)
             exit(1)
 
+        auth_time = time.time()
+        auth_lock = Lock()
+
 
         # ------------------------------------------------------------------------------------------------------------
         # resources...
 
-        client = DeviceControlClient()
-        manager = OrganisationManager()
+        if cmd.batch:
+            client = PooledDeviceControlClient(pool_size=cmd.jobs)
+            batch = DeviceCommandBatch(client, id_token, max_workers=cmd.jobs, include_wrapper=cmd.wrapper)
 
-        devices = manager.find_devices_by_tag(auth.id_token, cmd.device_tag)
+        else:
+            client = DeviceControlClient()
+            manager = OrganisationManager()
 
-        if not devices:
-            logger.error("the device '%s' cannot be found." % cmd.device_tag)
-            exit(2)
+            devices = manager.find_devices_by_tag(auth.id_token, cmd.device_tag)
 
-        device = devices[-1]
-        logger.info("control topic: %s" % device.control_path)
+            if not devices:
+                logger.error("the device '%s' cannot be found." % cmd.device_tag)
+                exit(2)
+
+            device = devices[-1]
+            logger.info("control topic: %s" % device.control_path)
 
 
         # ------------------------------------------------------------------------------------------------------------
         # StdIO settings...
 
-        if not cmd.message:
+        if not cmd.message and not cmd.batch:
             response = client.interact(auth.id_token, cmd.device_tag, ['?'])
 
             if response.command.stderr:
@@ -155,7 +214,26 @@ if __name__ == '__main__':
         # ------------------------------------------------------------------------------------------------------------
         # run...
 
-        if cmd.message:
+        if cmd.batch:
+            return_code = 0
+
+            for result in batch.run(device_commands()):
+                print(JSONify.dumps(result))
+                sys.stdout.flush()
+
+                if result.error is not None:
+                    logger.error("%s: %s" % (result.command.device_tag, result.error))
+                    return_code = 1
+
+                elif result.return_code != 0:
+                    return_code = result.return_code
+
+            logger.info("commands: %d" % batch.completed)
+            client.close()
+
+            exit(return_code)
+
+        elif cmd.message:
             return_code = 0
             for command in cmd.message.split(';'):
                 logger.info(command)
@@ -181,7 +259,7 @@ if __name__ == '__main__':
                 if not line:
                     continue
 
-                auth = gatekeeper.user_login(credentials)
+                auth = CognitoSessionCache.user_login(Host, credentials, gatekeeper=gatekeeper)
 
                 cmd_tokens = line.strip().split()
                 response = client.interact(auth.id_token, cmd.device_tag, cmd_tokens)
@@ -218,5 +296,5 @@ if __name__ == '__main__':
         exit(1)
 
     finally:
-        if not cmd.message:
+        if not cmd.message and not cmd.batch:
             StdIO.save_history(history_filename)
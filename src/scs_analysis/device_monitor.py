@@ -12,6 +12,9 @@ The device_monitor utility is used to manage the email addresses for alerts asso
 The --credentials flag is only required where the user wishes to store multiple identities. Setting the credentials
 is done interactively using the command line interface.
 
+If a local byline index has been created by aws_byline --index, bylines are taken from the index while it is
+current, rather than from the service.
+
 SYNOPSIS
 device_monitor.py [-c CREDENTIALS] { -F [{ -e EMAIL_ADDR | -t DEVICE_TAG } [-x]] | -A EMAIL_ADDR DEVICE_TAG [-j] |
 -S DEVICE_TAG { 0 | 1 } | -D EMAIL_ADDR [{ -t DEVICE_TAG | -f }] } [-i INDENT] [-v]
@@ -42,12 +45,14 @@ import sys
 
 from scs_analysis.cmd.cmd_device_monitor import CmdDeviceMonitor
 
+from scs_analysis.handler.byline_index import BylineIndex
+from scs_analysis.handler.cognito_session_cache import CognitoSessionCache
+
 from scs_core.aws.manager.byline.byline_finder import BylineFinder
 
 from scs_core.aws.monitor.device.device_monitor_specification_manager import DeviceMonitorSpecificationManager
 
 from scs_core.aws.security.cognito_client_credentials import CognitoClientCredentials
-from scs_core.aws.security.cognito_login_manager import CognitoLoginManager
 
 from scs_core.client.http_exception import HTTPException, HTTPNotFoundException
 
@@ -93,8 +98,7 @@ if __name__ == '__main__':
         if not credentials:
             exit(1)
 
-        gatekeeper = CognitoLoginManager()
-        auth = gatekeeper.user_login(credentials)
+        auth = CognitoSessionCache.user_login(Host, credentials)
 
         if not auth.is_ok():
             logger.error("login: %s." % auth.authentication_status.description)
@@ -117,7 +121,7 @@ if __name__ == '__main__':
         # resources...
 
         manager = DeviceMonitorSpecificationManager()
-        byline_finder = BylineFinder()
+        byline_finder = BylineIndex.construct(Host, BylineFinder())
 
 
         # ------------------------------------------------------------------------------------------------------------
@@ -16,14 +16,21 @@ AAN-803 sources are:
 * CO
 * Ox
 
+Devices are processed in-process, with up to JOBS devices being downloaded and summarised concurrently. Output
+documents are written in the order in which the devices are given on the command line.
+
 The --credentials flag is only required where the user wishes to store multiple identities. Setting the credentials
 is done interactively using the command line interface.
 
+If a local byline index has been created by aws_byline --index, bylines are taken from the index while it is
+current, rather than from the service.
+
 SYNOPSIS
-gas_response_summary.py [-c CREDENTIALS] [-s START] [-e END] [-i INDENT] [-v] DEVICE_TAG_1 [... DEVICE_TAG_N]
+gas_response_summary.py [-c CREDENTIALS] [-s START] [-e END] [-j JOBS] [-i INDENT]
+[--flush { line | block | auto }] [-v] DEVICE_TAG_1 [... DEVICE_TAG_N]
 
 EXAMPLES
-gas_response_summary.py -v -c super scs-bgx-531 scs-bgx-906 scs-bgx-913 | \
+gas_response_summary.py -v -c super -j 8 scs-bgx-531 scs-bgx-906 scs-bgx-913 | \
 csv_writer.py -v -s scs-group-gases-2024-06-21.csv
 
 DOCUMENT EXAMPLE
@@ -42,18 +49,23 @@ scs_analysis/sample_range
 import sys
 
 from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 
 from scs_analysis.cmd.cmd_gas_response_summary import CmdGasResponseSummary
+from scs_analysis.handler.byline_index import BylineIndex
+from scs_analysis.handler.cognito_session_cache import CognitoSessionCache
+from scs_analysis.handler.flush_policy import FlushPolicy
+from scs_analysis.handler.gas_response_summary import GasResponseSummary
 
 from scs_core.aws.manager.byline.byline_finder import BylineFinder
 from scs_core.aws.security.cognito_client_credentials import CognitoClientCredentials
-from scs_core.aws.security.cognito_login_manager import CognitoLoginManager
+
+from scs_core.client.http_exception import HTTPException
 
 from scs_core.data.datetime import LocalizedDatetime
 from scs_core.data.timedelta import Timedelta
 from scs_core.data.json import JSONify
 
-from scs_core.sys.command import Command
 from scs_core.sys.logging import Logging
 
 from scs_host.sys.host import Host
@@ -63,7 +75,6 @@ from scs_host.sys.host import Host
 
 if __name__ == '__main__':
 
-    NON_ML_GASES = ['val.CO.cnc', 'val.CO2.cnc', 'val.Ox.cnc', 'val.VOC.cnc']
     logger = None
 
     try:
@@ -81,6 +92,9 @@ if __name__ == '__main__':
 
         logger.info(cmd)
 
+        flush_policy = FlushPolicy.construct(cmd.flush)
+        logger.info(flush_policy)
+
 
         # ------------------------------------------------------------------------------------------------------------
         # authentication...
@@ -90,8 +104,7 @@ if __name__ == '__main__':
         if not credentials:
             exit(1)
 
-        gatekeeper = CognitoLoginManager()
-        auth = gatekeeper.user_login(credentials)
+        auth = CognitoSessionCache.user_login(Host, credentials)
 
         if not auth.is_ok():
             logger.error("login: %s." % auth.authentication_status.description)
@@ -101,9 +114,7 @@ if __name__ == '__main__':
         # ------------------------------------------------------------------------------------------------------------
         # resources...
 
-        byline_finder = BylineFinder()
-
-        clu = Command(verbose=cmd.verbose)
+        byline_finder = BylineIndex.construct(Host, BylineFinder())
 
 
         # ------------------------------------------------------------------------------------------------------------
@@ -146,22 +157,17 @@ if __name__ == '__main__':
         # ------------------------------------------------------------------------------------------------------------
         # run...
 
-        credentials = ['-c', cmd.credentials_name] if cmd.credentials_name else []
+        summary = GasResponseSummary(auth.id_token, start, end)
+        logger.info(summary)
 
-        for device_tag, topic in device_bylines.items():
-            logger.info("%s..." % device_tag)
+        with ThreadPoolExecutor(max_workers=cmd.jobs) as executor:
+            # map(..) yields results in device order, as each becomes available...
+            for report in executor.map(summary.summarise, device_bylines.keys(), device_bylines.values()):
+                if report is None:
+                    continue
 
-            p = clu.o(['aws_topic_history.py'] + credentials + ['-s', start.as_iso8601(), '-e', end.as_iso8601(),
-                                                                '-p', '**:/1:00', topic])
-
-            p = clu.io(p, ['sample_aggregate.py', '-m'])
-            p = clu.io(p, ['node.py', 'tag.mid', 'rec'] + NON_ML_GASES + ['exg.src.mid', 'exg.val'], no_verbose=True)
-            p = clu.io(p, ['node.py', '-m', 'tag.mid', 'tag'], no_verbose=True)
-            p = clu.io(p, ['node.py', '-m', 'exg.src.mid', 'exg.src'], no_verbose=True)
-            p = clu.io(p, ['sample_range.py', '-u', '.cnc.'])
-
-            print(JSONify.dumps(p.json(), indent=cmd.indent))
-            sys.stdout.flush()
+                print(JSONify.dumps(report, indent=cmd.indent))
+                flush_policy.flush()
 
 
     # ----------------------------------------------------------------------------------------------------------------
@@ -170,6 +176,10 @@ if __name__ == '__main__':
     except KeyboardInterrupt:
         print(file=sys.stderr)
 
+    except HTTPException as ex:
+        logger.error(ex.error_report)
+        exit(1)
+
     except Exception as ex:
         logger.error(ex.__class__.__name__)
         exit(1)
@@ -32,6 +32,9 @@ class BatchDownloadReporter(object):
         self.__document_count = 0
         self.__start_time = time.time()
 
+        self.__hit_count = 0
+        self.__miss_count = 0
+
         self.__logger = Logging.getLogger()
 
 
@@ -61,6 +64,14 @@ class BatchDownloadReporter(object):
                            (name_str, start_str, self.__document_count, interval_str, elapsed))
 
 
+    def hit(self):
+        self.__hit_count += 1
+
+
+    def miss(self):
+        self.__miss_count += 1
+
+
     # ----------------------------------------------------------------------------------------------------------------
 
     @property
@@ -73,8 +84,20 @@ class BatchDownloadReporter(object):
         return self.__block_count
 
 
+    @property
+    def hit_count(self):
+        return self.__hit_count
+
+
+    @property
+    def miss_count(self):
+        return self.__miss_count
+
+
     # ----------------------------------------------------------------------------------------------------------------
 
     def __str__(self, *args, **kwargs):
-        return "BatchDownloadReporter:{name:%d, block_count:%d, document_count:%d, start_time:%d}" % \
-               (self.name, self.block_count, self.__document_count, self.__start_time)
+        return "BatchDownloadReporter:{name:%s, block_count:%d, document_count:%d, start_time:%d, " \
+               "hit_count:%d, miss_count:%d}" % \
+               (self.name, self.block_count, self.__document_count, self.__start_time,
+                self.hit_count, self.miss_count)
@@ -0,0 +1,586 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+source repo: scs_analysis
+
+A compact, columnar binary alternative to JSON lines, for passing large datasets between utilities.
+
+A stream opens with the MAGIC bytes, followed by a sequence of frames. Each frame holds up to FRAME_ROWS documents
+that share the same leaf paths, in the same order - a frame ends when the paths change. A frame is laid out as:
+
+* schema length (uint32) and schema - a JSON object: {"paths": [PATH_1 .. PATH_N], "types": "TT..T"}
+* row count (uint32)
+* for each column: a null mask (one byte per row), then the typed values
+
+Column types are:
+* 'b' - bool, one byte per row
+* 'q' - int64
+* 'f' - float64, followed by an int mask (one byte per row) so that integer values are restored as integers
+* 't' - ISO 8601 datetime: int64 microseconds since the epoch, int16 UTC offset minutes, int8 fraction digits
+* 's' - string: uint32 UTF-8 lengths, followed by the UTF-8 bytes
+* 'j' - any other value, as 's' but JSON-encoded
+
+All numeric values are little-endian. As with CSV, empty objects and empty arrays are not represented.
+
+Where the stream is a regular file, the reader maps it into memory.
+"""
+
+import json
+import mmap
+import os
+import re
+import stat
+import struct
+import sys
+
+from array import array
+from collections import OrderedDict
+from datetime import date as date_type, datetime, timedelta, timezone
+
+from scs_core.data.path_dict import PathDict
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class BinaryFrame(object):
+    """
+    classdocs
+    """
+
+    MAGIC = b'SCSF\x01'
+    FRAME_ROWS = 4096
+
+    __UINT32 = struct.Struct('<I')
+    __JSON = json.JSONEncoder(separators=(',', ':'))
+
+    __EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+    __EPOCH_ORDINAL = __EPOCH.toordinal()
+    __ZULU = 32767                                          # offset sentinel for 'Z'
+    __MAX_FLOAT_INT = 2 ** 53
+    __MAX_INT = 2 ** 63
+
+    __PATH_TOKEN = re.compile(r'([^.:]+)([.:]?)')
+    __ISO_8601 = re.compile(r'(\d{4}-\d{2}-\d{2})T(\d{2}):(\d{2}):(\d{2})(?:\.(\d{1,6}))?(Z|[+-]\d{2}:\d{2})')
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @staticmethod
+    def flatten(node, paths, values, prefix=''):            # appends leaves in PathDict.paths() order
+        if isinstance(node, dict):
+            items = node.items()
+            prefix = prefix + '.' if prefix else ''
+        else:
+            items = enumerate(node)
+            prefix = prefix + ':'
+
+        for key, value in items:
+            if isinstance(value, (dict, list)):
+                BinaryFrame.flatten(value, paths, values, prefix + str(key))
+            else:
+                paths.append(prefix + str(key))
+                values.append(value)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def read(cls, stream):
+        block = stream.read(cls.__UINT32.size)
+
+        if not block:
+            return None
+
+        schema = json.loads(cls.__read_exactly(stream, cls.__UINT32.unpack(block)[0]).decode())
+        rows = cls.__UINT32.unpack(cls.__read_exactly(stream, cls.__UINT32.size))[0]
+
+        columns = [cls.__read_column(stream, column_type, rows) for column_type in schema['types']]
+
+        return cls(schema['paths'], columns, types=schema['types'])
+
+
+    def write(self, stream):
+        schema = json.dumps({'paths': self.paths, 'types': self.types}, separators=(',', ':')).encode()
+
+        stream.write(self.__UINT32.pack(len(schema)))
+        stream.write(schema)
+        stream.write(self.__UINT32.pack(len(self)))
+
+        for index, (column_type, values) in enumerate(zip(self.types, self.__columns)):
+            self.__write_column(stream, column_type, values, fields=self.__fields.get(index))
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def __read_exactly(cls, stream, length):
+        block = stream.read(length)
+
+        if len(block) != length:
+            raise EOFError("truncated frame")
+
+        return block
+
+
+    @classmethod
+    def __read_array(cls, stream, typecode, rows):
+        values = array(typecode)
+        values.frombytes(cls.__read_exactly(stream, values.itemsize * rows))
+
+        if sys.byteorder == 'big':
+            values.byteswap()
+
+        return values.tolist()
+
+
+    @classmethod
+    def __read_column(cls, stream, column_type, rows):
+        nulls = cls.__read_exactly(stream, rows)
+
+        if column_type == 'b':
+            values = [bool(value) for value in cls.__read_exactly(stream, rows)]
+
+        elif column_type == 'q':
+            values = cls.__read_array(stream, 'q', rows)
+
+        elif column_type == 'f':
+            values = cls.__read_array(stream, 'd', rows)
+            ints = cls.__read_exactly(stream, rows)
+
+            if any(ints):
+                values = [int(value) if is_int else value for value, is_int in zip(values, ints)]
+
+        elif column_type == 't':
+            micros = cls.__read_array(stream, 'q', rows)
+            offsets = cls.__read_array(stream, 'h', rows)
+            digits = cls.__read_exactly(stream, rows)
+
+            values = cls.__iso_8601_values(nulls, micros, offsets, digits)
+
+        elif column_type in ('s', 'j'):
+            lengths = cls.__read_array(stream, 'I', rows)
+            blob = cls.__read_exactly(stream, sum(lengths))
+
+            values = []
+            start = 0
+
+            for length in lengths:                          # lengths are of the UTF-8 bytes, not the characters
+                values.append(blob[start:start + length].decode())
+                start += length
+
+            if column_type == 'j':
+                values = [None if is_null else json.loads(value, object_pairs_hook=OrderedDict)
+                          for is_null, value in zip(nulls, values)]
+
+        else:
+            raise ValueError(column_type)
+
+        if any(nulls):
+            values = [None if is_null else value for is_null, value in zip(nulls, values)]
+
+        return values
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def __write_array(cls, stream, typecode, values):
+        values = array(typecode, values)
+
+        if sys.byteorder == 'big':
+            values.byteswap()
+
+        stream.write(values.tobytes())
+
+
+    @classmethod
+    def __write_column(cls, stream, column_type, values, fields=None):
+        stream.write(bytes(value is None for value in values))
+
+        if column_type == 'b':
+            stream.write(bytes(bool(value) for value in values))
+
+        elif column_type == 'q':
+            cls.__write_array(stream, 'q', [0 if value is None else value for value in values])
+
+        elif column_type == 'f':
+            cls.__write_array(stream, 'd', [0.0 if value is None else value for value in values])
+            stream.write(bytes(type(value) is int for value in values))
+
+        elif column_type == 't':
+            fields = cls.__iso_8601_fields(values) if fields is None else fields
+
+            cls.__write_array(stream, 'q', [field[0] for field in fields])
+            cls.__write_array(stream, 'h', [field[1] for field in fields])
+            stream.write(bytes(field[2] for field in fields))
+
+        elif column_type in ('s', 'j'):
+            if column_type == 'j':
+                values = [cls.__JSON.encode(value) for value in values]
+
+            encoded = [b'' if value is None else value.encode() for value in values]
+
+            cls.__write_array(stream, 'I', [len(value) for value in encoded])
+            stream.write(b''.join(encoded))
+
+        else:
+            raise ValueError(column_type)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def __typed(cls, values):                               # returns (column type, ISO 8601 fields or None)
+        present = [value for value in values if value is not None]
+        types = set(map(type, present))
+
+        if not types or types == {float}:
+            return 'f', None
+
+        if types == {bool}:
+            return 'b', None
+
+        if types == {int}:
+            return 'q' if all(-cls.__MAX_INT <= value < cls.__MAX_INT for value in present) else 'j', None
+
+        if types == {int, float}:
+            if all(abs(value) < cls.__MAX_FLOAT_INT for value in present if type(value) is int):
+                return 'f', None
+
+            return 'j', None
+
+        if types == {str}:
+            try:
+                return 't', cls.__iso_8601_fields(values)
+            except ValueError:
+                return 's', None
+
+        return 'j', None
+
+
+    @classmethod
+    def __iso_8601_fields(cls, values):                     # raises ValueError
+        # dates are resolved once per column, times by arithmetic - datetime(..) per row is too slow...
+        days = {}
+        fields = []
+
+        for value in values:
+            if value is None:
+                fields.append((0, 0, 0))
+                continue
+
+            match = cls.__ISO_8601.fullmatch(value)
+
+            if match is None:
+                raise ValueError(value)
+
+            date, hour, minute, second, fraction, zone = match.groups()
+            hour, minute, second = int(hour), int(minute), int(second)
+
+            if hour > 23 or minute > 59 or second > 59:
+                raise ValueError(value)
+
+            if date not in days:
+                days[date] = date_type.fromisoformat(date).toordinal() - cls.__EPOCH_ORDINAL
+
+            if zone == 'Z':
+                offset = cls.__ZULU
+                local_offset = 0
+            else:
+                offset = (int(zone[1:3]) * 60 + int(zone[4:6])) * (-1 if zone[0] == '-' else 1)
+                local_offset = offset
+
+            digits = 0 if fraction is None else len(fraction)
+            microsecond = 0 if fraction is None else int(fraction.ljust(6, '0'))
+
+            seconds = days[date] * 86400 + hour * 3600 + minute * 60 + second - local_offset * 60
+            fields.append((seconds * 1000000 + microsecond, offset, digits))
+
+        return fields
+
+
+    @classmethod
+    def __iso_8601_values(cls, nulls, micros, offsets, digits):
+        # dates and zones are rendered once per column, times by arithmetic - strftime(..) per row is too slow...
+        dates = {}
+        zones = {cls.__ZULU: 'Z'}
+        values = []
+
+        for is_null, micro, offset, digit in zip(nulls, micros, offsets, digits):
+            if is_null:
+                values.append(None)
+                continue
+
+            if offset not in zones:
+                hours, minutes = divmod(abs(offset), 60)
+                zones[offset] = '%s%02d:%02d' % ('-' if offset < 0 else '+', hours, minutes)
+
+            local = micro if offset == cls.__ZULU else micro + offset * 60000000
+            day, time_of_day = divmod(local, 86400000000)
+
+            if day not in dates:
+                dates[day] = (cls.__EPOCH + timedelta(days=day)).strftime('%Y-%m-%dT')
+
+            seconds, fraction = divmod(time_of_day, 1000000)
+            hour, seconds = divmod(seconds, 3600)
+            minute, second = divmod(seconds, 60)
+
+            value = '%s%02d:%02d:%02d' % (dates[day], hour, minute, second)
+
+            if digit:
+                value += ('.%06d' % fraction)[:digit + 1]
+
+            values.append(value + zones[offset])
+
+        return values
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, paths, columns, types=None):
+        """
+        Constructor
+        """
+        self.__paths = list(paths)                          # list of string
+        self.__columns = columns                            # list of list
+        self.__types = types                                # string - inferred from the columns if None
+        self.__fields = {}                                  # dict of int: list of tuple
+
+
+    def __len__(self):
+        return len(self.__columns[0]) if self.__columns else 0
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def nodes(self):                                        # yields OrderedDict
+        construct = self.__constructor(self.paths)
+
+        for row in zip(*self.__columns):
+            yield construct(row)
+
+
+    def documents(self, sort_paths=()):
+        for node in self.nodes():
+            yield PathDict(node, sort_paths=sort_paths)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def __constructor(cls, paths):
+        # all documents in the frame have the same structure, so a document constructor is compiled for the frame...
+        tree = OrderedDict()
+
+        for index, path in enumerate(paths):
+            node = tree
+            tokens = cls.__PATH_TOKEN.findall(path)
+
+            for i, (key, separator) in enumerate(tokens):
+                key = int(key) if i > 0 and tokens[i - 1][1] == ':' else key
+
+                if i == len(tokens) - 1:
+                    node[key] = index
+                else:
+                    node = node.setdefault(key, (OrderedDict(), separator))[0]
+
+        return eval('lambda r: ' + cls.__expression(tree, '.'), {'OrderedDict': OrderedDict})
+
+
+    @classmethod
+    def __expression(cls, node, separator):
+        items = []
+
+        for key, child in node.items():
+            value = 'r[%d]' % child if isinstance(child, int) else cls.__expression(*child)
+            items.append(value if separator == ':' else '(%r, %s)' % (key, value))
+
+        if separator == ':':
+            return '[%s]' % ', '.join(items)
+
+        return 'OrderedDict((%s,))' % ', '.join(items) if items else 'OrderedDict()'
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def paths(self):
+        return self.__paths
+
+
+    @property
+    def types(self):
+        if self.__types is None:
+            typed = [self.__typed(column) for column in self.__columns]
+
+            self.__types = ''.join(column_type for column_type, _ in typed)
+            self.__fields = {index: fields for index, (_, fields) in enumerate(typed) if fields is not None}
+
+        return self.__types
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "BinaryFrame:{paths:%s, types:%s, len:%s}" % (self.paths, self.types, len(self))
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class BinaryFrameWriter(object):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, stream=None, frame_rows=BinaryFrame.FRAME_ROWS):
+        """
+        Constructor
+        """
+        self.__stream = sys.stdout.buffer if stream is None else stream     # binary stream
+        self.__frame_rows = int(frame_rows)                                 # int
+
+        self.__paths = None                                                 # tuple of string
+        self.__rows = []                                                    # list of list
+
+        self.__frame_count = 0                                              # int
+        self.__stream.write(BinaryFrame.MAGIC)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def write(self, datum: PathDict):
+        node = datum.node()
+
+        if not isinstance(node, dict):
+            raise ValueError("binary frames hold JSON objects only: %s" % node)
+
+        paths = []
+        values = []
+
+        BinaryFrame.flatten(node, paths, values)
+
+        if not paths:
+            return                                          # empty documents are not represented
+
+        paths = tuple(paths)
+
+        if paths != self.__paths:
+            self.flush()
+            self.__paths = paths
+
+        self.__rows.append(values)
+
+        if len(self.__rows) >= self.__frame_rows:
+            self.flush()
+
+
+    def write_frame(self, frame: BinaryFrame):
+        self.flush()
+
+        if len(frame):
+            frame.write(self.__stream)
+            self.__frame_count += 1
+
+
+    def flush(self):
+        if self.__rows:
+            columns = [list(column) for column in zip(*self.__rows)]
+
+            BinaryFrame(self.__paths, columns).write(self.__stream)
+
+            self.__rows = []
+            self.__frame_count += 1
+
+        self.__stream.flush()
+
+
+    def close(self):
+        self.flush()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def frame_count(self):
+        return self.__frame_count
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "BinaryFrameWriter:{frame_rows:%s, frame_count:%s}" % (self.__frame_rows, self.frame_count)
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class BinaryFrameReader(object):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def construct(cls, stream):
+        # stream is positioned after the MAGIC bytes - map regular files into memory...
+        try:
+            fileno = stream.fileno()
+
+            if stat.S_ISREG(os.fstat(fileno).st_mode) and os.fstat(fileno).st_size > 0:
+                mapped = mmap.mmap(fileno, 0, access=mmap.ACCESS_READ)
+                mapped.seek(stream.tell())
+
+                return cls(mapped, True)
+
+        except (AttributeError, OSError, ValueError):
+            pass
+
+        return cls(stream, False)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, stream, mapped):
+        """
+        Constructor
+        """
+        self.__stream = stream                              # binary stream or mmap
+        self.__mapped = bool(mapped)                        # bool
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def frames(self):
+        try:
+            while True:
+                frame = BinaryFrame.read(self.__stream)
+
+                if frame is None:
+                    return
+
+                yield frame
+
+        finally:
+            if self.__mapped:
+                self.__stream.close()
+
+
+    def documents(self, sort_paths=()):
+        for frame in self.frames():
+            yield from frame.documents(sort_paths=sort_paths)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def mapped(self):
+        return self.__mapped
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "BinaryFrameReader:{mapped:%s}" % self.mapped
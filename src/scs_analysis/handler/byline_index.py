@@ -0,0 +1,309 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+source repo: scs_analysis
+
+A local index of bylines, held by device, which stands in front of a BylineFinder.
+
+The index is created by an aws_byline --all sweep, which sets its time to live (TTL). Thereafter, device lookups are
+served from the index while the device's entry is younger than the TTL - otherwise, the device is looked up on the
+service, and its entry is replaced. Topic lookups are served from the index while the sweep is younger than the TTL.
+Entries that were indexed without messages do not serve lookups that require them. Where no index has been created,
+all lookups are passed to the finder.
+
+The index is held in a single JSON file, which is replaced atomically on each update. A BylineIndex may be shared by
+threads: access to the index is serialised, but lookups on the service are not.
+
+example document:
+{"ttl": 3600, "swept": "2026-10-18T12:00:00Z", "devices": {"scs-bgx-401": {"updated": "2026-10-18T12:00:00Z",
+"messages": false, "bylines": [{"device": "scs-bgx-401", "topic": "south-coast-science-demo/brighton/loc/1/climate",
+"rec": "2026-10-18T11:59:40Z", "lastSeenTime": "2026-10-18T11:59:45Z"}]}}}
+"""
+
+import json
+import os
+import threading
+
+from collections import OrderedDict
+
+from scs_core.aws.manager.byline.byline import Byline, DeviceBylineGroup
+
+from scs_core.data.datetime import LocalizedDatetime
+from scs_core.data.json import AbstractPersistentJSONable, JSONify
+from scs_core.data.timedelta import Timedelta
+
+from scs_core.sys.filesystem import Filesystem
+from scs_core.sys.logging import Logging
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class BylineIndex(object):
+    """
+    classdocs
+    """
+
+    DEFAULT_TTL = Timedelta(hours=1)
+
+    __FILENAME = 'byline_index.json'
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def construct(cls, host, finder):
+        filename = os.path.join(host.scs_path(), AbstractPersistentJSONable.aws_dir(), cls.__FILENAME)
+
+        return cls(filename, finder)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @staticmethod
+    def byline_jdict(byline):
+        jdict = OrderedDict()
+
+        jdict['device'] = byline.device
+        jdict['topic'] = byline.topic
+        jdict['rec'] = None if byline.rec is None else byline.rec.as_iso8601()
+        jdict['lastSeenTime'] = None if byline.pub is None else byline.pub.as_iso8601()
+
+        if byline.message:
+            jdict['message'] = byline.message
+
+        return jdict
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, filename, finder):
+        """
+        Constructor
+        """
+        self.__filename = filename                                  # string
+        self.__finder = finder                                      # BylineFinder
+
+        self.__index = None                                         # OrderedDict or None (no index)
+        self.__loaded = False                                       # bool
+
+        self.__hits = 0                                             # int
+        self.__misses = 0                                           # int
+
+        self.__lock = threading.RLock()                             # RLock
+
+        self.__logger = Logging.getLogger()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+    # population...
+
+    def populate(self, bylines, include_messages, ttl=DEFAULT_TTL):
+        now = LocalizedDatetime.now().utc().as_iso8601()
+
+        devices = OrderedDict()
+
+        for byline in sorted(bylines):
+            if byline.device not in devices:
+                devices[byline.device] = self.__entry_jdict(now, include_messages, [])
+
+            devices[byline.device]['bylines'].append(self.byline_jdict(byline))
+
+        with self.__lock:
+            self.__index = OrderedDict()
+            self.__index['ttl'] = int(ttl.total_seconds())
+            self.__index['swept'] = now
+            self.__index['devices'] = devices
+
+            self.__loaded = True
+            self.__save()
+
+
+    def update_device(self, device, bylines, include_messages):
+        entry = self.__entry_jdict(LocalizedDatetime.now().utc().as_iso8601(), include_messages,
+                                   [self.byline_jdict(byline) for byline in bylines])
+
+        with self.__lock:
+            if not self.exists():
+                return
+
+            self.__index['devices'][device] = entry
+            self.__save()
+
+
+    def invalidate(self, device=None):
+        with self.__lock:
+            if not self.exists():
+                return
+
+            if device is None:
+                self.__index['swept'] = None
+                self.__index['devices'] = OrderedDict()
+
+            else:
+                self.__index['swept'] = None                        # topic lookups would include the device
+                self.__index['devices'].pop(device, None)
+
+            self.__save()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+    # lookup...
+
+    def find_bylines_for_device(self, token, device, excluded=None, include_messages=True):
+        with self.__lock:
+            entry = self.__device_entry(device, include_messages)
+
+            if entry is not None:
+                self.__hits += 1
+            else:
+                self.__misses += 1
+
+        if entry is not None:
+            bylines = [Byline.construct_from_jdict(jdict) for jdict in entry['bylines']]
+
+            return DeviceBylineGroup.construct(bylines, excluded=excluded)
+
+        group = self.__finder.find_bylines_for_device(token, device, include_messages=include_messages)
+
+        self.update_device(device, group.bylines, include_messages)
+
+        return DeviceBylineGroup.construct(group.bylines, excluded=excluded)
+
+
+    def find_latest_byline_for_topic(self, token, topic, include_messages=True):
+        with self.__lock:
+            if self.__is_swept(include_messages):
+                self.__hits += 1
+                entries = list(self.__index['devices'].values())
+
+            else:
+                self.__misses += 1
+                entries = None
+
+        if entries is None:
+            return self.__finder.find_latest_byline_for_topic(token, topic, include_messages=include_messages)
+
+        latest_byline = None
+
+        for entry in entries:
+            for jdict in entry['bylines']:
+                if jdict.get('topic') != topic:
+                    continue
+
+                byline = Byline.construct_from_jdict(jdict)
+
+                if latest_byline is None or latest_byline.rec < byline.rec:
+                    latest_byline = byline
+
+        return latest_byline
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def exists(self):
+        with self.__lock:
+            self.__load()
+
+            return self.__index is not None
+
+
+    def __device_entry(self, device, include_messages):
+        if not self.exists():
+            return None
+
+        entry = self.__index['devices'].get(device)
+
+        if entry is None or (include_messages and not entry['messages']):
+            return None
+
+        return entry if self.__is_fresh(entry['updated']) else None
+
+
+    def __is_swept(self, include_messages):
+        if not self.exists() or not self.__is_fresh(self.__index['swept']):
+            return False
+
+        if not include_messages:
+            return True
+
+        return all(entry['messages'] for entry in self.__index['devices'].values())
+
+
+    def __is_fresh(self, updated):
+        if updated is None:
+            return False
+
+        updated = LocalizedDatetime.construct_from_iso8601(updated)
+        ttl = Timedelta(seconds=self.__index['ttl'])
+
+        return updated is not None and LocalizedDatetime.now() < updated + ttl
+
+
+    @staticmethod
+    def __entry_jdict(updated, include_messages, bylines):
+        jdict = OrderedDict()
+
+        jdict['updated'] = updated
+        jdict['messages'] = bool(include_messages)
+        jdict['bylines'] = bylines
+
+        return jdict
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __load(self):
+        if self.__loaded:
+            return
+
+        self.__loaded = True
+
+        try:
+            with open(self.__filename) as f:
+                self.__index = json.load(f, object_pairs_hook=OrderedDict)
+
+        except FileNotFoundError:
+            self.__index = None
+
+        except ValueError:
+            self.__logger.warning("byline index is unreadable, and will be ignored: %s" % self.__filename)
+            self.__index = None
+
+
+    def __save(self):
+        Filesystem.mkdir(os.path.dirname(self.__filename))
+        tmp_filename = '%s.%d.tmp' % (self.__filename, os.getpid())
+
+        try:
+            with open(tmp_filename, 'w') as f:
+                f.write(JSONify.dumps(self.__index))
+
+            os.replace(tmp_filename, self.__filename)                           # atomic
+
+        except OSError as ex:
+            self.__logger.warning("byline index could not be saved: %s" % ex)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def filename(self):
+        return self.__filename
+
+
+    @property
+    def hits(self):
+        return self.__hits
+
+
+    @property
+    def misses(self):
+        return self.__misses
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "BylineIndex:{filename:%s, hits:%s, misses:%s}" % \
+               (self.filename, self.hits, self.misses)
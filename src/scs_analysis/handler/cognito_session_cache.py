@@ -0,0 +1,181 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+source repo: scs_analysis
+
+A local cache of Cognito user sessions, shared by successive invocations of the AWS utilities.
+
+Each session is held in a file named for the Cognito credentials, encrypted with the credentials' retrieval password.
+A cached session is reused until less than min_remaining of its lifetime remains, or until the credentials' email
+address changes - a new session is then obtained by a user login, and cached in its place. Cache files that cannot be
+read - for example, because the retrieval password has changed - are ignored, and replaced at the next login.
+Sessions are never cached for credentials without a retrieval password, since they would be held in plain text.
+
+example document:
+{"email": "production@southcoastscience.com", "expiry": "2026-10-18T12:00:00Z",
+"session": {"AccessToken": "...", "ExpiresIn": 3600, "TokenType": "Bearer", "RefreshToken": "...", "IdToken": "..."}}
+"""
+
+import json
+
+from collections import OrderedDict
+from http import HTTPStatus
+
+from scs_core.aws.security.cognito_authentication import AuthenticationResult, AuthenticationStatus, Session
+from scs_core.aws.security.cognito_login_manager import CognitoLoginManager
+
+from scs_core.data.datetime import LocalizedDatetime
+from scs_core.data.json import MultiPersistentJSONable
+from scs_core.data.timedelta import Timedelta
+
+from scs_core.sys.logging import Logging
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class CognitoSessionCache(MultiPersistentJSONable):
+    """
+    classdocs
+    """
+
+    MIN_REMAINING = Timedelta(minutes=20)
+
+    __FILENAME = "cognito_session_cache.json"
+
+    @classmethod
+    def persistence_location(cls, name):
+        filename = cls.__FILENAME if name is None else '_'.join((name, cls.__FILENAME))
+
+        return cls.aws_dir(), filename
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def user_login(cls, manager, credentials, gatekeeper=None, min_remaining=MIN_REMAINING):
+        logger = Logging.getLogger()
+
+        cache = cls.load_for_credentials(manager, credentials)
+
+        if cache is not None and cache.is_current(min_remaining=min_remaining):
+            logger.info("login: using cached session, expiring %s." % cache.expiry.as_iso8601())
+            return cache.authentication
+
+        if gatekeeper is None:
+            gatekeeper = CognitoLoginManager()
+
+        auth = gatekeeper.user_login(credentials)
+
+        if not auth.is_ok() or not credentials.retrieval_password:
+            return auth
+
+        try:
+            cls.construct(credentials, auth.content).save(manager, encryption_key=credentials.retrieval_password)
+        except OSError as ex:
+            logger.warning("login: session could not be cached: %s" % ex)
+
+        return auth
+
+
+    @classmethod
+    def load_for_credentials(cls, manager, credentials):
+        if not credentials.retrieval_password or not cls.exists(manager, name=credentials.name):
+            return None
+
+        dirname, filename = cls.persistence_location(credentials.name)
+
+        # MultiPersistentJSONable.load(..) would impose a security delay on a failed decryption...
+        try:
+            jstr, _ = manager.load(dirname, filename, encryption_key=credentials.retrieval_password)
+            cache = cls.construct_from_jdict(json.loads(jstr), name=credentials.name)
+
+        except (KeyError, ValueError, TypeError, AttributeError):
+            return None
+
+        if cache is None or cache.email != credentials.email:
+            return None
+
+        return cache
+
+
+    @classmethod
+    def construct(cls, credentials, session):
+        expiry = LocalizedDatetime.now().utc() + Timedelta(seconds=session.expires_in)
+
+        return cls(credentials.name, credentials.email, expiry, session)
+
+
+    @classmethod
+    def construct_from_jdict(cls, jdict, name=None, skeleton=False):
+        if not jdict:
+            return None
+
+        email = jdict.get('email')
+        expiry = LocalizedDatetime.construct_from_iso8601(jdict.get('expiry'))
+        session = Session.construct_from_jdict(jdict.get('session'))
+
+        if expiry is None or session is None:
+            return None
+
+        return cls(name, email, expiry, session)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, name, email, expiry, session):
+        """
+        Constructor
+        """
+        super().__init__(name)
+
+        self.__email = email                                # string
+        self.__expiry = expiry                              # LocalizedDatetime
+        self.__session = session                            # Session
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def is_current(self, min_remaining=MIN_REMAINING):
+        return LocalizedDatetime.now() + min_remaining < self.expiry
+
+
+    @property
+    def authentication(self):
+        return AuthenticationResult(HTTPStatus.OK, AuthenticationStatus.Ok, self.session)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def as_json(self, **kwargs):
+        jdict = OrderedDict()
+
+        jdict['email'] = self.email
+        jdict['expiry'] = self.expiry.as_iso8601()
+        jdict['session'] = self.session
+
+        return jdict
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def email(self):
+        return self.__email
+
+
+    @property
+    def expiry(self):
+        return self.__expiry
+
+
+    @property
+    def session(self):
+        return self.__session
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "CognitoSessionCache:{name:%s, email:%s, expiry:%s}" % (self.name, self.email, self.expiry)
@@ -4,11 +4,17 @@ Created on 17 Aug 2022
 @author: Bruno Beloff (bruno.beloff@southcoastscience.com)
 
 source repo: scs_analysis
+
+Writes configuration samples to a CSV file, as node.py and csv_writer.py -sq would, but in-process.
 """
 
-from subprocess import Popen, PIPE
+from scs_analysis.handler.csv_header_scan_writer import CSVHeaderScanWriter
+from scs_analysis.handler.node_filter import NodeFilter
 
 from scs_core.data.json import JSONify
+from scs_core.data.path_dict import PathDict
+
+from scs_core.sys.logging import Logging
 
 
 # --------------------------------------------------------------------------------------------------------------------
@@ -23,21 +29,47 @@ class ConfigurationCSVGenerator(object):
     # ----------------------------------------------------------------------------------------------------------------
 
     def __init__(self, verbose):
-        self.__csv_opts = '-vsq' if verbose else '-sq'
-        self.__node_opts = '-v' if verbose else ''
+        self.__verbose = verbose                                # bool
+        self.__logger = Logging.getLogger()
 
 
     # ----------------------------------------------------------------------------------------------------------------
 
     def generate(self, selected_configs, selected_nodes, file_path, **kwargs):
-        jstr = '\n'.join([JSONify.dumps(config, **kwargs) for config in selected_configs])
         node_args = self.COMMON_NODES + ['val.' + selected_node for selected_node in selected_nodes]
+        node_filter = NodeFilter(node_args) if selected_nodes else None
+
+        writer = CSVHeaderScanWriter(filename=file_path, quote_all=True)
+
+        document_count = 0
+        processed_count = 0
+
+        try:
+            for config in selected_configs:
+                jstr = JSONify.dumps(config, **kwargs)
+                document_count += 1
+
+                if node_filter is not None:
+                    target = node_filter.datum(PathDict.construct_from_jstr(jstr))
+
+                    if not target:
+                        continue                                # skip empty outputs
 
-        if selected_nodes:
-            p = Popen(['node.py', self.__node_opts] + node_args, stdin=PIPE, stdout=PIPE)
-            csv_data, _ = p.communicate(input=jstr.encode())
-        else:
-            csv_data = jstr.encode()
+                    jstr = JSONify.dumps(target)
+
+                if writer.write(jstr):
+                    processed_count += 1
+
+        finally:
+            writer.close()
+
+        if self.__verbose:
+            self.__logger.info("documents: %d processed: %d" % (document_count, processed_count))
+
+        return processed_count
+
+
+    # ----------------------------------------------------------------------------------------------------------------
 
-        p = Popen(['csv_writer.py', self.__csv_opts, file_path], stdin=PIPE)
-        p.communicate(input=csv_data)
+    def __str__(self, *args, **kwargs):
+        return "ConfigurationCSVGenerator:{verbose:%s}" % self.__verbose
@@ -0,0 +1,125 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+source repo: scs_analysis
+
+The state of an incremental configuration_csv history download: for each device, the rec.update of the configuration
+from which the device's history CSV file was last written.
+
+A device's history need only be downloaded again if its latest rec.update differs from the recorded value, or if its
+CSV file is missing. The state is only valid for the request mode and nodes with which it was recorded - otherwise, it
+is discarded, and all histories are downloaded. The state is held in a JSON file in the output directory, which is
+replaced atomically each time that a device is recorded, so that an interrupted run loses no completed work.
+
+example document:
+{"mode": "DIFF", "nodes": ["afe-id"], "updates": {"scs-bgx-401": "2026-10-18T11:59:40Z"}}
+"""
+
+import json
+import os
+
+from collections import OrderedDict
+
+from scs_core.data.json import JSONable, JSONify
+
+from scs_core.sys.logging import Logging
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class ConfigurationCSVState(JSONable):
+    """
+    classdocs
+    """
+
+    FILENAME = '.configuration_csv_state.json'
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def load(cls, dirname, mode, nodes):
+        filename = os.path.join('.' if dirname is None else dirname, cls.FILENAME)
+        logger = Logging.getLogger()
+
+        try:
+            with open(filename) as f:
+                jdict = json.load(f, object_pairs_hook=OrderedDict)
+
+        except FileNotFoundError:
+            return cls(filename, mode, nodes)
+
+        except ValueError:
+            logger.warning("configuration state is unreadable, and will be ignored: %s" % filename)
+            return cls(filename, mode, nodes)
+
+        if jdict.get('mode') != mode.name or jdict.get('nodes') != list(nodes):
+            logger.info("configuration state is for a different mode or nodes, and will be ignored")
+            return cls(filename, mode, nodes)
+
+        return cls(filename, mode, nodes, updates=jdict.get('updates'))
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, filename, mode, nodes, updates=None):
+        """
+        Constructor
+        """
+        self.__filename = filename                                  # string
+        self.__mode = mode                                          # ConfigurationRequest.Mode
+        self.__nodes = list(nodes)                                  # list of string
+
+        self.__updates = OrderedDict() if updates is None else updates     # OrderedDict of tag: ISO 8601 string
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def is_current(self, tag, update, path):
+        return self.__updates.get(tag) == update.as_iso8601() and os.path.isfile(path)
+
+
+    def record(self, tag, update):
+        self.__updates[tag] = update.as_iso8601()
+        self.save()
+
+
+    def save(self):
+        tmp_filename = '%s.%d.tmp' % (self.__filename, os.getpid())
+
+        with open(tmp_filename, 'w') as f:
+            f.write(JSONify.dumps(self))
+
+        os.replace(tmp_filename, self.__filename)                   # atomic
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def as_json(self, **kwargs):
+        jdict = OrderedDict()
+
+        jdict['mode'] = self.__mode.name
+        jdict['nodes'] = self.__nodes
+        jdict['updates'] = self.__updates
+
+        return jdict
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def filename(self):
+        return self.__filename
+
+
+    @property
+    def updates(self):
+        return self.__updates
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "ConfigurationCSVState:{filename:%s, mode:%s, nodes:%s, updates:%s}" % \
+               (self.filename, self.__mode, self.__nodes, len(self.updates))
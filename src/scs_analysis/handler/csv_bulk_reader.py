@@ -0,0 +1,263 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+source repo: scs_analysis
+
+A chunked, column-oriented alternative to CSVReader, for large CSV files.
+
+Rows are read in chunks of chunk_rows, and each chunk is transposed into columns. Where values are cast, the type of
+each column - int, float, bool or string - is inferred once, from the first SAMPLE_ROWS rows of the file, whatever
+the limit on rows read. Columns are then cast whole - as with CSVReader, cells of float columns that are integers are
+cast to int. A column that does not conform to its inferred type in a given chunk is cast cell by cell, as CSVReader
+would, for that chunk only.
+
+Chunks are yielded as BinaryFrame instances, which may be written as binary frames, or rendered as documents.
+"""
+
+import csv
+import sys
+
+from itertools import islice
+
+from scs_analysis.handler.binary_frame import BinaryFrame
+
+from scs_core.csv.csv_dict import CSVHeader
+from scs_core.csv.csv_reader import CSVReaderException
+
+from scs_core.data.str import Str
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class CSVBulkReader(object):
+    """
+    classdocs
+    """
+
+    CHUNK_ROWS = 8192
+    SAMPLE_ROWS = 1000
+
+    __BOOLS = {'TRUE': True, 'FALSE': False}
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def construct_for_file(cls, filename, cast=True, nullify=False, chunk_rows=CHUNK_ROWS):
+        iterable = sys.stdin if filename is None else open(filename)
+
+        return cls(iterable, filename=filename, cast=cast, nullify=nullify, chunk_rows=chunk_rows)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def __recast(cls, value):                               # as CSVReader
+        if value is None:
+            return None
+
+        try:
+            return int(value)
+        except ValueError:
+            pass
+
+        try:
+            return float(value)
+        except ValueError:
+            pass
+
+        return cls.__BOOLS.get(value.upper(), value)
+
+
+    @staticmethod
+    def __number(value):                                    # as CSVReader - ints are not cast to float
+        try:
+            return int(value)
+        except ValueError:
+            return float(value)
+
+
+    @classmethod
+    def __column_type(cls, cells):
+        present = [cell for cell in cells if cell is not None]
+
+        if not present:
+            return None
+
+        for column_type, cast in (('int', int), ('float', float)):
+            try:
+                for cell in present:
+                    cast(cell)
+
+                return column_type
+
+            except ValueError:
+                pass
+
+        if all(cell.upper() in cls.__BOOLS for cell in present):
+            return 'bool'
+
+        if all(cls.__is_str(cell) for cell in present):
+            return 'str'
+
+        return None                                         # mixed - cast cell by cell
+
+
+    @classmethod
+    def __cast_column(cls, column_type, cells):
+        try:
+            if column_type == 'int':
+                return [None if cell is None else int(cell) for cell in cells]
+
+            if column_type == 'float':
+                return [None if cell is None else cls.__number(cell) for cell in cells]
+
+            if column_type == 'bool':
+                return [None if cell is None else cls.__BOOLS[cell.upper()] for cell in cells]
+
+            if column_type == 'str' and all(cell is None or cls.__is_str(cell) for cell in cells):
+                return list(cells)
+
+        except (KeyError, ValueError):
+            pass
+
+        return [cls.__recast(cell) for cell in cells]
+
+
+    @classmethod
+    def __is_str(cls, value):                               # True if CSVReader would not recast the value
+        return isinstance(cls.__recast(value), str)
+
+
+    @classmethod
+    def __column_types_for(cls, paths, rows, nullify):
+        columns = list(zip(*[row for row in rows if len(row) == len(paths)]))
+
+        if not columns:
+            return [None] * len(paths)                      # cast cell by cell
+
+        if nullify:
+            columns = [cls.__nullified(column) for column in columns]
+
+        return [cls.__column_type(column) for column in columns]
+
+
+    @staticmethod
+    def __nullified(cells):
+        return [None if cell == '' or (len(cell) == 4 and cell.upper() == 'NULL') else cell for cell in cells]
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, iterable, filename=None, cast=True, nullify=False, chunk_rows=CHUNK_ROWS):
+        """
+        Constructor
+        """
+        self.__iterable = iterable                                  # iterable
+        self.__filename = filename                                  # string
+        self.__cast = bool(cast)                                    # bool
+        self.__nullify = bool(nullify)                              # bool
+        self.__chunk_rows = int(chunk_rows)                         # int
+
+        self.__column_types = None                                  # list of string or None
+        self.__read_count = 0                                       # int
+
+        try:
+            self.__reader = csv.reader(iterable, quoting=csv.QUOTE_ALL, skipinitialspace=True)
+
+            try:
+                paths = next(self.__reader)
+            except StopIteration:                                   # no input
+                paths = []
+
+        except csv.Error as ex:
+            raise CSVReaderException(ex)
+
+        self.__header = CSVHeader.construct_from_paths(paths)       # KeyError or ValueError
+        self.__header.as_dict([None] * len(paths))                  # CSVHeaderError if column names clash
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def close(self):
+        if self.__filename is None:
+            return
+
+        self.__iterable.close()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def frames(self, limit=None):                                   # yields BinaryFrame
+        paths = self.__header.paths()
+
+        try:
+            while limit is None or self.__read_count < limit:
+                rows = [row for row in islice(self.__reader, self.__chunk_rows) if row]
+
+                if not rows:
+                    return
+
+                # types are inferred from the sample before the limit is applied...
+                if self.__cast and self.__column_types is None:
+                    self.__column_types = self.__column_types_for(paths, rows[:self.SAMPLE_ROWS], self.__nullify)
+
+                if limit is not None:
+                    rows = rows[:limit - self.__read_count]
+
+                for row in rows:
+                    if len(row) != len(paths):
+                        raise ValueError("unmatched lengths: header: %s row: %s" % (list(paths), row))
+
+                columns = list(zip(*rows))
+
+                if self.__nullify:
+                    columns = [self.__nullified(column) for column in columns]
+
+                if self.__cast:
+                    columns = [self.__cast_column(column_type, column)
+                               for column_type, column in zip(self.__column_types, columns)]
+
+                else:
+                    columns = [list(column) for column in columns]
+
+                self.__read_count += len(rows)
+
+                yield BinaryFrame(paths, columns)
+
+        except csv.Error as ex:
+            raise CSVReaderException(ex)            # typically on the last line of a badly-closed CSV file
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def filename(self):
+        return self.__filename
+
+
+    @property
+    def read_count(self):
+        return self.__read_count
+
+
+    @property
+    def header(self):
+        return self.__header
+
+
+    @property
+    def column_types(self):
+        return self.__column_types
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        iterable = self.__iterable.__class__.__name__
+
+        return "CSVBulkReader:{iterable:%s, filename:%s, cast:%s, nullify:%s, chunk_rows:%s, read_count:%s, " \
+               "column_types:%s, header:%s}" % \
+               (iterable, self.filename, self.__cast, self.__nullify, self.__chunk_rows, self.read_count,
+                self.column_types, Str.collection(list(self.header.paths())))
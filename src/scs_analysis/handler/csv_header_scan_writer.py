@@ -0,0 +1,147 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+source repo: scs_analysis
+
+A two-pass, header-scan equivalent of CSVWriter, whose memory use does not grow with the size of its input.
+
+On the first pass, documents are spooled to a temporary file while the union of their paths is built. The spool is
+held in memory until it exceeds SPOOL_SIZE bytes, and is then moved to disk. On close, the header row is written,
+and the spooled documents are read back and written as rows.
+
+The header is built as CSVWriter builds it: any values bound to paths that become internal nodes are discarded.
+"""
+
+import csv
+import sys
+import tempfile
+
+from scs_core.csv.csv_dict import CSVDict
+from scs_core.data.path_dict import PathDict
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class CSVHeaderScanWriter(object):
+    """
+    classdocs
+    """
+
+    SPOOL_SIZE = 16 * 1024 * 1024                           # bytes
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, filename=None, append=False, quote_all=False, spool_dir=None):
+        """
+        Constructor
+        """
+        self.__filename = filename                                          # string or None (stdout)
+        self.__append = bool(append)                                        # bool
+        self.__quote_all = bool(quote_all)                                  # bool
+
+        self.__paths = []                                                   # list of string
+        self.__known_paths = set()                                          # set of tuple of string
+
+        self.__spool = tempfile.SpooledTemporaryFile(max_size=self.SPOOL_SIZE, mode='w+', dir=spool_dir)
+        self.__spool_count = 0                                              # int
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def write(self, jstr):
+        if jstr is None:
+            return False
+
+        datum = CSVDict.construct_from_jstr(jstr)
+
+        if datum is None:
+            return False
+
+        datum_paths = tuple(datum.paths())
+
+        # documents of the same shape are typically repeated - each shape need only be scanned once...
+        if datum_paths not in self.__known_paths:
+            self.__update_paths(datum_paths)
+            self.__known_paths.add(datum_paths)
+
+        self.__spool.write(jstr.strip() + '\n')
+        self.__spool_count += 1
+
+        return True
+
+
+    def close(self):
+        file = sys.stdout if self.__filename is None else open(self.__filename, 'a' if self.__append else 'w',
+                                                               newline='')
+        try:
+            writer = csv.writer(file, quoting=csv.QUOTE_ALL if self.__quote_all else csv.QUOTE_MINIMAL)
+
+            # write header...
+            writer.writerow(self.__paths)
+
+            # write rows...
+            self.__spool.seek(0)
+
+            for line in self.__spool:
+                writer.writerow(CSVDict.construct_from_jstr(line).row(self.__paths))
+
+        finally:
+            self.__spool.close()
+
+            if self.__filename is not None:
+                file.close()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __update_paths(self, datum_paths):
+        appended_paths = []
+
+        for i in range(len(datum_paths)):
+            if datum_paths[i] not in self.__paths and not self.__is_sub_path(datum_paths[i], self.__paths):
+                self.__paths.insert(i, datum_paths[i])
+                appended_paths.append(datum_paths[i])
+
+        if appended_paths:
+            for i in reversed(range(len(self.__paths))):
+                if self.__is_sub_path(self.__paths[i], appended_paths):
+                    self.__paths.pop(i)
+
+
+    @staticmethod
+    def __is_sub_path(candidate, paths):
+        for path in paths:
+            if candidate == path:
+                return False            # return here because paths are assumed to be unique
+
+            if PathDict.sub_path_includes_path(candidate, path):
+                return True
+
+        return False
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def filename(self):
+        return self.__filename
+
+
+    @property
+    def paths(self):
+        return self.__paths
+
+
+    @property
+    def spool_count(self):
+        return self.__spool_count
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "CSVHeaderScanWriter:{filename:%s, append:%s, quote_all:%s, spool_size:%s, spool_count:%s, " \
+               "paths:%s}" % \
+               (self.filename, self.__append, self.__quote_all, self.SPOOL_SIZE, self.spool_count, self.paths)
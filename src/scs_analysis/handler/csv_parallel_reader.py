@@ -0,0 +1,229 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+source repo: scs_analysis
+
+A multi-file CSV reader, which parses files concurrently, in a process pool.
+
+Each worker parses one file - with CSVReader or, in bulk mode, CSVBulkReader - and spools its JSON documents to a
+temporary file. Where a limit is given, each worker stops after spooling that number of documents from its file.
+Documents are then read back either in the order of the files, each file being released as soon as it and its
+predecessors are complete, or interleaved by a k-way merge on an ISO 8601 datetime field. In the merge mode, each file
+must be in datetime order. Documents with no valid datetime keep their place after their predecessor.
+
+Errors that prevent a file from being read are raised, in file order, as CSVParallelReaderError.
+"""
+
+import heapq
+import os
+import tempfile
+
+from concurrent.futures import ProcessPoolExecutor
+
+from scs_analysis.handler.csv_bulk_reader import CSVBulkReader
+
+from scs_core.csv.csv_dict import CSVHeaderError
+from scs_core.csv.csv_reader import CSVReader, CSVReaderException
+
+from scs_core.data.datetime import LocalizedDatetime
+from scs_core.data.json import JSONify
+from scs_core.data.path_dict import PathDict
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class CSVParallelReader(object):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @staticmethod
+    def parse(filename, spool_name, cast, nullify, bulk, merge_path, limit=None):
+        # runs in a worker process - returns (rows, note)...
+        reader = None
+        rows = 0
+        note = None
+
+        key = float('-inf')
+        encoder = JSONify(ensure_ascii=False)
+
+        try:
+            if bulk:
+                reader = CSVBulkReader.construct_for_file(filename, cast=cast, nullify=nullify)
+                jstrs = (encoder.encode(node) for frame in reader.frames(limit=limit) for node in frame.nodes())
+
+            else:
+                reader = CSVReader.construct_for_file(filename, cast=cast, nullify=nullify)
+                jstrs = reader.rows()
+
+            with open(spool_name, 'w') as spool:
+                try:
+                    for jstr in jstrs:
+                        if limit is not None and rows >= limit:
+                            break
+
+                        if merge_path is not None:
+                            key = CSVParallelReader.__key(jstr, merge_path, key)
+                            spool.write(repr(key) + '\t')
+
+                        spool.write(jstr + '\n')
+                        rows += 1
+
+                except CSVReaderException as ex:
+                    note = "ending file on row %d: %s" % (rows, ex)
+
+        except FileNotFoundError:
+            raise CSVParallelReaderError("file not found: '%s'." % filename)
+
+        except KeyError as ex:
+            raise CSVParallelReaderError("empty header cell in: %s." % ex)
+
+        except CSVHeaderError as ex:
+            raise CSVParallelReaderError("clashing column names: '%s' and '%s'" % (ex.left, ex.right))
+
+        except ValueError as ex:
+            raise CSVParallelReaderError("%s: %s" % (filename, ex))
+
+        finally:
+            if reader is not None:
+                reader.close()
+
+        return rows, note
+
+
+    @staticmethod
+    def __key(jstr, merge_path, prev_key):
+        try:
+            rec = LocalizedDatetime.construct_from_iso8601(PathDict.construct_from_jstr(jstr).node(merge_path))
+        except (KeyError, TypeError):
+            return prev_key
+
+        return prev_key if rec is None else rec.timestamp()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, filenames, jobs, cast=True, nullify=False, bulk=False, merge_path=None, limit=None,
+                 spool_dir=None):
+        """
+        Constructor
+        """
+        self.__filenames = list(filenames)                          # list of string
+        self.__jobs = int(jobs)                                     # int
+        self.__cast = bool(cast)                                    # bool
+        self.__nullify = bool(nullify)                              # bool
+        self.__bulk = bool(bulk)                                    # bool
+        self.__merge_path = merge_path                              # string or None
+        self.__limit = limit                                        # int or None (per file)
+        self.__spool_dir = spool_dir                                # string or None
+
+        self.__file_rows = {}                                       # dict of filename: int
+        self.__notes = []                                           # list of string
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def jstrs(self):                                                # yields JSON string
+        spool_names = []
+
+        for _ in self.__filenames:
+            fd, spool_name = tempfile.mkstemp(suffix='.jsonl', dir=self.__spool_dir)
+            os.close(fd)
+            spool_names.append(spool_name)
+
+        try:
+            with ProcessPoolExecutor(max_workers=self.__jobs) as executor:
+                futures = [executor.submit(self.parse, filename, spool_name, self.__cast, self.__nullify,
+                                           self.__bulk, self.__merge_path, self.__limit)
+                           for filename, spool_name in zip(self.__filenames, spool_names)]
+
+                try:
+                    if self.__merge_path is None:
+                        yield from self.__ordered(futures, spool_names)
+                    else:
+                        yield from self.__merged(futures, spool_names)
+
+                finally:
+                    for future in futures:
+                        future.cancel()
+
+        finally:
+            for spool_name in spool_names:
+                os.remove(spool_name)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __ordered(self, futures, spool_names):
+        for filename, future, spool_name in zip(self.__filenames, futures, spool_names):
+            self.__collect(filename, future)
+
+            with open(spool_name) as spool:
+                for line in spool:
+                    yield line.rstrip('\n')
+
+
+    def __merged(self, futures, spool_names):
+        for filename, future in zip(self.__filenames, futures):
+            self.__collect(filename, future)
+
+        spools = [open(spool_name) for spool_name in spool_names]
+
+        try:
+            lines = [(self.__keyed(line) for line in spool) for spool in spools]
+
+            for _, jstr in heapq.merge(*lines, key=lambda item: item[0]):
+                yield jstr
+
+        finally:
+            for spool in spools:
+                spool.close()
+
+
+    def __collect(self, filename, future):
+        rows, note = future.result()                                # CSVParallelReaderError
+
+        self.__file_rows[filename] = rows
+
+        if note:
+            self.__notes.append("%s: %s" % (filename, note))
+
+
+    @staticmethod
+    def __keyed(line):
+        key, jstr = line.rstrip('\n').split('\t', 1)
+
+        return float(key), jstr
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def file_rows(self):
+        return self.__file_rows
+
+
+    @property
+    def notes(self):
+        return self.__notes
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "CSVParallelReader:{filenames:%s, jobs:%s, cast:%s, nullify:%s, bulk:%s, merge_path:%s, " \
+               "limit:%s}" % \
+               (self.__filenames, self.__jobs, self.__cast, self.__nullify, self.__bulk, self.__merge_path,
+                self.__limit)
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class CSVParallelReaderError(RuntimeError):
+    """
+    classdocs
+    """
@@ -0,0 +1,328 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+source repo: scs_analysis
+
+Runs a batch of device commands through a shared DeviceControlClient, on a bounded pool of worker threads.
+
+Commands for the same device are run one at a time, in the order in which they were submitted - a device can only
+interact with one controller at a time. Commands for different devices run concurrently, up to the limit set by
+max_workers. Each command is dispatched as soon as it is submitted, so that a batch may be run while it is still being
+read, and results are available in the order in which they complete.
+
+As in the device_controller message mode, a message may hold several commands separated by semicolons (;). The
+message is split into one DeviceCommand per command, which share the index of the message, and are sent in order.
+
+example document:
+{"device": "scs-be2-3", "message": "vcal_baseline -i4"}
+"""
+
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from queue import Empty, Queue
+from threading import Lock
+
+from scs_core.client.http_exception import HTTPException, HTTPNotFoundException, HTTPGatewayTimeoutException, \
+    HTTPServiceUnavailableException
+
+from scs_core.data.json import JSONable
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class DeviceCommand(JSONable):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def construct_from_jdict(cls, jdict, index=None):
+        if not jdict:
+            return None
+
+        device_tag = jdict.get('device')
+        message = jdict.get('message')
+
+        if not device_tag or not message:
+            return None
+
+        if not isinstance(message, str):
+            message = ' '.join(str(token) for token in message)
+
+        if not message.replace(';', '').strip():
+            return None
+
+        return cls(index, device_tag, message)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, index, device_tag, message):
+        """
+        Constructor
+        """
+        self.__index = index                                    # int
+        self.__device_tag = device_tag                          # string
+        self.__message = message                                # string
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def split(self):                                            # list of DeviceCommand, one per ';'-separated command
+        messages = [message.strip() for message in self.message.split(';')]
+
+        return [DeviceCommand(self.index, self.device_tag, message) for message in messages if message]
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def as_json(self, **kwargs):
+        jdict = OrderedDict()
+
+        jdict['device'] = self.device_tag
+        jdict['message'] = self.message
+
+        return jdict
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def index(self):
+        return self.__index
+
+
+    @property
+    def device_tag(self):
+        return self.__device_tag
+
+
+    @property
+    def message(self):
+        return self.__message
+
+
+    @property
+    def cmd_tokens(self):
+        return self.message.strip().split()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "DeviceCommand:{index:%s, device_tag:%s, message:%s}" % (self.index, self.device_tag, self.message)
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class DeviceCommandResult(JSONable):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, command, receipt, error, include_wrapper=False):
+        """
+        Constructor
+        """
+        self.__command = command                                # DeviceCommand
+        self.__receipt = receipt                                # ControlReceipt or None
+        self.__error = error                                    # string or None
+        self.__include_wrapper = include_wrapper                # bool
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def is_ok(self):
+        return self.error is None and self.return_code == 0
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def as_json(self, **kwargs):
+        jdict = OrderedDict()
+
+        jdict['index'] = self.command.index
+        jdict['device'] = self.command.device_tag
+        jdict['message'] = self.command.message
+
+        if self.receipt is not None:
+            jdict['response'] = self.receipt if self.__include_wrapper else self.receipt.command
+
+        if self.error is not None:
+            jdict['error'] = self.error
+
+        return jdict
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def command(self):
+        return self.__command
+
+
+    @property
+    def receipt(self):
+        return self.__receipt
+
+
+    @property
+    def error(self):
+        return self.__error
+
+
+    @property
+    def return_code(self):
+        return None if self.receipt is None else self.receipt.command.return_code
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "DeviceCommandResult:{command:%s, receipt:%s, error:%s, include_wrapper:%s}" % \
+               (self.command, self.receipt, self.error, self.__include_wrapper)
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class DeviceCommandBatch(object):
+    """
+    classdocs
+    """
+
+    DEFAULT_MAX_WORKERS = 8
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, client, token_source, max_workers=DEFAULT_MAX_WORKERS, include_wrapper=False):
+        """
+        Constructor
+        """
+        self.__client = client                                  # DeviceControlClient
+        self.__token_source = token_source                      # callable returning an ID token
+        self.__max_workers = max_workers                        # int
+        self.__include_wrapper = include_wrapper                # bool
+
+        self.__executor = ThreadPoolExecutor(max_workers=max_workers)
+        self.__results = Queue()                                # Queue of DeviceCommandResult
+
+        self.__pending = {}                                     # dict of device_tag: deque of DeviceCommand
+        self.__lock = Lock()                                    # Lock
+
+        self.__submitted = 0                                    # int
+        self.__completed = 0                                    # int
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def run(self, commands):                                    # yields DeviceCommandResult, in order of completion
+        try:
+            for command in commands:
+                self.submit(command)
+
+                yield from self.__collect(block=False)
+
+            yield from self.__collect(block=True)
+
+        finally:
+            self.shutdown()
+
+
+    def submit(self, command):
+        self.__submitted += 1
+
+        with self.__lock:
+            pending = self.__pending.get(command.device_tag)
+
+            if pending is not None:                             # the device is busy
+                pending.append(command)
+                return
+
+            self.__pending[command.device_tag] = deque()
+
+        self.__executor.submit(self.__run_device, command)
+
+
+    def shutdown(self):
+        self.__executor.shutdown(wait=False, cancel_futures=True)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __collect(self, block):
+        while self.__completed < self.__submitted:
+            try:
+                result = self.__results.get(block=block)
+            except Empty:
+                return
+
+            self.__completed += 1
+
+            yield result
+
+
+    def __run_device(self, command):
+        while True:
+            self.__results.put(self.__interact(command))
+
+            with self.__lock:
+                pending = self.__pending[command.device_tag]
+
+                if not pending:
+                    del self.__pending[command.device_tag]
+                    return
+
+                command = pending.popleft()
+
+
+    def __interact(self, command):
+        try:
+            receipt = self.__client.interact(self.__token_source(), command.device_tag, command.cmd_tokens)
+            return DeviceCommandResult(command, receipt, None, include_wrapper=self.__include_wrapper)
+
+        except HTTPNotFoundException:
+            error = "device '%s' not found." % command.device_tag
+
+        except HTTPGatewayTimeoutException:
+            error = "device '%s' is not available." % command.device_tag
+
+        except HTTPServiceUnavailableException:
+            error = "device '%s' is interacting with another controller." % command.device_tag
+
+        except HTTPException as ex:
+            error = ex.error_report
+
+        except Exception as ex:
+            error = ex.__class__.__name__
+
+        return DeviceCommandResult(command, None, error, include_wrapper=self.__include_wrapper)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def max_workers(self):
+        return self.__max_workers
+
+
+    @property
+    def submitted(self):
+        return self.__submitted
+
+
+    @property
+    def completed(self):
+        return self.__completed
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "DeviceCommandBatch:{client:%s, max_workers:%s, include_wrapper:%s, submitted:%s, completed:%s}" % \
+               (self.__client, self.max_workers, self.__include_wrapper, self.submitted, self.completed)
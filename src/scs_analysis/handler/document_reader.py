@@ -0,0 +1,109 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+source repo: scs_analysis
+
+Reads documents from stdin, detecting whether the input is JSON lines or binary frames.
+"""
+
+import sys
+
+from itertools import chain
+
+from scs_analysis.handler.binary_frame import BinaryFrame, BinaryFrameReader
+
+from scs_core.data.json import JSONify
+from scs_core.data.path_dict import PathDict
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class DocumentReader(object):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def documents(cls, stream=None, sort_paths=()):                 # yields PathDict
+        frame_reader, lines = cls.__open(stream)
+
+        if frame_reader:
+            yield from frame_reader.documents(sort_paths=sort_paths)
+            return
+
+        for line in lines:
+            datum = PathDict.construct_from_jstr(cls.__text(line), sort_paths=sort_paths)
+
+            if datum is None:
+                continue
+
+            yield datum
+
+
+    @classmethod
+    def lines(cls, stream=None):                                    # yields (JSON string, PathDict)
+        frame_reader, lines = cls.__open(stream)
+
+        if frame_reader:
+            for datum in frame_reader.documents():
+                yield JSONify.dumps(datum), datum
+
+            return
+
+        for line in lines:
+            jstr = cls.__text(line).strip()
+            datum = PathDict.construct_from_jstr(jstr)
+
+            if datum is None:
+                continue
+
+            yield jstr, datum
+
+
+    @classmethod
+    def jstrs(cls, stream=None):                                    # yields JSON string, without parsing JSON input
+        frame_reader, lines = cls.__open(stream)
+
+        if frame_reader:
+            for datum in frame_reader.documents():
+                yield JSONify.dumps(datum)
+
+            return
+
+        for line in lines:
+            yield cls.__text(line).strip()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def __open(cls, stream):
+        stream = sys.stdin if stream is None else stream
+
+        try:
+            buffer = stream.buffer
+        except AttributeError:
+            return None, stream                                     # a text stream, or an iterable of strings
+
+        head = buffer.read(len(BinaryFrame.MAGIC))
+
+        if head == BinaryFrame.MAGIC:
+            return BinaryFrameReader.construct(buffer), None
+
+        # the head may hold one or more complete lines, as well as the start of the next...
+        *complete, partial = head.split(b'\n')
+        lines = [line + b'\n' for line in complete]
+
+        if partial:
+            lines.append(partial + buffer.readline())
+
+        return None, chain(lines, buffer)
+
+
+    @staticmethod
+    def __text(line):
+        return line.decode() if isinstance(line, bytes) else line
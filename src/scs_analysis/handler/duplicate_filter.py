@@ -0,0 +1,309 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+source repo: scs_analysis
+
+Bounded-memory alternatives to scs_core Duplicates, for the sample_duplicates utility. Unlike Duplicates, none of the
+filters retains the documents themselves.
+
+HashDuplicateFilter holds a count for each key - as a 16-byte digest, unless the keys themselves are required for the
+match counts report. SortedDuplicateFilter holds only the previous key, and the keys that have been found to have
+duplicates, but detects only duplicates that are adjacent in the input. BloomDuplicateFilter holds a fixed-size bit
+array: its memory use does not grow with the input, but a small proportion of unique keys may be reported as
+duplicates, and match counts are not available.
+
+https://en.wikipedia.org/wiki/Bloom_filter
+"""
+
+import hashlib
+import json
+import math
+
+from abc import ABC, abstractmethod
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class DuplicateFilter(ABC):
+    """
+    classdocs
+    """
+
+    @staticmethod
+    def construct(sorted_input=False, bloom_capacity=None, retain_keys=False):
+        if sorted_input:
+            return SortedDuplicateFilter()
+
+        if bloom_capacity is not None:
+            return BloomDuplicateFilter(bloom_capacity)
+
+        return HashDuplicateFilter(retain_keys=retain_keys)
+
+
+    @staticmethod
+    def jstr(key):
+        return json.dumps(key)
+
+
+    @staticmethod
+    def digest(jstr):
+        return hashlib.blake2b(jstr.encode(), digest_size=16).digest()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self):
+        """
+        Constructor
+        """
+        self._duplicate_count = 0                           # int
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @abstractmethod
+    def test(self, key):                                    # returns bool - True if the key has been seen before
+        pass
+
+
+    @abstractmethod
+    def match_counts(self):                                 # yields dict of jstr: int
+        pass
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def duplicate_count(self):
+        return self._duplicate_count
+
+
+    @property
+    @abstractmethod
+    def matched_key_count(self):                            # int or None if unknown
+        pass
+
+
+    @property
+    @abstractmethod
+    def total_matches(self):                                # int or None if unknown
+        pass
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class HashDuplicateFilter(DuplicateFilter):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, retain_keys=False):
+        """
+        Constructor
+        """
+        super().__init__()
+
+        self.__retain_keys = retain_keys                    # bool
+        self.__counts = {}                                  # dict of jstr or digest: int
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def test(self, key):
+        jstr = self.jstr(key)
+        entry = jstr if self.__retain_keys else self.digest(jstr)
+
+        count = self.__counts.get(entry, 0)
+        self.__counts[entry] = count + 1
+
+        if count == 0:
+            return False
+
+        self._duplicate_count += 1
+
+        return True
+
+
+    def match_counts(self):
+        if not self.__retain_keys:
+            raise ValueError("match counts require retained keys")
+
+        for jstr in sorted(self.__counts.keys()):
+            if self.__counts[jstr] > 1:
+                yield {jstr: self.__counts[jstr]}
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def matched_key_count(self):
+        return sum(1 for count in self.__counts.values() if count > 1)
+
+
+    @property
+    def total_matches(self):
+        return sum(count for count in self.__counts.values() if count > 1)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "HashDuplicateFilter:{retain_keys:%s, keys:%s, duplicate_count:%s}" % \
+               (self.__retain_keys, len(self.__counts), self.duplicate_count)
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class SortedDuplicateFilter(DuplicateFilter):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self):
+        """
+        Constructor
+        """
+        super().__init__()
+
+        self.__prev = None                                  # jstr
+        self.__matches = {}                                 # dict of jstr: int
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def test(self, key):
+        jstr = self.jstr(key)
+
+        if jstr != self.__prev:
+            self.__prev = jstr
+
+            return False
+
+        self.__matches[jstr] = self.__matches.get(jstr, 0) + 1      # a key may recur, if the input is not sorted
+
+        self._duplicate_count += 1
+
+        return True
+
+
+    def match_counts(self):
+        for jstr in sorted(self.__matches.keys()):
+            yield {jstr: self.__matches[jstr] + 1}
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def matched_key_count(self):
+        return len(self.__matches)
+
+
+    @property
+    def total_matches(self):
+        return sum(count + 1 for count in self.__matches.values())
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "SortedDuplicateFilter:{prev:%s, matched_key_count:%s, duplicate_count:%s}" % \
+               (self.__prev, self.matched_key_count, self.duplicate_count)
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class BloomDuplicateFilter(DuplicateFilter):
+    """
+    classdocs
+    """
+
+    DEFAULT_ERROR_RATE = 0.0001
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, capacity, error_rate=DEFAULT_ERROR_RATE):
+        """
+        Constructor
+        """
+        super().__init__()
+
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+
+        if not 0.0 < error_rate < 1.0:
+            raise ValueError("error_rate must be in the range 0.0 to 1.0")
+
+        bit_count = math.ceil(-capacity * math.log(error_rate) / (math.log(2) ** 2))
+
+        self.__capacity = capacity                                          # int
+        self.__error_rate = error_rate                                      # float
+
+        self.__bit_count = bit_count                                        # int
+        self.__hash_count = max(1, round(bit_count / capacity * math.log(2)))  # int
+        self.__bits = bytearray((bit_count + 7) // 8)                       # bytearray
+
+        self.__key_count = 0                                                # int
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def test(self, key):
+        digest = self.digest(self.jstr(key))
+
+        # double hashing...
+        h1 = int.from_bytes(digest[:8], 'little')
+        h2 = int.from_bytes(digest[8:], 'little') | 1
+
+        present = True
+
+        for i in range(self.__hash_count):
+            bit = (h1 + i * h2) % self.__bit_count
+            mask = 1 << (bit & 7)
+
+            if not self.__bits[bit >> 3] & mask:
+                self.__bits[bit >> 3] |= mask
+                present = False
+
+        if not present:
+            self.__key_count += 1
+            return False
+
+        self._duplicate_count += 1
+
+        return True
+
+
+    def match_counts(self):
+        raise ValueError("match counts are not available from a Bloom filter")
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def matched_key_count(self):
+        return None
+
+
+    @property
+    def total_matches(self):
+        return None
+
+
+    @property
+    def saturated(self):
+        return self.__key_count > self.__capacity
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "BloomDuplicateFilter:{capacity:%s, error_rate:%s, bit_count:%s, hash_count:%s, key_count:%s, " \
+               "duplicate_count:%s}" % \
+               (self.__capacity, self.__error_rate, self.__bit_count, self.__hash_count, self.__key_count,
+                self.duplicate_count)
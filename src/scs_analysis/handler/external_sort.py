@@ -0,0 +1,184 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+source repo: scs_analysis
+
+An external merge sort for JSON documents, within an approximate memory budget.
+
+Documents are held in memory, as (key, JSON string) pairs, until their JSON exceeds the budget. The buffer is then
+sorted and spilled to a temporary file as a run. Finally, the runs, and any remaining buffer, are merged on a heap.
+
+Input that is already in order is not sorted: while the input remains in order, full buffers are appended to a
+single run, which is finally streamed back out. Input that is in order and fits within the budget is not spilled.
+
+The sort is stable, and keys are compared as PathDict compares documents with sort paths.
+"""
+
+import heapq
+import tempfile
+
+from operator import itemgetter
+
+from scs_core.data.path_dict import PathDict
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class ExternalSort(object):
+    """
+    classdocs
+    """
+
+    DEFAULT_BUDGET = 256 * 1024 * 1024                          # bytes of JSON
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, sort_paths, reverse=False, budget=DEFAULT_BUDGET, spool_dir=None):
+        """
+        Constructor
+        """
+        self.__sort_paths = tuple(sort_paths)                               # tuple of string
+        self.__reverse = bool(reverse)                                      # bool
+        self.__budget = int(budget)                                         # int
+        self.__spool_dir = spool_dir                                        # string or None
+
+        self.__runs = []                                                    # list of file
+        self.__in_order = True                                              # bool
+        self.__document_count = 0                                           # int
+        self.__run_count = 0                                                # int
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def sort(self, lines):                                                  # yields JSON string
+        # lines is an iterable of (JSON string, PathDict)...
+        buffer = []
+        buffer_size = 0
+        prev_key = None
+
+        self.__runs = []
+        self.__in_order = True
+        self.__document_count = 0
+        self.__run_count = 0
+
+        try:
+            for jstr, datum in lines:
+                self.__document_count += 1
+                key = self.key(datum)
+
+                if self.__in_order and prev_key is not None and not self.__follows(key, prev_key):
+                    self.__in_order = False
+
+                prev_key = key
+
+                buffer.append((key, jstr))
+                buffer_size += len(jstr)
+
+                if buffer_size >= self.__budget:
+                    self.__spill(buffer)
+
+                    buffer = []
+                    buffer_size = 0
+
+            # in order...
+            if self.__in_order:
+                for run in self.__runs:
+                    run.seek(0)
+                    yield from (line.rstrip('\n') for line in run)
+
+                yield from (jstr for _, jstr in buffer)
+                return
+
+            # in memory...
+            buffer.sort(key=itemgetter(0), reverse=self.__reverse)
+
+            if not self.__runs:
+                yield from (jstr for _, jstr in buffer)
+                return
+
+            # merge...
+            sources = [self.__run_items(run) for run in self.__runs] + [iter(buffer)]
+
+            for _, jstr in heapq.merge(*sources, key=itemgetter(0), reverse=self.__reverse):
+                yield jstr
+
+        finally:
+            for run in self.__runs:
+                run.close()
+
+            self.__runs = []
+
+
+    def key(self, datum: PathDict):
+        return tuple(datum.node(sort_path) for sort_path in self.__sort_paths)      # KeyError if path not present
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __follows(self, key, prev_key):
+        return key <= prev_key if self.__reverse else key >= prev_key
+
+
+    def __spill(self, buffer):
+        if self.__in_order and self.__runs:
+            run = self.__runs[0]                                            # extend the single, in-order run
+
+        else:
+            if not self.__in_order:
+                buffer.sort(key=itemgetter(0), reverse=self.__reverse)
+
+            run = tempfile.TemporaryFile(mode='w+', dir=self.__spool_dir)
+            self.__runs.append(run)
+            self.__run_count += 1
+
+        run.writelines(jstr + '\n' for _, jstr in buffer)
+
+
+    def __run_items(self, run):
+        run.seek(0)
+
+        for line in run:
+            jstr = line.rstrip('\n')
+
+            yield self.key(PathDict.construct_from_jstr(jstr)), jstr
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def sort_paths(self):
+        return self.__sort_paths
+
+
+    @property
+    def reverse(self):
+        return self.__reverse
+
+
+    @property
+    def budget(self):
+        return self.__budget
+
+
+    @property
+    def document_count(self):
+        return self.__document_count
+
+
+    @property
+    def run_count(self):
+        return self.__run_count
+
+
+    @property
+    def in_order(self):
+        return self.__in_order
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "ExternalSort:{sort_paths:%s, reverse:%s, budget:%s, run_count:%s, in_order:%s}" % \
+               (self.sort_paths, self.reverse, self.budget, self.run_count, self.in_order)
@@ -0,0 +1,177 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+source repo: scs_analysis
+
+An output flush policy for streaming utilities.
+
+* line - the output stream is flushed after every document, as required by live displays and downstream processes
+* block - the output stream is flushed when its buffer of BLOCK_SIZE bytes is full, or INTERVAL seconds have passed
+* auto - line if stdout is a terminal or a socket, otherwise block
+
+In the block mode, stdout is replaced by a TimedFlushStream, which is flushed by a background thread when output has
+been held for INTERVAL seconds - the last documents of a burst are therefore not held until more input arrives.
+"""
+
+import atexit
+import io
+import os
+import stat
+import sys
+import threading
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class FlushPolicy(object):
+    """
+    classdocs
+    """
+
+    LINE = 'line'
+    BLOCK = 'block'
+    AUTO = 'auto'
+
+    POLICIES = (LINE, BLOCK, AUTO)
+
+    BLOCK_SIZE = 64 * 1024                          # bytes
+    INTERVAL = 1.0                                  # seconds
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def construct(cls, policy):
+        if policy not in cls.POLICIES:
+            raise ValueError(policy)
+
+        if policy == cls.AUTO:
+            policy = cls.LINE if cls.is_live(sys.stdout) else cls.BLOCK
+
+        if policy == cls.BLOCK:
+            sys.stdout = TimedFlushStream(cls.__block_buffered(sys.stdout), cls.INTERVAL)
+
+        return cls(sys.stdout, policy)
+
+
+    @staticmethod
+    def is_live(stream):
+        try:
+            fileno = stream.fileno()
+        except (AttributeError, OSError, ValueError):
+            return False
+
+        return os.isatty(fileno) or stat.S_ISSOCK(os.fstat(fileno).st_mode)
+
+
+    @classmethod
+    def __block_buffered(cls, stream):
+        # stdout is re-opened on the same file descriptor, with a larger buffer...
+        try:
+            stream.flush()
+            raw = io.FileIO(stream.fileno(), 'w', closefd=False)
+
+        except (AttributeError, OSError, ValueError):
+            return stream                                               # not a file - leave as is
+
+        return io.TextIOWrapper(io.BufferedWriter(raw, buffer_size=cls.BLOCK_SIZE), encoding=stream.encoding,
+                                errors=stream.errors)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, stream, policy):
+        """
+        Constructor
+        """
+        self.__stream = stream                                          # text stream
+        self.__policy = policy                                          # string
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def flush(self):
+        if self.__policy == self.LINE:
+            self.__stream.flush()                                       # otherwise, flushed by TimedFlushStream
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def policy(self):
+        return self.__policy
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "FlushPolicy:{policy:%s, block_size:%s, interval:%s}" % (self.policy, self.BLOCK_SIZE, self.INTERVAL)
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class TimedFlushStream(object):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, stream, interval):
+        """
+        Constructor
+        """
+        self.__stream = stream                                          # text stream
+        self.__interval = interval                                      # float seconds
+
+        self.__lock = threading.Lock()                                  # Lock - TextIOWrapper is not thread-safe
+        self.__held = False                                             # bool - written since the last flush
+        self.__stopped = threading.Event()                              # Event
+
+        self.__timer = threading.Thread(target=self.__run, name='TimedFlushStream', daemon=True)
+        self.__timer.start()
+
+        atexit.register(self.stop)                                      # before the interpreter flushes stdout
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def write(self, text):
+        with self.__lock:
+            self.__held = True
+            return self.__stream.write(text)
+
+
+    def flush(self):
+        with self.__lock:
+            self.__held = False
+            self.__stream.flush()
+
+
+    def stop(self):
+        self.__stopped.set()
+
+        if self.__timer.is_alive() and self.__timer is not threading.current_thread():
+            self.__timer.join()
+
+
+    def __run(self):
+        while not self.__stopped.wait(self.__interval):
+            if not self.__held:
+                continue
+
+            try:
+                self.flush()
+            except (OSError, ValueError):                               # reported by the main thread's next write
+                return
+
+
+    def __getattr__(self, name):                                        # fileno, buffer, encoding, isatty, etc.
+        return getattr(self.__stream, name)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "TimedFlushStream:{interval:%s, held:%s}" % (self.__interval, self.__held)
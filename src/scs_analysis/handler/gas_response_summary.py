@@ -0,0 +1,82 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+source repo: scs_analysis
+
+The per-device operation of the gas_response_summary utility, performed in-process - equivalent to:
+aws_topic_history.py -p **:/1:00 TOPIC | sample_aggregate.py -m | node.py ... | sample_range.py -u .cnc.
+
+Each call to summarise(..) uses its own TopicHistoryFinder, so calls may be made concurrently.
+"""
+
+from scs_analysis.handler.batch_download_reporter import BatchDownloadReporter
+from scs_analysis.handler.node_filter import NodeFilter
+from scs_analysis.handler.sample_aggregate import SampleAggregate
+from scs_analysis.handler.sample_range import SampleRange
+
+from scs_core.aws.manager.topic_history.topic_history_finder import TopicHistoryFinder
+
+from scs_core.data.path_dict import PathDict
+
+from scs_core.sys.logging import Logging
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class GasResponseSummary(object):
+    """
+    classdocs
+    """
+
+    CHECKPOINT = '**:/1:00'
+
+    NON_ML_GASES = ['val.CO.cnc', 'val.CO2.cnc', 'val.Ox.cnc', 'val.VOC.cnc']
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, token, start, end):
+        """
+        Constructor
+        """
+        self.__token = token                                                # string
+        self.__start = start                                                # LocalizedDatetime
+        self.__end = end                                                    # LocalizedDatetime
+
+        self.__selection = NodeFilter(['tag.mid', 'rec'] + self.NON_ML_GASES + ['exg.src.mid', 'exg.val'])
+        self.__tag = NodeFilter(None, rename=('tag.mid', 'tag'))
+        self.__src = NodeFilter(None, rename=('exg.src.mid', 'exg.src'))
+        self.__range = SampleRange('.cnc.', False, True, 1)
+
+        self.__logger = Logging.getLogger()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def summarise(self, device_tag, topic):
+        finder = TopicHistoryFinder(reporter=BatchDownloadReporter(device_tag))
+        aggregate = SampleAggregate(None, True, 'rec', [])
+
+        for message in finder.find_for_topic(self.__token, topic, self.__start, self.__end, None, False,
+                                             self.CHECKPOINT, False, False, False, False, False, None):
+            aggregate.append(PathDict(message))
+
+        reports = aggregate.close()
+
+        if not reports:
+            self.__logger.info("%s: no data" % device_tag)
+            return None
+
+        datum = self.__selection.datum(reports[0])
+        datum = self.__tag.datum(datum)
+        datum = self.__src.datum(datum)
+
+        return self.__range.datum(datum)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "GasResponseSummary:{start:%s, end:%s, selection:%s, range:%s}" % \
+               (self.__start, self.__end, self.__selection, self.__range)
@@ -0,0 +1,125 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+source repo: scs_analysis
+
+Groups the log records and printed output of tasks that run concurrently in worker threads, so that the output of
+each task can be released as a block, in the order in which the tasks were submitted.
+
+While attached, the GroupedOutput holds back any log record emitted by a thread that is running a task - including
+records emitted by library code - and replays it to the same handler when the task's result is collected. Output
+that a task prints via the GroupedOutput is held back in the same way. Records from other threads, and output printed
+when no task is running, pass through immediately.
+"""
+
+import logging
+import sys
+import threading
+
+from functools import partial
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class GroupedOutput(object):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self):
+        """
+        Constructor
+        """
+        self.__local = threading.local()                        # threading.local
+        self.__filters = []                                     # list of (logging.Handler, callable)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def attach(self, logger=None):
+        logger = logging.getLogger() if logger is None else logger
+
+        for handler in logger.handlers:
+            hold = partial(self.__hold, handler)
+
+            handler.addFilter(hold)
+            self.__filters.append((handler, hold))
+
+
+    def detach(self):
+        for handler, hold in self.__filters:
+            handler.removeFilter(hold)
+
+        self.__filters = []
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def submit(self, executor, func, *args):                    # returns Future
+        return executor.submit(self.__run, func, *args)
+
+
+    def collect(self, future):                                  # returns the result of the task
+        entries, result, error = future.result()
+
+        for entry in entries:
+            entry()
+
+        if error is not None:
+            raise error
+
+        return result
+
+
+    def print(self, *objects, sep=' ', file=None):
+        file = sys.stdout if file is None else file
+        entries = getattr(self.__local, 'entries', None)
+
+        if entries is None:
+            self.__print(objects, sep, file)
+            return
+
+        entries.append(partial(self.__print, objects, sep, file))
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __run(self, func, *args):
+        entries = []
+        self.__local.entries = entries
+
+        try:
+            return entries, func(*args), None
+
+        except BaseException as ex:                             # includes SystemExit, re-raised on collection
+            return entries, None, ex
+
+        finally:
+            self.__local.entries = None
+
+
+    def __hold(self, handler, record):
+        entries = getattr(self.__local, 'entries', None)
+
+        if entries is None:
+            return True
+
+        entries.append(partial(handler.handle, record))
+
+        return False
+
+
+    @staticmethod
+    def __print(objects, sep, file):
+        print(*objects, sep=sep, file=file)
+        file.flush()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "GroupedOutput:{handlers:%s}" % len(self.__filters)
@@ -0,0 +1,236 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+source repo: scs_analysis
+
+A hash join equivalent of scs_core Join, for left and right sets in any order.
+
+Only one set - the indexed set - is held in memory. The other set is streamed against it, and each of its documents is
+output as it is read. Documents with duplicate primary keys are collapsed in the indexed set - the last document for
+each key is retained - but each document of the streamed set is joined separately. Documents of the indexed set that
+are required by the join, but which match no streamed document, are output at the end, in the order of the set.
+
+Where a tolerance is given, each document of the anchor set (the right set for RIGHT joins, otherwise the left set) is
+matched to the document of the other set with the nearest primary key within the tolerance - earlier keys are
+preferred where two are equally near. The other set must then be the indexed set, and its keys are also held as a
+sorted list, which is searched by bisection.
+
+https://en.wikipedia.org/wiki/Hash_join
+"""
+
+from bisect import bisect_left
+
+from scs_core.data.datetime import LocalizedDatetime
+from scs_core.data.path_dict import PathDict
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class IndexedJoin(object):
+    """
+    classdocs
+    """
+
+    SIDES = ('left', 'right')
+
+    @staticmethod
+    def indexed_side(join_type, tolerance, left_size, right_size):
+        # nearest matches must be found for each anchor, so it is the other set that is indexed...
+        if tolerance is not None:
+            return 'left' if join_type.upper() == 'RIGHT' else 'right'
+
+        return 'left' if left_size < right_size else 'right'
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, join_type, left_set_path, left_pk_path, right_set_path, right_pk_path, pk_is_iso8601,
+                 indexed='right', tolerance=None):
+        """
+        Constructor
+        """
+        if indexed not in self.SIDES:
+            raise ValueError("indexed must be one of %s" % (self.SIDES, ))
+
+        if tolerance is not None and indexed != self.indexed_side(join_type, tolerance, 0, 0):
+            raise ValueError("the anchor set may not be indexed when a tolerance is given")
+
+        self.__join_type = join_type.upper()                                # string
+        self.__left_set_path = left_set_path                                # string
+        self.__left_pk_path = left_pk_path                                  # string
+        self.__right_set_path = right_set_path                              # string
+        self.__right_pk_path = right_pk_path                                # string
+        self.__pk_is_iso8601 = bool(pk_is_iso8601)                          # bool
+        self.__indexed = indexed                                            # string
+        self.__tolerance = tolerance                                        # float seconds or None
+
+        self.__left_count = 0                                               # int
+        self.__right_count = 0                                              # int
+        self.__index_size = 0                                               # int
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def join(self, left_documents, right_documents):                        # yields PathDict
+        left_indexed = self.__indexed == 'left'
+
+        if left_indexed:
+            index = self.__index(left_documents, self.__left_pk_path, 'left')
+            streamed = (self.__keyed(document, self.__right_pk_path, 'right') for document in right_documents)
+
+        else:
+            index = self.__index(right_documents, self.__right_pk_path, 'right')
+            streamed = (self.__keyed(document, self.__left_pk_path, 'left') for document in left_documents)
+
+        self.__index_size = len(index)
+
+        keys = None if self.__tolerance is None else sorted(index)
+        matched = set()
+
+        # which unmatched documents does the join require?
+        full = self.__join_type == 'FULL'
+        left_outer = self.__join_type == 'LEFT'
+        right_outer = self.__join_type == 'RIGHT'
+
+        unmatched_streamed = full or (left_outer and not left_indexed) or (right_outer and left_indexed)
+        unmatched_indexed = full or (left_outer and left_indexed) or (right_outer and not left_indexed)
+
+        # streamed...
+        for key, pk, document in streamed:
+            match_key = self.__match(index, keys, key)
+
+            if match_key is None:
+                if unmatched_streamed:
+                    yield self.__pair(None, (pk, document), left_indexed)
+
+                continue
+
+            matched.add(match_key)
+
+            yield self.__pair(index[match_key], (pk, document), left_indexed)
+
+        if not unmatched_indexed:
+            return
+
+        # indexed...
+        for key, indexed in index.items():
+            if key not in matched:
+                yield self.__pair(indexed, None, left_indexed)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __index(self, documents, pk_path, name):                            # dict of key: (pk, PathDict)
+        index = {}
+
+        for document in documents:
+            key, pk, document = self.__keyed(document, pk_path, name)
+            index[key] = (pk, document)                                     # the last duplicate is retained
+
+        return index
+
+
+    def __keyed(self, document, pk_path, name):
+        pk = document.node(pk_path)
+
+        if name == 'left':
+            self.__left_count += 1
+        else:
+            self.__right_count += 1
+
+        if not self.__pk_is_iso8601:
+            return pk, pk, document
+
+        pk = LocalizedDatetime.construct_from_iso8601(pk)
+
+        if pk is None:
+            raise ValueError("invalid pk '%s' in %s set: %s" % (document.node(pk_path), name, document))
+
+        return pk.timestamp(), pk, document
+
+
+    def __match(self, index, keys, key):
+        if keys is None:
+            return key if key in index else None
+
+        position = bisect_left(keys, key)
+        nearest = None
+
+        for candidate in (position - 1, position):
+            if candidate < 0 or candidate >= len(keys):
+                continue
+
+            distance = abs(keys[candidate] - key)
+
+            if distance <= self.__tolerance and (nearest is None or distance < abs(keys[nearest] - key)):
+                nearest = candidate
+
+        return None if nearest is None else keys[nearest]
+
+
+    def __pair(self, indexed, streamed, left_indexed):
+        if left_indexed:
+            return self.__union(indexed, streamed)
+
+        return self.__union(streamed, indexed)
+
+
+    def __union(self, left, right):
+        if self.__join_type == 'RIGHT':
+            pk_path, pk = self.__right_pk_path, right[0]
+
+        else:
+            pk_path, pk = self.__left_pk_path, (right if left is None else left)[0]
+
+        return PathDict.union((pk_path, pk),
+                              (self.__left_set_path, self.__content(left, self.__left_pk_path)),
+                              (self.__right_set_path, self.__content(right, self.__right_pk_path)))
+
+
+    @staticmethod
+    def __content(row, pk_path):
+        if row is None:
+            return None
+
+        _, document = row
+        node = PathDict()
+
+        for path in document.paths():
+            if path != pk_path:
+                node.append(path, document.node(path))
+
+        return node
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def indexed(self):
+        return self.__indexed
+
+
+    @property
+    def left_count(self):
+        return self.__left_count
+
+
+    @property
+    def right_count(self):
+        return self.__right_count
+
+
+    @property
+    def index_size(self):
+        return self.__index_size
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "IndexedJoin:{join_type:%s, left:%s, right:%s, pk_is_iso8601:%s, indexed:%s, tolerance:%s, " \
+               "left_count:%s, right_count:%s, index_size:%s}" % \
+               (self.__join_type, (self.__left_set_path, self.__left_pk_path),
+                (self.__right_set_path, self.__right_pk_path), self.__pk_is_iso8601, self.indexed, self.__tolerance,
+                self.left_count, self.right_count, self.index_size)
@@ -0,0 +1,219 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+source repo: scs_analysis
+
+The per-document rename / merge / include / exclude operations of the node utility.
+
+The path matching for the rename, merge and exclude operations depends only on the leaf paths of a document, so it is
+performed once for each document shape (schema), and the resulting plan is cached for the documents that follow. Plans
+are lists of leaf paths - with target paths or merge steps, where required - so that only node access is performed
+for each document.
+"""
+
+from scs_core.data.path_dict import PathDict
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class NodeFilter(object):
+    """
+    classdocs
+    """
+
+    MAX_PLANS = 1024                                    # per operation - the cache is cleared when exceeded
+
+    __COPY = 0                                          # merge steps...
+    __INSERT_A = 1
+    __JOIN = 2
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def construct_from_cmd(cls, cmd):
+        rename = (cmd.rename_from, cmd.rename_to) if cmd.rename else None
+        merge = (cmd.merge_a, cmd.merge_b, cmd.merge_join) if cmd.merge else None
+        sub_paths = cmd.sub_paths if cmd.has_sub_paths() else None
+
+        return cls(sub_paths, exclude=cmd.exclude, rename=rename, merge=merge)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, sub_paths, exclude=False, rename=None, merge=None):
+        """
+        Constructor
+        """
+        self.__sub_paths = sub_paths                    # list of string or None (all nodes)
+        self.__exclude = bool(exclude)                  # bool
+        self.__rename = rename                          # (from, to) or None
+        self.__merge = merge                            # (a, b, join) or None
+
+        self.__rename_plans = {}                        # dict of schema: list of (path, target path)
+        self.__merge_plans = {}                         # dict of schema: list of (step, path)
+        self.__exclude_plans = {}                       # dict of schema: list of path
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def datum(self, datum: PathDict):
+        if self.__exclude and not self.__sub_paths:
+            return None                                 # everything is excluded
+
+        if self.__rename:
+            datum = self.__renamed(datum)
+
+        if self.__merge:
+            datum = self.__merged(datum)
+
+        if not self.__sub_paths:
+            return datum                                # everything is included
+
+        target = PathDict()
+
+        if self.__exclude:
+            # use datum field ordering...
+            for path in self.__plan(self.__exclude_plans, datum, self.__exclude_plan):
+                target.append(path, datum.node(path))
+
+        else:
+            # use sub_paths field ordering...
+            for sub_path in self.__sub_paths:
+                if datum.has_sub_path(sub_path):
+                    target.append(sub_path, datum.node(sub_path))
+
+        return target
+
+
+    def includes(self, path):
+        for sub_path in self.__sub_paths:
+            if PathDict.sub_path_includes_path(sub_path, path):
+                return not self.__exclude
+
+        return self.__exclude
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __renamed(self, datum):
+        if not datum.has_sub_path(sub_path=self.__rename[0]):
+            return datum
+
+        target = PathDict()
+
+        for path, target_path in self.__plan(self.__rename_plans, datum, self.__rename_plan):
+            target.append(target_path, datum.node(path))
+
+        return target
+
+
+    def __merged(self, datum):
+        merge_a, merge_b, merge_join = self.__merge
+
+        if not (datum.has_sub_path(sub_path=merge_a) and datum.has_sub_path(sub_path=merge_b)):
+            return datum
+
+        target = PathDict()
+
+        for step, path in self.__plan(self.__merge_plans, datum, self.__merge_plan):
+            if step == self.__COPY:
+                target.append(path, datum.node(path))
+
+            elif step == self.__INSERT_A:
+                target.append(merge_a, datum.node(merge_a))                             # insert A
+
+            else:
+                target.append(merge_a, merge_join.join((datum.node(merge_a), datum.node(merge_b))))   # update A
+
+        return target
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __plan(self, plans, datum, compile_plan):
+        schema = tuple(datum.paths())
+
+        try:
+            return plans[schema]
+        except KeyError:
+            pass
+
+        if len(plans) >= self.MAX_PLANS:
+            plans.clear()
+
+        plan = plans[schema] = compile_plan(schema)
+
+        return plan
+
+
+    def __exclude_plan(self, paths):
+        return [path for path in paths if self.includes(path)]
+
+
+    def __rename_plan(self, paths):
+        rename_from, rename_to = self.__rename
+        rename_len = len(rename_from)
+
+        plan = []
+
+        for path in paths:
+            rename_from_match = PathDict.sub_path_includes_path(rename_from, path)
+
+            target_path = rename_to + path[rename_len:] if rename_from_match else path
+            plan.append((path, target_path))
+
+        return plan
+
+
+    def __merge_plan(self, paths):
+        merge_a, merge_b, _ = self.__merge
+
+        plan = []
+        a_found = False
+        b_found = False
+        merged = False
+
+        for path in paths:
+            merge_a_match = PathDict.sub_path_includes_path(merge_a, path)
+            merge_b_match = PathDict.sub_path_includes_path(merge_b, path)
+
+            if not (merge_a_match or merge_b_match):
+                plan.append((self.__COPY, path))
+                continue
+
+            if merged:
+                continue
+
+            if merge_a_match:
+                plan.append((self.__INSERT_A, None))
+                a_found = True
+
+            if merge_b_match:
+                b_found = True
+
+            if a_found and b_found:
+                plan.append((self.__JOIN, None))
+                merged = True
+
+        return plan
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def sub_paths(self):
+        return self.__sub_paths
+
+
+    @property
+    def exclude(self):
+        return self.__exclude
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "NodeFilter:{sub_paths:%s, exclude:%s, rename:%s, merge:%s}" % \
+               (self.sub_paths, self.exclude, self.__rename, self.__merge)
@@ -0,0 +1,472 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+source repo: scs_analysis
+
+In-process equivalents of the streaming utilities, for use by the pipeline utility. Documents are passed between
+stages as PathDict instances, so no JSON parsing or serialisation is performed between stages.
+"""
+
+import csv
+import os
+import shlex
+import sys
+
+from abc import ABC, abstractmethod
+
+from scs_analysis.cmd.cmd_csv_reader import CmdCSVReader
+from scs_analysis.cmd.cmd_csv_writer import CmdCSVWriter
+from scs_analysis.cmd.cmd_node import CmdNode
+from scs_analysis.cmd.cmd_sample_aggregate import CmdSampleAggregate
+from scs_analysis.cmd.cmd_sample_range import CmdSampleRange
+
+from scs_analysis.handler.csv_header_scan_writer import CSVHeaderScanWriter
+from scs_analysis.handler.node_filter import NodeFilter
+from scs_analysis.handler.sample_aggregate import SampleAggregate
+from scs_analysis.handler.sample_range import SampleRange
+
+from scs_core.csv.csv_dict import CSVDict, CSVHeader
+from scs_core.csv.csv_writer import CSVWriter
+
+from scs_core.data.checkpoint_generator import CheckpointGenerator
+from scs_core.data.json import JSONify
+from scs_core.data.path_dict import PathDict
+
+from scs_core.sys.logging import Logging
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class PipelineStage(ABC):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @staticmethod
+    def utilities():
+        return sorted(_STAGES.keys())
+
+
+    @staticmethod
+    def construct(specification):
+        tokens = shlex.split(specification)
+
+        if not tokens:
+            raise ValueError(specification)
+
+        utility = os.path.basename(tokens[0])
+
+        try:
+            stage_class = _STAGES[utility]
+        except KeyError:
+            raise ValueError(utility)
+
+        try:
+            return stage_class.construct_from_args(tokens[1:])
+        except SystemExit:                                  # optparse has already reported the error
+            raise ValueError(specification)
+
+
+    @classmethod
+    @abstractmethod
+    def construct_from_args(cls, args):
+        pass
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def is_source(cls):
+        return False
+
+
+    @classmethod
+    def is_sink(cls):
+        return False
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @abstractmethod
+    def process(self, datum: PathDict):                 # returns iterable of PathDict
+        pass
+
+
+    def close(self):                                    # returns iterable of PathDict
+        return []
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class NodeStage(PipelineStage):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def construct_from_args(cls, args):
+        cmd = CmdNode(args=args)
+
+        if not cmd.is_valid() or cmd.array or cmd.binary or cmd.sequence or cmd.filename or \
+                cmd.indent is not None:
+            raise ValueError(' '.join(args))
+
+        return cls(NodeFilter.construct_from_cmd(cmd))
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, node_filter):
+        """
+        Constructor
+        """
+        self.__node_filter = node_filter                # NodeFilter
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def process(self, datum: PathDict):
+        target = self.__node_filter.datum(datum)
+
+        return [target] if target else []               # skip empty outputs
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "NodeStage:{node_filter:%s}" % self.__node_filter
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class SampleAggregateStage(PipelineStage):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def construct_from_args(cls, args):
+        cmd = CmdSampleAggregate(args=args)
+
+        if not cmd.is_valid() or not cmd.is_valid_interval():
+            raise ValueError(' '.join(args))
+
+        if cmd.checkpoint and not CheckpointGenerator.is_valid(cmd.checkpoint):
+            raise ValueError(cmd.checkpoint)
+
+        return cls(SampleAggregate.construct_from_cmd(cmd))
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, sample_aggregate):
+        """
+        Constructor
+        """
+        self.__sample_aggregate = sample_aggregate      # SampleAggregate or GroupedSampleAggregate
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def process(self, datum: PathDict):
+        return self.__sample_aggregate.append(datum)
+
+
+    def close(self):
+        return self.__sample_aggregate.close()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "SampleAggregateStage:{sample_aggregate:%s}" % self.__sample_aggregate
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class SampleRangeStage(PipelineStage):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def construct_from_args(cls, args):
+        cmd = CmdSampleRange(args=args)
+
+        if not cmd.is_valid():
+            raise ValueError(' '.join(args))
+
+        return cls(SampleRange.construct_from_cmd(cmd))
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, sample_range):
+        """
+        Constructor
+        """
+        self.__sample_range = sample_range              # SampleRange
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def process(self, datum: PathDict):
+        return [self.__sample_range.datum(datum)]
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "SampleRangeStage:{sample_range:%s}" % self.__sample_range
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class CSVReaderStage(PipelineStage):
+    """
+    classdocs
+    """
+
+    __REPRESENTATIONS_OF_NULL = ('', 'NULL')
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def construct_from_args(cls, args):
+        cmd = CmdCSVReader(args=args)
+
+        if cmd.array or cmd.binary or cmd.jobs > 1:
+            raise ValueError(' '.join(args))
+
+        return cls(cmd.filenames, cmd.cast, cmd.nullify, cmd.limit)
+
+
+    @classmethod
+    def is_source(cls):
+        return True
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @staticmethod
+    def __recast(value):
+        try:
+            return int(value)
+        except ValueError:
+            pass
+
+        try:
+            return float(value)
+        except ValueError:
+            pass
+
+        if value.upper() == 'TRUE':
+            return True
+
+        if value.upper() == 'FALSE':
+            return False
+
+        return value
+
+
+    @classmethod
+    def __renullify(cls, value):
+        return None if value.upper() in cls.__REPRESENTATIONS_OF_NULL else value
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, filenames, cast, nullify, limit):
+        """
+        Constructor
+        """
+        self.__filenames = filenames                    # list of string (None for stdin)
+        self.__cast = bool(cast)                        # bool
+        self.__nullify = bool(nullify)                  # bool
+        self.__limit = limit                            # int or None
+
+        self.__logger = Logging.getLogger()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def documents(self):
+        for filename in self.__filenames:
+            file = sys.stdin if filename is None else open(filename)
+            rows = 0
+
+            try:
+                reader = csv.reader(file, quoting=csv.QUOTE_ALL, skipinitialspace=True)
+
+                try:
+                    header = CSVHeader.construct_from_paths(next(reader))
+                except StopIteration:                                           # no input
+                    continue
+
+                for row in reader:
+                    if len(row) == 0:
+                        continue
+
+                    if self.__limit is not None and rows >= self.__limit:
+                        break
+
+                    if self.__nullify:
+                        row = [self.__renullify(cell) for cell in row]
+
+                    if self.__cast:
+                        row = [None if cell is None else self.__recast(cell) for cell in row]
+
+                    yield PathDict(header.as_dict(row))
+
+                    rows += 1
+
+            except csv.Error as ex:                                             # typically a badly-closed CSV file
+                self.__logger.info("ending file on row %d: %s" % (rows, ex))    # as csv_reader
+                continue
+
+            finally:
+                if filename is not None:
+                    file.close()
+
+
+    def process(self, datum: PathDict):
+        return [datum]
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "CSVReaderStage:{filenames:%s, cast:%s, nullify:%s, limit:%s}" % \
+               (self.__filenames, self.__cast, self.__nullify, self.__limit)
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class CSVWriterStage(PipelineStage):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def construct_from_args(cls, args):
+        cmd = CmdCSVWriter(args=args)
+
+        if not cmd.is_valid():
+            raise ValueError(' '.join(args))
+
+        return cls(cmd.filename, cmd.append, cmd.exclude_header, cmd.header_scan, cmd.quote_all, cmd.limit,
+                   cmd.echo)
+
+
+    @classmethod
+    def is_sink(cls):
+        return True
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, filename, append, exclude_header, header_scan, quote_all, limit, echo):
+        """
+        Constructor
+        """
+        self.__filename = filename                      # string or None (stdout)
+        self.__limit = limit                            # int or None
+        self.__echo = bool(echo)                        # bool
+
+        self.__count = 0                                # int
+
+        # the in-process writer handles new files - header scans and appends are delegated...
+        if header_scan:
+            append = append and filename is not None and os.path.isfile(filename)
+            self.__writer = CSVHeaderScanWriter(filename=filename, append=append, quote_all=quote_all)
+            self.__file = None
+
+        elif append and filename and os.path.isfile(filename):
+            self.__writer = CSVWriter(filename=filename, append=append, exclude_header=exclude_header,
+                                      quote_all=quote_all)
+            self.__file = None
+
+        else:
+            self.__writer = None
+            self.__file = sys.stdout if filename is None else open(filename, 'w', newline='')
+
+            self.__csv = csv.writer(self.__file, quoting=csv.QUOTE_ALL if quote_all else csv.QUOTE_MINIMAL)
+            self.__exclude_header = exclude_header or (append and filename is None)
+            self.__paths = None
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def process(self, datum: PathDict):
+        if self.__limit is not None and self.__count >= self.__limit:
+            return []
+
+        jstr = JSONify.dumps(datum) if self.__writer is not None or self.__echo else None
+
+        if self.__writer is not None:
+            self.__writer.write(jstr)
+
+        else:
+            row = CSVDict(datum)
+
+            if self.__paths is None:
+                self.__paths = row.paths()
+
+                if not self.__exclude_header:
+                    self.__csv.writerow(self.__paths)
+
+            self.__csv.writerow(row.row(self.__paths))
+
+        if self.__echo:
+            print(jstr)
+
+        self.__count += 1
+
+        return []
+
+
+    def close(self):
+        if self.__writer is not None:
+            self.__writer.close()
+
+        elif self.__filename is not None:
+            self.__file.close()
+
+        return []
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def count(self):
+        return self.__count
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "CSVWriterStage:{filename:%s, limit:%s, echo:%s, writer:%s}" % \
+               (self.__filename, self.__limit, self.__echo, self.__writer)
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+_STAGES = {
+    'csv_reader.py': CSVReaderStage,
+    'csv_writer.py': CSVWriterStage,
+    'node.py': NodeStage,
+    'sample_aggregate.py': SampleAggregateStage,
+    'sample_range.py': SampleRangeStage
+}
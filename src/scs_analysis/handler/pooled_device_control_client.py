@@ -0,0 +1,77 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+source repo: scs_analysis
+
+A DeviceControlClient that holds its connections to the device control API in a pool, so that successive and
+concurrent interactions do not each open a new HTTPS connection. The client may be shared by threads - the pool
+should be at least as large as the number of threads.
+"""
+
+import json
+import requests
+
+from requests.adapters import HTTPAdapter
+
+from scs_core.aws.client.device_control_client import DeviceControlClient, Endpoint
+
+from scs_core.control.control_receipt import ControlReceipt
+
+from scs_core.data.json import JSONify
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class PooledDeviceControlClient(DeviceControlClient):
+    """
+    classdocs
+    """
+
+    DEFAULT_POOL_SIZE = 10
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, pool_size=DEFAULT_POOL_SIZE):
+        """
+        Constructor
+        """
+        super().__init__()
+
+        self.__pool_size = pool_size                            # int
+
+        self.__session = requests.Session()                     # Session
+        self.__session.mount('https://', HTTPAdapter(pool_connections=1, pool_maxsize=pool_size))
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def interact(self, token, device_tag, cmd_tokens):
+        payload = {
+            'device-tag': device_tag,
+            'message': [str(token) for token in cmd_tokens]
+        }
+
+        response = self.__session.post(Endpoint.url(), headers=self._token_headers(token),
+                                       data=JSONify.dumps(payload))
+        self._check_response(response)
+
+        return ControlReceipt.construct_from_jdict(json.loads(response.json()))
+
+
+    def close(self):
+        self.__session.close()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def pool_size(self):
+        return self.__pool_size
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "PooledDeviceControlClient:{pool_size:%s}" % self.pool_size
@@ -0,0 +1,156 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+source repo: scs_analysis
+
+A rolling median filter, equivalent to scs_core MedianFilter, with an update cost of O(log w) for a window of w.
+
+The window is held on two heaps - a max-heap of the lower half, and a min-heap of the upper half - such that the
+median is the top of the lower heap. Values leaving the window are not searched for: they are recorded, and discarded
+only when they reach the top of their heap (lazy deletion), or when the heaps are compacted. Each value is sequenced
+on entry, so that equal values are strictly ordered.
+
+As with MedianFilter, the window size must be odd, and values are passed through until the window is full.
+
+https://en.wikipedia.org/wiki/Median_filter
+"""
+
+import heapq
+
+from collections import deque
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class RollingMedian(object):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, window_size):
+        """
+        Constructor
+        """
+        if window_size % 2 == 0:
+            raise ValueError("window_size must be an odd number")
+
+        self.__window_size = window_size                            # int
+
+        self.__window = deque()                                     # deque of (number, int)
+        self.__lower = []                                           # heap of (negated number, negated int)
+        self.__upper = []                                           # heap of (number, int)
+
+        self.__lower_count = 0                                      # int (excluding deleted entries)
+        self.__upper_count = 0                                      # int (excluding deleted entries)
+
+        self.__deleted = set()                                      # set of int
+        self.__sequence = 0                                         # int
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def compute(self, x):
+        full = len(self.__window) == self.__window_size
+
+        # entries are sequenced, so that equal values are ordered, and each entry can be deleted exactly...
+        entry = (x, self.__sequence)
+        self.__sequence += 1
+
+        self.__window.append(entry)
+        self.__insert(entry)
+
+        # window is not full...
+        if not full:
+            return x
+
+        # window is full...
+        self.__delete(self.__window.popleft())
+
+        return -self.__lower[0][0]
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __insert(self, entry):
+        if not self.__lower or entry < self.__negated(self.__lower[0]):
+            heapq.heappush(self.__lower, self.__negated(entry))
+            self.__lower_count += 1
+
+        else:
+            heapq.heappush(self.__upper, entry)
+            self.__upper_count += 1
+
+        self.__balance()
+
+
+    def __delete(self, entry):
+        self.__deleted.add(entry[1])
+
+        if entry <= self.__negated(self.__lower[0]):
+            self.__lower_count -= 1
+            self.__prune(self.__lower, -1)
+
+        else:
+            self.__upper_count -= 1
+            self.__prune(self.__upper, 1)
+
+        self.__balance()
+
+        # deleted entries that never reach the top of a heap are discarded when they outnumber those in the window...
+        if len(self.__deleted) > self.__window_size:
+            self.__compact()
+
+
+    def __balance(self):
+        # the lower heap holds the median, and at most one more entry than the upper heap...
+        if self.__lower_count > self.__upper_count + 1:
+            heapq.heappush(self.__upper, self.__negated(heapq.heappop(self.__lower)))
+            self.__lower_count -= 1
+            self.__upper_count += 1
+
+            self.__prune(self.__lower, -1)
+
+        elif self.__lower_count < self.__upper_count:
+            heapq.heappush(self.__lower, self.__negated(heapq.heappop(self.__upper)))
+            self.__lower_count += 1
+            self.__upper_count -= 1
+
+            self.__prune(self.__upper, 1)
+
+
+    def __prune(self, heap, sign):
+        while heap and sign * heap[0][1] in self.__deleted:
+            self.__deleted.remove(sign * heapq.heappop(heap)[1])
+
+
+    def __compact(self):
+        self.__lower = [item for item in self.__lower if -item[1] not in self.__deleted]
+        self.__upper = [item for item in self.__upper if item[1] not in self.__deleted]
+
+        heapq.heapify(self.__lower)
+        heapq.heapify(self.__upper)
+
+        self.__deleted.clear()
+
+
+    @staticmethod
+    def __negated(entry):
+        return -entry[0], -entry[1]
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def window_size(self):
+        return self.__window_size
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "RollingMedian:{window_size:%s, window_count:%s, deleted:%s}" % \
+               (self.window_size, len(self.__window), len(self.__deleted))
@@ -0,0 +1,154 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+source repo: scs_analysis
+
+An incremental equivalent of the slope function of scs_core LinearRegression, for rolling slopes.
+
+Running sums of x, y, x * x and x * y are maintained as samples are appended and, where a tally is set, removed from
+the window, so that each update costs O(1) rather than O(tally). To limit the accumulation of rounding error, the sums
+are recomputed - relative to the oldest sample in the window - each time the window has been replaced.
+"""
+
+from collections import deque
+
+from scs_core.data.datetime import LocalizedDatetime
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class RunningRegression(object):
+    """
+    classdocs
+    """
+
+    MIN_DATA_POINTS = 2
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, tally=None):
+        """
+        Constructor
+        """
+        self.__tally = tally                                        # number of rolling samples (None for all samples)
+
+        self.__data = deque()                                       # deque of (float, float)
+        self.__origin = None                                        # float timestamp
+
+        self.__sum_x = 0.0                                          # float
+        self.__sum_y = 0.0                                          # float
+        self.__sum_x2 = 0.0                                         # float
+        self.__sum_xy = 0.0                                         # float
+
+        self.__evictions = 0                                        # int
+
+
+    def __len__(self):
+        return len(self.__data)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def has_regression(self):
+        return len(self) >= self.MIN_DATA_POINTS
+
+
+    def append(self, rec: LocalizedDatetime, value):
+        if self.__origin is None:
+            self.__origin = rec.timestamp()
+
+        x = rec.timestamp() - self.__origin
+        y = float(value)
+
+        # remove oldest?
+        if self.__tally is not None and len(self) == self.__tally:
+            old_x, old_y = self.__data.popleft()
+
+            self.__sum_x -= old_x
+            self.__sum_y -= old_y
+            self.__sum_x2 -= old_x * old_x
+            self.__sum_xy -= old_x * old_y
+
+            self.__evictions += 1
+
+        # append...
+        self.__data.append((x, y))
+
+        self.__sum_x += x
+        self.__sum_y += y
+        self.__sum_x2 += x * x
+        self.__sum_xy += x * y
+
+        if self.__evictions >= len(self):
+            self.__rebase()
+
+
+    def reset(self):
+        self.__data.clear()
+        self.__origin = None
+
+        self.__sum_x = 0.0
+        self.__sum_y = 0.0
+        self.__sum_x2 = 0.0
+        self.__sum_xy = 0.0
+
+        self.__evictions = 0
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def slope(self, default=None, precision=None):
+        # validation...
+        if not self.has_regression():
+            return default
+
+        n = len(self)
+
+        # compute...
+        d_x = (self.__sum_x2 * n) - (self.__sum_x * self.__sum_x)
+        d_y = (self.__sum_xy * n) - (self.__sum_x * self.__sum_y)
+
+        slope = d_y / d_x
+
+        if precision is None:
+            return slope
+
+        return round(slope, precision) + 0.0                    # rounding error on a flat series should not give -0.0
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __rebase(self):
+        # move the origin to the oldest sample, and recompute the sums exactly...
+        offset = self.__data[0][0]
+
+        self.__data = deque((x - offset, y) for x, y in self.__data)
+        self.__origin += offset
+
+        self.__sum_x = 0.0
+        self.__sum_y = 0.0
+        self.__sum_x2 = 0.0
+        self.__sum_xy = 0.0
+
+        for x, y in self.__data:
+            self.__sum_x += x
+            self.__sum_y += y
+            self.__sum_x2 += x * x
+            self.__sum_xy += x * y
+
+        self.__evictions = 0
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def tally(self):
+        return self.__tally
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "RunningRegression:{tally:%s, count:%s, origin:%s}" % (self.tally, len(self), self.__origin)
@@ -0,0 +1,400 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+source repo: scs_analysis
+
+The checkpoint-driven aggregation state machine of the sample_aggregate utility.
+
+GroupedSampleAggregate maintains an independent SampleAggregate for each value of a group path, such as the device
+tag, in order of first appearance. Reports are held until no known group can report an earlier checkpoint, and are
+then released in checkpoint order.
+
+Since input is in rec order across all groups, a group whose open checkpoint precedes the rec of the current datum -
+from whichever group - can have no further data for that checkpoint. Its report is then made at once, so that groups
+that stop reporting do not hold back the reports of the others. A datum that arrives out of order, after its group's
+checkpoint has been reported, is discarded and logged.
+"""
+
+import heapq
+
+from scs_core.data.aggregate import Aggregate
+from scs_core.data.checkpoint_generator import CheckpointGenerator
+from scs_core.data.datetime import LocalizedDatetime
+from scs_core.data.json import JSONify
+from scs_core.data.path_dict import PathDict
+
+from scs_core.sys.logging import Logging
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class SampleAggregate(object):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def construct_from_cmd(cls, cmd):
+        rule_interval = None if cmd.ignore_rule() else cmd.rule_interval
+
+        if cmd.group_by:
+            return GroupedSampleAggregate(cmd.group_by, cmd.checkpoint, cmd.min_max, cmd.iso, cmd.nodes,
+                                          rule_interval=rule_interval, exclude_remainder=cmd.exclude_remainder)
+
+        return cls(cmd.checkpoint, cmd.min_max, cmd.iso, cmd.nodes, rule_interval=rule_interval,
+                   exclude_remainder=cmd.exclude_remainder)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, checkpoint, min_max, iso, nodes, rule_interval=None, exclude_remainder=False):
+        """
+        Constructor
+        """
+        self.__iso = iso                                                    # string
+        self.__rule_interval = rule_interval                                # Timedelta or None
+        self.__exclude_remainder = bool(exclude_remainder)                  # bool
+
+        self.__generator = CheckpointGenerator.construct(checkpoint) if checkpoint else None
+        self.__aggregate = Aggregate(min_max, iso, nodes)
+
+        self.__rec = None                                                   # LocalizedDatetime
+        self.__prev_rec = None                                              # LocalizedDatetime
+        self.__checkpoint = None                                            # LocalizedDatetime
+        self.__prev_checkpoint = None                                       # LocalizedDatetime
+        self.__expired = False                                              # bool
+
+        self.__processed_count = 0                                          # int
+        self.__output_count = 0                                             # int
+        self.__rejected_count = 0                                           # int
+        self.__late_count = 0                                               # int
+
+        self.__logger = Logging.getLogger()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def append(self, datum: PathDict):
+        reports = []
+
+        try:
+            rec_node = datum.node(self.__iso)
+        except KeyError:
+            return reports
+
+        rec = LocalizedDatetime.construct_from_iso8601(rec_node)
+        self.__rec = rec
+
+        # set checkpoint...
+        if self.__generator and self.__checkpoint is None:
+            self.__prev_checkpoint = self.__generator.prev_localised_datetime(rec)
+            self.__checkpoint = self.__generator.next_localised_datetime(rec)
+
+        # report and reset...
+        if self.__checkpoint and rec > self.__checkpoint:
+            if not self.__expired:
+                self.__report(reports)
+
+            self.__aggregate.reset()
+            self.__expired = False
+
+            if self.__generator:
+                self.__prev_checkpoint = self.__checkpoint
+                self.__checkpoint = self.__generator.enclosing_localised_datetime(rec)
+
+        # late for a checkpoint that has already been reported?...
+        if self.__expired:
+            self.__logger.info("discarding late datum: %s" % rec_node)
+            self.__late_count += 1
+            return reports
+
+        # duplicate recs?...
+        if rec == self.__prev_rec:
+            self.__logger.info("discarding duplicate: %s" % rec_node)
+            return reports
+
+        # append sample...
+        self.__aggregate.append(rec, datum)
+
+        self.__prev_rec = rec
+        self.__processed_count += 1
+
+        return reports
+
+
+    def expire(self, rec):
+        reports = []
+
+        # report the open checkpoint early, if the rec shows that it is complete...
+        if self.__expired or self.__checkpoint is None or not rec > self.__checkpoint:
+            return reports
+
+        self.__report(reports)
+        self.__aggregate.reset()
+
+        self.__expired = True
+
+        return reports
+
+
+    def close(self):
+        reports = []
+
+        # report remainder...
+        if self.__generator is None:
+            self.__checkpoint = self.__rec
+
+        if self.__aggregate.has_value() and not self.__exclude_remainder:
+            self.__report(reports)
+
+        return reports
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __report(self, reports):
+        if self.__rule_interval is None or \
+                self.__aggregate.complies_with_rule(self.__rule_interval, self.__checkpoint - self.__prev_checkpoint):
+            reports.append(self.__aggregate.report(self.__checkpoint))
+            self.__output_count += 1
+
+        else:
+            self.__rejected_count += 1
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def checkpoint(self):
+        return self.__checkpoint
+
+
+    @property
+    def expired(self):
+        return self.__expired
+
+
+    @property
+    def processed_count(self):
+        return self.__processed_count
+
+
+    @property
+    def output_count(self):
+        return self.__output_count
+
+
+    @property
+    def rejected_count(self):
+        return self.__rejected_count
+
+
+    @property
+    def late_count(self):
+        return self.__late_count
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "SampleAggregate:{iso:%s, rule_interval:%s, exclude_remainder:%s, generator:%s, aggregate:%s}" % \
+               (self.__iso, self.__rule_interval, self.__exclude_remainder, self.__generator, self.__aggregate)
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class GroupedSampleAggregate(object):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, group_by, checkpoint, min_max, iso, nodes, rule_interval=None, exclude_remainder=False):
+        """
+        Constructor
+        """
+        self.__group_by = group_by                                          # string
+        self.__checkpoint = checkpoint                                      # string
+        self.__min_max = min_max                                            # bool
+        self.__iso = iso                                                    # string
+        self.__nodes = nodes                                                # list of string
+        self.__rule_interval = rule_interval                                # Timedelta or None
+        self.__exclude_remainder = bool(exclude_remainder)                  # bool
+
+        self.__groups = {}                                                  # dict of key: SampleAggregate
+        self.__open = []                                                    # heap of (checkpoint, int, key)
+        self.__pending = []                                                 # heap of (checkpoint, int, PathDict)
+        self.__sequence = 0                                                 # int
+
+        self.__skipped_count = 0                                            # int
+
+        self.__logger = Logging.getLogger()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def append(self, datum: PathDict):
+        try:
+            key = datum.node(self.__group_by)
+        except KeyError:
+            key = None
+
+        if key is None or isinstance(key, (dict, list)):
+            self.__logger.info("discarding ungrouped: %s" % JSONify.dumps(datum))
+            self.__skipped_count += 1
+            return []
+
+        try:
+            rec = LocalizedDatetime.construct_from_iso8601(datum.node(self.__iso))
+        except KeyError:
+            rec = None
+
+        if rec is None:
+            self.__logger.info("discarding datum without %s: %s" % (self.__iso, JSONify.dumps(datum)))
+            self.__skipped_count += 1
+            return []
+
+        self.__expire(rec)
+
+        if key not in self.__groups:
+            self.__groups[key] = SampleAggregate(self.__checkpoint, self.__min_max, self.__iso, self.__nodes,
+                                                 rule_interval=self.__rule_interval,
+                                                 exclude_remainder=self.__exclude_remainder)
+
+        group = self.__groups[key]
+
+        # any report is for the checkpoint that was open before the datum was appended...
+        checkpoint = group.checkpoint
+        expired = group.expired
+
+        for report in group.append(datum):
+            self.__hold(checkpoint, key, report)
+
+        if group.checkpoint is not None and (group.checkpoint != checkpoint or expired):
+            self.__push_open(group.checkpoint, key)
+
+        return self.__release()
+
+
+    def close(self):
+        for key, group in self.__groups.items():
+            reports = group.close()
+
+            for report in reports:
+                self.__hold(group.checkpoint, key, report)
+
+        return self.__release(final=True)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __expire(self, rec):
+        while self.__open and self.__open[0][0] < rec:
+            checkpoint, sequence, key = heapq.heappop(self.__open)
+
+            if self.__is_stale(checkpoint, sequence, key):
+                continue
+
+            for report in self.__groups[key].expire(rec):
+                self.__hold(checkpoint, key, report)
+
+
+    def __hold(self, checkpoint, key, report):
+        heapq.heappush(self.__pending, (checkpoint, self.__sequence, self.__grouped(key, report)))
+        self.__sequence += 1
+
+
+    def __push_open(self, checkpoint, key):
+        heapq.heappush(self.__open, (checkpoint, self.__sequence, key))
+        self.__sequence += 1
+
+
+    def __release(self, final=False):
+        if final:
+            threshold = None
+
+        else:
+            # without checkpoints, groups report only on close...
+            if not self.__checkpoint:
+                return []
+
+            # a group cannot report a checkpoint earlier than the one it has open - expired groups report none...
+            while self.__open and self.__is_stale(*self.__open[0]):
+                heapq.heappop(self.__open)
+
+            threshold = self.__open[0][0] if self.__open else None
+
+        reports = []
+
+        while self.__pending and (threshold is None or self.__pending[0][0] <= threshold):
+            reports.append(heapq.heappop(self.__pending)[2])
+
+        return reports
+
+
+    def __is_stale(self, checkpoint, _, key):
+        group = self.__groups[key]
+
+        return group.expired or group.checkpoint != checkpoint
+
+
+    def __grouped(self, key, report):
+        if report.has_path(self.__group_by):
+            return report
+
+        # the group key follows the rec field...
+        grouped = PathDict()
+
+        for path in report.paths():
+            grouped.copy(report, path)
+
+            if path == self.__iso:
+                grouped.append(self.__group_by, key)
+
+        return grouped
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def group_count(self):
+        return len(self.__groups)
+
+
+    @property
+    def processed_count(self):
+        return sum(group.processed_count for group in self.__groups.values())
+
+
+    @property
+    def output_count(self):
+        return sum(group.output_count for group in self.__groups.values())
+
+
+    @property
+    def rejected_count(self):
+        return sum(group.rejected_count for group in self.__groups.values())
+
+
+    @property
+    def late_count(self):
+        return sum(group.late_count for group in self.__groups.values())
+
+
+    @property
+    def skipped_count(self):
+        return self.__skipped_count
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "GroupedSampleAggregate:{group_by:%s, checkpoint:%s, min_max:%s, iso:%s, nodes:%s, rule_interval:%s, " \
+               "exclude_remainder:%s, group_count:%s, pending:%s}" % \
+               (self.__group_by, self.__checkpoint, self.__min_max, self.__iso, self.__nodes, self.__rule_interval,
+                self.__exclude_remainder, self.group_count, len(self.__pending))
@@ -0,0 +1,111 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+source repo: scs_analysis
+
+The k-way merge of the sample_merge utility.
+
+Each source must already be in order of its key. A heap holds the next document from each source, so memory use grows
+with the number of sources, but not with their length. Where keys are equal, documents are taken in source order.
+
+Keys that are ISO 8601 datetimes are compared as instants, so sources may use different timezones. Other keys are
+compared as they are.
+"""
+
+import heapq
+
+from scs_core.data.datetime import LocalizedDatetime
+from scs_core.data.json import JSONify
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class SampleMerge(object):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @staticmethod
+    def key(value):
+        if isinstance(value, str):
+            rec = LocalizedDatetime.construct_from_iso8601(value)
+
+            if rec is not None:
+                return rec.timestamp()
+
+        return value
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, key_path, source_path=None):
+        """
+        Constructor
+        """
+        self.__key_path = key_path                                      # string
+        self.__source_path = source_path                                # string or None
+
+        self.__counts = {}                                              # dict of label: int
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def merge(self, sources):                                           # yields JSON string
+        # sources is a sequence of (label, iterable of (JSON string, PathDict))...
+        heap = []
+
+        for index, (label, lines) in enumerate(sources):
+            self.__counts[label] = 0
+            self.__push(heap, index, label, iter(lines), None)
+
+        while heap:
+            key, index, jstr, datum, label, lines = heapq.heappop(heap)
+
+            if self.__source_path is None:
+                yield jstr
+
+            else:
+                datum.append(self.__source_path, label)
+                yield JSONify.dumps(datum)
+
+            self.__counts[label] += 1
+            self.__push(heap, index, label, lines, key)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __push(self, heap, index, label, lines, prev_key):
+        try:
+            jstr, datum = next(lines)
+        except StopIteration:
+            return
+
+        key = self.key(datum.node(self.__key_path))                     # KeyError
+
+        try:
+            if prev_key is not None and key < prev_key:
+                raise ValueError("%s is not in order at: %s" % (label, jstr))
+
+            # the datum is never compared - the index is unique among the entries on the heap...
+            heapq.heappush(heap, (key, index, jstr, datum, label, lines))
+
+        except TypeError:
+            raise ValueError("%s has a key of an incompatible type at: %s" % (label, jstr))
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def counts(self):
+        return self.__counts
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "SampleMerge:{key_path:%s, source_path:%s, counts:%s}" % \
+               (self.__key_path, self.__source_path, self.counts)
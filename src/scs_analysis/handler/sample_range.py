@@ -0,0 +1,71 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+source repo: scs_analysis
+
+The per-document full-range / upper-range operation of the sample_range utility.
+"""
+
+from scs_core.data.path_dict import PathDict
+from scs_core.data.range import Range
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class SampleRange(object):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def construct_from_cmd(cls, cmd):
+        return cls(cmd.sub_node, cmd.full, cmd.upper, cmd.precision)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, sub_node, full, upper, precision):
+        """
+        Constructor
+        """
+        self.__sub_node = sub_node                      # string
+        self.__full = bool(full)                        # bool
+        self.__upper = bool(upper)                      # bool
+        self.__precision = precision                    # int
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def datum(self, datum: PathDict):
+        sample_range = Range(precision=self.__precision)
+        target = PathDict()
+
+        for path in datum.paths():
+            if self.__sub_node not in path:
+                target.append(path, datum.node(path))
+                continue
+
+            sample_range.append(path, datum.node(path))
+            target.append(path, datum.node(path))
+
+            if sample_range.is_complete():
+                if self.__full:
+                    target.append(*sample_range.full_range())
+
+                if self.__upper:
+                    target.append(*sample_range.upper_range())
+
+                sample_range.reset()
+
+        return target
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "SampleRange:{sub_node:%s, full:%s, upper:%s, precision:%s}" % \
+               (self.__sub_node, self.__full, self.__upper, self.__precision)
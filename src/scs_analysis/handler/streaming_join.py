@@ -0,0 +1,283 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+source repo: scs_analysis
+
+A streaming sort-merge equivalent of scs_core Join, for left and right sets that are already in primary key order.
+
+As with Join, documents with duplicate primary keys are collapsed - the last document for each key is retained. The
+sets are read together, so memory use does not grow with their length: only the documents of the other set whose keys
+are within the tolerance of the current document are held.
+
+Where a tolerance is given, each document of the anchor set (the right set for RIGHT joins, otherwise the left set) is
+matched to the document of the other set with the nearest primary key within the tolerance - earlier keys are
+preferred where two are equally near. A document of the other set may be matched more than once. For FULL joins,
+documents of the right set that match no document of the left set are also output. Without a tolerance, keys must
+match exactly, and the output is the same as that of Join.
+
+Output is in primary key order.
+
+https://en.wikipedia.org/wiki/Sort-merge_join
+"""
+
+import heapq
+
+from bisect import bisect_left
+
+from scs_core.data.datetime import LocalizedDatetime
+from scs_core.data.path_dict import PathDict
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class StreamingJoin(object):
+    """
+    classdocs
+    """
+
+    __COMPACTION = 4096                                 # expired window entries
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, join_type, left_set_path, left_pk_path, right_set_path, right_pk_path, pk_is_iso8601,
+                 tolerance=None):
+        """
+        Constructor
+        """
+        self.__join_type = join_type.upper()                                # string
+        self.__left_set_path = left_set_path                                # string
+        self.__left_pk_path = left_pk_path                                  # string
+        self.__right_set_path = right_set_path                              # string
+        self.__right_pk_path = right_pk_path                                # string
+        self.__pk_is_iso8601 = bool(pk_is_iso8601)                          # bool
+        self.__tolerance = tolerance                                        # float seconds or None
+
+        self.__left_count = 0                                               # int
+        self.__right_count = 0                                              # int
+        self.__max_window = 0                                               # int
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def join(self, left_documents, right_documents):                        # yields PathDict
+        if self.__join_type == 'RIGHT':
+            anchor_pk_path, other_pk_path = self.__right_pk_path, self.__left_pk_path
+            anchors = self.__keyed(right_documents, self.__right_pk_path, 'right')
+            others = self.__keyed(left_documents, self.__left_pk_path, 'left')
+
+        else:
+            anchor_pk_path, other_pk_path = self.__left_pk_path, self.__right_pk_path
+            anchors = self.__keyed(left_documents, self.__left_pk_path, 'left')
+            others = self.__keyed(right_documents, self.__right_pk_path, 'right')
+
+        inner = self.__join_type == 'INNER'
+        full = self.__join_type == 'FULL'
+
+        # window on the other set...
+        keys = []
+        rows = []
+        matched = []
+        head = 0
+
+        next_other = next(others, None)
+
+        # FULL output is held until it can be released in key order...
+        pending = []
+        sequence = 0
+
+        for key, pk, document in anchors:
+            # fill...
+            while next_other is not None and not self.__follows_window(next_other[0], key):
+                keys.append(next_other[0])
+                rows.append(next_other)
+                matched.append(False)
+
+                next_other = next(others, None)
+
+            # expire...
+            while head < len(keys) and self.__precedes_window(keys[head], key):
+                if full and not matched[head]:
+                    heapq.heappush(pending, (keys[head], sequence, self.__unmatched(rows[head], other_pk_path)))
+                    sequence += 1
+
+                head += 1
+
+            if head >= self.__COMPACTION:
+                del keys[:head], rows[:head], matched[:head]
+                head = 0
+
+            self.__max_window = max(self.__max_window, len(keys) - head)
+
+            # match...
+            index = self.__nearest(keys, head, key)
+
+            if index is None:
+                if inner:
+                    continue
+
+                other = None
+
+            else:
+                matched[index] = True
+                other = rows[index][2]
+
+            datum = self.__union(pk, document, anchor_pk_path, other, other_pk_path)
+
+            if not full:
+                yield datum
+                continue
+
+            heapq.heappush(pending, (key, sequence, datum))
+            sequence += 1
+
+            # no later output can have a key earlier than the current key less the tolerance...
+            while pending and self.__precedes_window(pending[0][0], key):
+                yield heapq.heappop(pending)[2]
+
+        if not full:
+            return
+
+        # remainder...
+        for index in range(head, len(keys)):
+            if not matched[index]:
+                heapq.heappush(pending, (keys[index], sequence, self.__unmatched(rows[index], other_pk_path)))
+                sequence += 1
+
+        while pending:
+            yield heapq.heappop(pending)[2]
+
+        if next_other is not None:
+            yield self.__unmatched(next_other, other_pk_path)
+
+        for row in others:
+            yield self.__unmatched(row, other_pk_path)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __keyed(self, documents, pk_path, name):                            # yields (key, pk, PathDict)
+        prev = None
+
+        for document in documents:
+            pk = document.node(pk_path)
+
+            if self.__pk_is_iso8601:
+                pk = LocalizedDatetime.construct_from_iso8601(pk)
+
+                if pk is None:
+                    raise ValueError("invalid pk '%s' in %s set: %s" % (document.node(pk_path), name, document))
+
+                key = pk.timestamp()
+
+            else:
+                key = pk
+
+            if name == 'left':
+                self.__left_count += 1
+            else:
+                self.__right_count += 1
+
+            if prev is not None:
+                if key < prev[0]:                                           # TypeError
+                    raise ValueError("%s set is not in pk order at: %s" % (name, document))
+
+                if key != prev[0]:
+                    yield prev
+
+            prev = (key, pk, document)                                      # the last duplicate is retained
+
+        if prev is not None:
+            yield prev
+
+
+    def __precedes_window(self, other_key, key):
+        if self.__tolerance is None:
+            return other_key < key                                          # keys need not be numeric
+
+        return other_key < key - self.__tolerance
+
+
+    def __follows_window(self, other_key, key):
+        if self.__tolerance is None:
+            return other_key > key
+
+        return other_key > key + self.__tolerance
+
+
+    def __nearest(self, keys, head, key):
+        index = bisect_left(keys, key, lo=head)
+
+        if self.__tolerance is None:
+            return index if index < len(keys) and keys[index] == key else None
+
+        nearest = None
+
+        for candidate in (index - 1, index):
+            if candidate < head or candidate >= len(keys):
+                continue
+
+            distance = abs(keys[candidate] - key)
+
+            if distance <= self.__tolerance and (nearest is None or distance < abs(keys[nearest] - key)):
+                nearest = candidate
+
+        return nearest
+
+
+    def __union(self, pk, document, pk_path, other, other_pk_path):
+        content = self.__content(document, pk_path)
+        other_content = None if other is None else self.__content(other, other_pk_path)
+
+        if self.__join_type == 'RIGHT':
+            return PathDict.union((self.__right_pk_path, pk), (self.__left_set_path, other_content),
+                                  (self.__right_set_path, content))
+
+        return PathDict.union((self.__left_pk_path, pk), (self.__left_set_path, content),
+                              (self.__right_set_path, other_content))
+
+
+    def __unmatched(self, row, pk_path):
+        _, pk, document = row
+
+        return PathDict.union((self.__left_pk_path, pk), (self.__left_set_path, None),
+                              (self.__right_set_path, self.__content(document, pk_path)))
+
+
+    @staticmethod
+    def __content(document, pk_path):
+        node = PathDict()
+
+        for path in document.paths():
+            if path != pk_path:
+                node.append(path, document.node(path))
+
+        return node
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def left_count(self):
+        return self.__left_count
+
+
+    @property
+    def right_count(self):
+        return self.__right_count
+
+
+    @property
+    def max_window(self):
+        return self.__max_window
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "StreamingJoin:{join_type:%s, left:%s, right:%s, pk_is_iso8601:%s, tolerance:%s, left_count:%s, " \
+               "right_count:%s, max_window:%s}" % \
+               (self.__join_type, (self.__left_set_path, self.__left_pk_path),
+                (self.__right_set_path, self.__right_pk_path), self.__pk_is_iso8601, self.__tolerance,
+                self.left_count, self.right_count, self.max_window)
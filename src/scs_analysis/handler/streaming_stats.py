@@ -0,0 +1,224 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+source repo: scs_analysis
+
+Constant-memory equivalents of scs_core Stats.construct(..), for arbitrarily long streams of values.
+
+StreamingStats maintains the count, minimum and maximum, and the mean and variance by Welford's method. The median is
+estimated by a P2Quantile: the P-square algorithm, which tracks a quantile with five markers whose heights are
+adjusted by piecewise-parabolic interpolation. Where fewer than five values have been seen, quantiles are exact.
+
+https://en.wikipedia.org/wiki/Algorithms_for_calculating_variance#Welford's_online_algorithm
+https://www.cse.wustl.edu/~jain/papers/ftp/psqr.pdf
+"""
+
+import math
+
+from scs_core.data.stats import Stats
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class StreamingStats(object):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self):
+        """
+        Constructor
+        """
+        self.__count = 0                                    # int
+
+        self.__minimum = None                               # float
+        self.__maximum = None                               # float
+
+        self.__mean = 0.0                                   # float
+        self.__m2 = 0.0                                     # float - sum of squared differences from the mean
+
+        self.__median = P2Quantile(0.5)                     # P2Quantile
+
+
+    def __len__(self):
+        return self.__count
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def append(self, value):
+        self.__count += 1
+
+        if self.__minimum is None or value < self.__minimum:
+            self.__minimum = value
+
+        if self.__maximum is None or value > self.__maximum:
+            self.__maximum = value
+
+        delta = value - self.__mean
+        self.__mean += delta / self.__count
+        self.__m2 += delta * (value - self.__mean)
+
+        self.__median.append(value)
+
+
+    def stats(self, prec=3):
+        if self.__count < 2:
+            raise ValueError("variance requires at least two data points")
+
+        minimum = round(self.__minimum, prec)
+        mean = round(self.__mean, prec)
+        median = round(self.__median.value(), prec)
+        maximum = round(self.__maximum, prec)
+
+        variance = self.__m2 / (self.__count - 1)
+
+        stdev = round(math.sqrt(variance), prec)
+        stdev2 = round(stdev * 2.0, prec)
+        stdev3 = round(stdev * 3.0, prec)
+
+        return Stats(self.__count, minimum, mean, median, maximum, round(variance, prec), stdev, stdev2, stdev3)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "StreamingStats:{count:%s, minimum:%s, maximum:%s, mean:%s, m2:%s, median:%s}" % \
+               (self.__count, self.__minimum, self.__maximum, self.__mean, self.__m2, self.__median)
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class P2Quantile(object):
+    """
+    classdocs
+    """
+
+    MARKERS = 5
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, p):
+        """
+        Constructor
+        """
+        if not 0.0 <= p <= 1.0:
+            raise ValueError("p must be in the range 0.0 to 1.0")
+
+        self.__p = p                                                        # float
+
+        self.__heights = []                                                 # list of float
+        self.__positions = [1, 2, 3, 4, 5]                                  # list of int
+        self.__desired = [1.0, 1.0 + 2.0 * p, 1.0 + 4.0 * p, 3.0 + 2.0 * p, 5.0]
+        self.__increments = [0.0, p / 2.0, p, (1.0 + p) / 2.0, 1.0]
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def append(self, value):
+        heights = self.__heights
+        positions = self.__positions
+
+        # initial values...
+        if len(heights) < self.MARKERS:
+            heights.append(value)
+
+            if len(heights) == self.MARKERS:
+                heights.sort()
+
+            return
+
+        # find cell...
+        if value < heights[0]:
+            heights[0] = value
+            cell = 0
+
+        elif value >= heights[4]:
+            heights[4] = value
+            cell = 3
+
+        else:
+            cell = 0
+
+            while value >= heights[cell + 1]:
+                cell += 1
+
+        # update positions...
+        for i in range(cell + 1, self.MARKERS):
+            positions[i] += 1
+
+        for i in range(self.MARKERS):
+            self.__desired[i] += self.__increments[i]
+
+        # adjust heights of the middle markers...
+        for i in range(1, self.MARKERS - 1):
+            offset = self.__desired[i] - positions[i]
+
+            if (offset >= 1.0 and positions[i + 1] - positions[i] > 1) or \
+                    (offset <= -1.0 and positions[i - 1] - positions[i] < -1):
+                step = 1 if offset > 0 else -1
+
+                height = self.__parabolic(i, step)
+
+                if not heights[i - 1] < height < heights[i + 1]:
+                    height = self.__linear(i, step)
+
+                heights[i] = height
+                positions[i] += step
+
+
+    def value(self):
+        if not self.__heights:
+            return None
+
+        if len(self.__heights) < self.MARKERS:
+            return self.__exact()
+
+        return self.__heights[2]
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __exact(self):
+        values = sorted(self.__heights)
+
+        index = self.__p * (len(values) - 1)
+        lower = int(index)
+
+        if lower == len(values) - 1:
+            return values[lower]
+
+        return values[lower] + (values[lower + 1] - values[lower]) * (index - lower)
+
+
+    def __parabolic(self, i, step):
+        q = self.__heights
+        n = self.__positions
+
+        return q[i] + step / (n[i + 1] - n[i - 1]) * \
+            ((n[i] - n[i - 1] + step) * (q[i + 1] - q[i]) / (n[i + 1] - n[i]) +
+             (n[i + 1] - n[i] - step) * (q[i] - q[i - 1]) / (n[i] - n[i - 1]))
+
+
+    def __linear(self, i, step):
+        q = self.__heights
+        n = self.__positions
+
+        return q[i] + step * (q[i + step] - q[i]) / (n[i + step] - n[i])
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def p(self):
+        return self.__p
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "P2Quantile:{p:%s, heights:%s, positions:%s}" % (self.p, self.__heights, self.__positions)
@@ -0,0 +1,251 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+source repo: scs_analysis
+
+A local, content-addressed cache of topic history, held in UTC day blocks.
+
+A request range is split into segments: complete day blocks that lie wholly within the range, and that ended at least
+SETTLE before now, are served from the cache, or fetched and cached on a miss - the margin allows for publications
+that are stored late. Partial blocks at the start and end of the range - in particular the tail of a range ending
+now - are always fetched from the service.
+
+Where a checkpoint is given, blocks are only cached if their boundaries are checkpoints, so that no aggregation period
+is split between blocks. Otherwise, the whole range is fetched from the service.
+
+Cache files are named by a hash of the topic, the request parameters and the block start. They are evicted when older
+than max_age, and then by least recent use when the cache exceeds max_size.
+"""
+
+import hashlib
+import json
+import os
+import time
+
+from collections import OrderedDict
+from datetime import datetime, timezone
+
+from scs_core.data.checkpoint_generator import CheckpointGenerator
+from scs_core.data.datetime import LocalizedDatetime
+from scs_core.data.json import AbstractPersistentJSONable, JSONify
+from scs_core.data.timedelta import Timedelta
+
+from scs_core.sys.filesystem import Filesystem
+from scs_core.sys.logging import Logging
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class TopicHistoryCache(object):
+    """
+    classdocs
+    """
+
+    BLOCK = Timedelta(days=1)
+    SETTLE = Timedelta(hours=1)
+
+    DEFAULT_MAX_SIZE = 1024 * 1024 * 1024                   # bytes
+    DEFAULT_MAX_AGE = Timedelta(days=30)
+
+    __DIRECTORY = 'topic_history_cache'
+    __SUFFIX = '.jsonl'
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def construct(cls, host, reporter, max_size=DEFAULT_MAX_SIZE, max_age=DEFAULT_MAX_AGE):
+        directory = os.path.join(host.scs_path(), AbstractPersistentJSONable.aws_dir(), cls.__DIRECTORY)
+
+        return cls(directory, reporter, max_size, max_age)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def block_start(cls, localised_datetime):
+        utc = localised_datetime.utc().datetime
+
+        return LocalizedDatetime(datetime(utc.year, utc.month, utc.day, tzinfo=timezone.utc))
+
+
+    @classmethod
+    def segments(cls, start, end, now, checkpoint=None):    # list of (start, end, cacheable)
+        block_start = cls.block_start(start)
+
+        if block_start < start:
+            block_start += cls.BLOCK
+
+        if block_start >= end:
+            return [(start, end, False)]
+
+        # aggregation periods must not straddle block boundaries...
+        if checkpoint is not None and not CheckpointGenerator.construct(checkpoint).aligns(block_start):
+            return [(start, end, False)]
+
+        segments = []
+
+        if start < block_start:
+            segments.append((start, block_start, False))
+
+        while block_start + cls.BLOCK <= end and block_start + cls.BLOCK + cls.SETTLE <= now:
+            segments.append((block_start, block_start + cls.BLOCK, True))
+            block_start += cls.BLOCK
+
+        if block_start < end:
+            segments.append((block_start, end, False))
+
+        return segments
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, directory, reporter, max_size, max_age):
+        """
+        Constructor
+        """
+        self.__directory = directory                                        # string
+        self.__reporter = reporter                                          # BatchDownloadReporter
+        self.__max_size = int(max_size)                                     # int (bytes)
+        self.__max_age = max_age                                            # Timedelta
+
+        self.__prev_rec = None                                              # LocalizedDatetime
+
+        self.__logger = Logging.getLogger()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def find_for_topic(self, fetch, topic, start, end, checkpoint, include_wrapper, rec_only, min_max,
+                       exclude_remainder):
+        # fetch(start, end, exclude_remainder) returns an iterable of messages from the service
+
+        segments = self.segments(start, end, LocalizedDatetime.now(), checkpoint=checkpoint)
+        self.__prev_rec = None
+
+        for index, (segment_start, segment_end, cacheable) in enumerate(segments):
+            # the remainder may only be excluded from the final segment...
+            segment_exclude_remainder = exclude_remainder and index == len(segments) - 1
+
+            if not cacheable:
+                messages = fetch(segment_start, segment_end, segment_exclude_remainder)
+
+            else:
+                key = OrderedDict()
+
+                key['topic'] = topic
+                key['checkpoint'] = checkpoint
+                key['include_wrapper'] = bool(include_wrapper)
+                key['rec_only'] = bool(rec_only)
+                key['min_max'] = bool(min_max)
+                key['block'] = segment_start.as_iso8601()
+
+                messages = self.__block(key, fetch, segment_start, segment_end)
+
+            yield from self.__released(messages, checkpoint)
+
+
+    def evict(self):
+        if not os.path.isdir(self.__directory):
+            return
+
+        oldest = time.time() - self.__max_age.total_seconds()
+        entries = []
+
+        for name in os.listdir(self.__directory):
+            if not name.endswith(self.__SUFFIX):
+                continue
+
+            path = os.path.join(self.__directory, name)
+            stat = os.stat(path)
+
+            if stat.st_mtime < oldest:
+                self.__logger.info("evicting (age): %s" % name)
+                os.remove(path)
+                continue
+
+            entries.append((stat.st_mtime, stat.st_size, path))
+
+        total_size = sum(size for _, size, _ in entries)
+
+        for _, size, path in sorted(entries):                               # least recently used first
+            if total_size <= self.__max_size:
+                break
+
+            self.__logger.info("evicting (size): %s" % os.path.basename(path))
+            os.remove(path)
+            total_size -= size
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __block(self, key, fetch, start, end):
+        path = os.path.join(self.__directory, hashlib.sha256(JSONify.dumps(key).encode()).hexdigest() + self.__SUFFIX)
+
+        # hit...
+        try:
+            with open(path) as f:
+                messages = [json.loads(line, object_pairs_hook=OrderedDict) for line in f]
+
+            os.utime(path)                                                  # record use
+            self.__reporter.hit()
+
+            return messages
+
+        except FileNotFoundError:
+            pass
+
+        # miss...
+        self.__reporter.miss()
+
+        lines = [JSONify.dumps(message) for message in fetch(start, end, False)]
+
+        Filesystem.mkdir(self.__directory)
+        tmp_path = path + '.tmp'
+
+        with open(tmp_path, 'w') as f:
+            for line in lines:
+                f.write(line + '\n')
+
+        os.replace(tmp_path, path)                                          # atomic
+
+        return [json.loads(line, object_pairs_hook=OrderedDict) for line in lines]
+
+
+    def __released(self, messages, checkpoint):
+        for message in messages:
+            if checkpoint is not None:
+                # an aggregate on a segment boundary may be reported by both segments...
+                rec = LocalizedDatetime.construct_from_iso8601(message['rec'])
+
+                if self.__prev_rec is not None and rec <= self.__prev_rec:
+                    continue
+
+                self.__prev_rec = rec
+
+            yield message
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def directory(self):
+        return self.__directory
+
+
+    @property
+    def max_size(self):
+        return self.__max_size
+
+
+    @property
+    def max_age(self):
+        return self.__max_age
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "TopicHistoryCache:{directory:%s, max_size:%s, max_age:%s}" % \
+               (self.directory, self.max_size, self.max_age)
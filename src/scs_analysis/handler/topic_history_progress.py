@@ -0,0 +1,270 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+source repo: scs_analysis
+
+A progress file for resumable topic history downloads.
+
+The file records the request, the rec of the last document written to stdout, the number of documents written with
+that rec, and the number of documents and blocks received so far. A resumed request starts at the last rec. Documents
+before the last rec are discarded, as are as many documents at the last rec as were written - topics with several
+publishers may have many documents with the same rec. Thus no document is written twice, or lost. The file is saved
+periodically and whenever the download ends.
+
+Where an output stream is given, it is flushed before the file is saved, so that the last rec is never recorded for a
+document that is still buffered - if the stream cannot be flushed, the file is not saved.
+
+example document:
+{"topic": "south-coast-science-dev/production-test/loc/1/gases", "checkpoint": null, "include-wrapper": false,
+"rec-only": false, "min-max": false, "exclude-remainder": false, "start": "2025-01-01T00:00:00Z",
+"end": "2026-01-01T00:00:00Z", "last-rec": "2025-03-14T09:21:50Z", "last-rec-documents": 1, "documents": 629823,
+"blocks": 126, "complete": false}
+"""
+
+import time
+
+from collections import OrderedDict
+
+from scs_core.data.datetime import LocalizedDatetime
+from scs_core.data.json import JSONReport
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class TopicHistoryProgress(JSONReport):
+    """
+    classdocs
+    """
+
+    SAVE_INTERVAL = 10.0                                # seconds
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def construct_from_jdict(cls, jdict, skeleton=False):
+        if not jdict:
+            return None
+
+        topic = jdict.get('topic')
+        checkpoint = jdict.get('checkpoint')
+        include_wrapper = jdict.get('include-wrapper')
+        rec_only = jdict.get('rec-only')
+        min_max = jdict.get('min-max')
+        exclude_remainder = jdict.get('exclude-remainder')
+
+        start = LocalizedDatetime.construct_from_iso8601(jdict.get('start'))
+        end = LocalizedDatetime.construct_from_iso8601(jdict.get('end'))
+        last_rec = LocalizedDatetime.construct_from_iso8601(jdict.get('last-rec'))
+        last_rec_count = jdict.get('last-rec-documents')
+
+        document_count = jdict.get('documents')
+        block_count = jdict.get('blocks')
+        complete = jdict.get('complete')
+
+        return cls(topic, checkpoint, include_wrapper, rec_only, min_max, exclude_remainder, start, end,
+                   last_rec=last_rec, last_rec_count=last_rec_count, document_count=document_count,
+                   block_count=block_count, complete=complete)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @staticmethod
+    def rec(message, include_wrapper):
+        if include_wrapper:
+            message = message['payload'] if isinstance(message, dict) else message.payload
+
+        return LocalizedDatetime.construct_from_iso8601(message['rec'])
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, topic, checkpoint, include_wrapper, rec_only, min_max, exclude_remainder, start, end,
+                 last_rec=None, last_rec_count=None, document_count=0, block_count=0, complete=False):
+        """
+        Constructor
+        """
+        self.__topic = topic                                        # string
+        self.__checkpoint = checkpoint                              # string or None
+        self.__include_wrapper = bool(include_wrapper)              # bool
+        self.__rec_only = bool(rec_only)                            # bool
+        self.__min_max = bool(min_max)                              # bool
+        self.__exclude_remainder = bool(exclude_remainder)          # bool
+
+        self.__start = start                                        # LocalizedDatetime
+        self.__end = end                                            # LocalizedDatetime
+
+        self.__last_rec = last_rec                                  # LocalizedDatetime or None
+        self.__last_rec_count = last_rec_count                      # int or None (all documents at the last rec)
+        self.__document_count = int(document_count)                 # int
+        self.__block_count = int(block_count)                       # int
+        self.__complete = bool(complete)                            # bool
+
+        self.__saved = time.time()                                  # float
+
+        self.__resume_rec = last_rec                                # LocalizedDatetime or None
+        self.__resume_count = last_rec_count                        # int or None
+        self.__resume_seen = 0                                      # int
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def is_for(self, topic, checkpoint, include_wrapper, rec_only, min_max, exclude_remainder):
+        return self.topic == topic and self.checkpoint == checkpoint and \
+               self.include_wrapper == bool(include_wrapper) and self.rec_only == bool(rec_only) and \
+               self.min_max == bool(min_max) and self.exclude_remainder == bool(exclude_remainder)
+
+
+    def resume_start(self):
+        return self.start if self.last_rec is None else self.last_rec
+
+
+    def accepts(self, rec):
+        if self.__resume_rec is None or rec > self.__resume_rec:
+            return True
+
+        if rec < self.__resume_rec or self.__resume_count is None:
+            return False
+
+        # documents at the resume rec are written in the same order by each request...
+        self.__resume_seen += 1
+
+        return self.__resume_seen > self.__resume_count
+
+
+    def emitted(self, rec, filename, stream=None):
+        if rec == self.__last_rec and self.__last_rec_count is not None:
+            self.__last_rec_count += 1
+
+        else:
+            self.__last_rec = rec
+            self.__last_rec_count = 1
+
+        self.__document_count += 1
+
+        if time.time() - self.__saved >= self.SAVE_INTERVAL:
+            self.save(filename, stream=stream)
+
+
+    def add_blocks(self, count):
+        self.__block_count += count
+
+
+    def save(self, filename, stream=None):
+        self.__saved = time.time()
+
+        if stream is not None:
+            try:
+                stream.flush()
+            except (OSError, ValueError):
+                return False                                        # the output cannot be confirmed
+
+        return super().save(filename)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def as_json(self, **kwargs):
+        jdict = OrderedDict()
+
+        jdict['topic'] = self.topic
+        jdict['checkpoint'] = self.checkpoint
+        jdict['include-wrapper'] = self.include_wrapper
+        jdict['rec-only'] = self.rec_only
+        jdict['min-max'] = self.min_max
+        jdict['exclude-remainder'] = self.exclude_remainder
+
+        jdict['start'] = self.start.as_iso8601()
+        jdict['end'] = self.end.as_iso8601()
+        jdict['last-rec'] = None if self.last_rec is None else self.last_rec.as_iso8601()
+        jdict['last-rec-documents'] = self.last_rec_count
+
+        jdict['documents'] = self.document_count
+        jdict['blocks'] = self.block_count
+        jdict['complete'] = self.complete
+
+        return jdict
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def topic(self):
+        return self.__topic
+
+
+    @property
+    def checkpoint(self):
+        return self.__checkpoint
+
+
+    @property
+    def include_wrapper(self):
+        return self.__include_wrapper
+
+
+    @property
+    def rec_only(self):
+        return self.__rec_only
+
+
+    @property
+    def min_max(self):
+        return self.__min_max
+
+
+    @property
+    def exclude_remainder(self):
+        return self.__exclude_remainder
+
+
+    @property
+    def start(self):
+        return self.__start
+
+
+    @property
+    def end(self):
+        return self.__end
+
+
+    @property
+    def last_rec(self):
+        return self.__last_rec
+
+
+    @property
+    def last_rec_count(self):
+        return self.__last_rec_count
+
+
+    @property
+    def document_count(self):
+        return self.__document_count
+
+
+    @property
+    def block_count(self):
+        return self.__block_count
+
+
+    @property
+    def complete(self):
+        return self.__complete
+
+
+    @complete.setter
+    def complete(self, complete):
+        self.__complete = bool(complete)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "TopicHistoryProgress:{topic:%s, checkpoint:%s, include_wrapper:%s, rec_only:%s, min_max:%s, " \
+               "exclude_remainder:%s, start:%s, end:%s, last_rec:%s, last_rec_count:%s, document_count:%s, " \
+               "block_count:%s, complete:%s}" % \
+               (self.topic, self.checkpoint, self.include_wrapper, self.rec_only, self.min_max,
+                self.exclude_remainder, self.start, self.end, self.last_rec, self.last_rec_count, self.document_count,
+                self.block_count, self.complete)
@@ -0,0 +1,157 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+source repo: scs_analysis
+
+A time-sharded, concurrent equivalent of TopicHistoryFinder.find_for_topic(..) for start / end ranges.
+
+The range is split into contiguous shards, which are fetched on a pool of worker threads. Where a checkpoint is
+given, shard boundaries are aligned to checkpoints, so that no aggregation period is split between shards.
+
+Results are passed through a reorder buffer, so that documents are yielded in rec order. The buffer holds at most
+one more shard than there are workers.
+"""
+
+import math
+
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+from scs_analysis.handler.batch_download_reporter import BatchDownloadReporter
+
+from scs_core.aws.manager.topic_history.topic_history_finder import TopicHistoryFinder
+
+from scs_core.data.checkpoint_generator import CheckpointGenerator
+from scs_core.data.datetime import LocalizedDatetime
+from scs_core.data.timedelta import Timedelta
+
+from scs_core.sys.logging import Logging
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class TopicHistoryShards(object):
+    """
+    classdocs
+    """
+
+    SHARDS_PER_WORKER = 4
+    MAX_SHARD_DURATION = Timedelta(days=1)
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def boundaries(cls, start, end, workers, checkpoint=None):
+        total_seconds = (end - start).total_seconds()
+        count = max(workers * cls.SHARDS_PER_WORKER,
+                    math.ceil(total_seconds / cls.MAX_SHARD_DURATION.total_seconds()))
+
+        generator = None if checkpoint is None else CheckpointGenerator.construct(checkpoint)
+
+        boundaries = [start]
+
+        for i in range(1, count):
+            boundary = start.timedelta(seconds=int(total_seconds * i / count))
+
+            if generator:
+                boundary = generator.enclosing_localised_datetime(boundary)
+
+            if boundaries[-1] < boundary < end:
+                boundaries.append(boundary)
+
+        boundaries.append(end)
+
+        return boundaries
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, token, workers):
+        """
+        Constructor
+        """
+        self.__token = token                                                # string
+        self.__workers = int(workers)                                       # int
+
+        self.__reporters = []                                               # list of BatchDownloadReporter
+        self.__prev_rec = None                                              # LocalizedDatetime
+
+        self.__logger = Logging.getLogger()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def find_for_topic(self, topic, start, end, checkpoint, include_wrapper, rec_only, min_max, exclude_remainder):
+        boundaries = self.boundaries(start, end, self.__workers, checkpoint=checkpoint)
+        shards = list(zip(boundaries[:-1], boundaries[1:]))
+
+        self.__logger.info("shards: %d" % len(shards))
+
+        pending = deque()
+        self.__prev_rec = None
+
+        executor = ThreadPoolExecutor(max_workers=self.__workers)
+
+        try:
+            for index, (shard_start, shard_end) in enumerate(shards):
+                # the remainder may only be excluded from the final shard...
+                shard_exclude_remainder = exclude_remainder and index == len(shards) - 1
+
+                pending.append(executor.submit(self.__find, topic, shard_start, shard_end, checkpoint,
+                                               include_wrapper, rec_only, min_max, shard_exclude_remainder))
+
+                if len(pending) > self.__workers:
+                    yield from self.__released(pending.popleft().result(), checkpoint)
+
+            while pending:
+                yield from self.__released(pending.popleft().result(), checkpoint)
+
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __find(self, topic, start, end, checkpoint, include_wrapper, rec_only, min_max, exclude_remainder):
+        reporter = BatchDownloadReporter(start.as_iso8601())
+        self.__reporters.append(reporter)
+
+        finder = TopicHistoryFinder(reporter=reporter)
+
+        return list(finder.find_for_topic(self.__token, topic, start, end, None, False, checkpoint, include_wrapper,
+                                          rec_only, min_max, exclude_remainder, False, None))
+
+
+    def __released(self, messages, checkpoint):
+        for message in messages:
+            if checkpoint is not None:
+                # an aggregate on a shard boundary may be reported by both shards...
+                rec = LocalizedDatetime.construct_from_iso8601(message['rec'])
+
+                if self.__prev_rec is not None and rec <= self.__prev_rec:
+                    continue
+
+                self.__prev_rec = rec
+
+            yield message
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def workers(self):
+        return self.__workers
+
+
+    @property
+    def block_count(self):
+        return sum(reporter.block_count for reporter in self.__reporters)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "TopicHistoryShards:{workers:%s, shards_per_worker:%s, max_shard_duration:%s}" % \
+               (self.workers, self.SHARDS_PER_WORKER, self.MAX_SHARD_DURATION)
@@ -27,9 +27,16 @@ By default, output is in the form of a sequence of JSON documents, separated by
 selected, output is in the form of a JSON array - the output opens with a '[' character, documents are separated by
 the ',' character, and the output is terminated by a ']' character.
 
+If the binary (-b) option is selected, output is in the form of compact, columnar binary frames. Input on stdin may be
+either JSON documents or binary frames - the format is detected automatically.
+
 Alternatively, if the node is an array or other iterable type, then it may be output as a sequence (a list of items
 separated by newline characters) according to the -s flag.
 
+Output is flushed after every document where stdout is a terminal or a socket. Otherwise, output is buffered, and is
+written in blocks of 64 kB, or when output has been held for one second. The --flush option may be used to override
+this behaviour.
+
 The ordering of output nodes is as follows:
 * Exclude mode - by input nodes
 * Default mode - by nodes specified on the command line
@@ -38,7 +45,8 @@ WARNING: node ordering is determined by the internal node structure of the input
 a.b.c, x.b.c, a.b.d would be rendered as: a.b.c, a.b.d, x.b.c
 
 SYNOPSIS
-node.py [-r FROM TO] [-m A B JOIN] [-x] [-a] [-s] [-f FILE] [-i INDENT] [-v] [NODE_1 .. NODE_N]
+node.py [-r FROM TO] [-m A B JOIN] [-x] [{ -a | -b }] [-s] [-f FILE] [-i INDENT]
+[--flush { line | block | auto }] [-v] [NODE_1 .. NODE_N]
 
 EXAMPLES
 csv_reader.py climate.csv | node.py -x val.bar
@@ -64,6 +72,10 @@ import json
 import sys
 
 from scs_analysis.cmd.cmd_node import CmdNode
+from scs_analysis.handler.binary_frame import BinaryFrameWriter
+from scs_analysis.handler.document_reader import DocumentReader
+from scs_analysis.handler.flush_policy import FlushPolicy
+from scs_analysis.handler.node_filter import NodeFilter
 
 from scs_core.data.json import JSONify
 from scs_core.data.path_dict import PathDict
@@ -75,6 +87,8 @@ from scs_core.sys.logging import Logging
 
 if __name__ == '__main__':
 
+    frame_writer = None
+
     document_count = 0
     output_count = 0
 
@@ -92,6 +106,9 @@ if __name__ == '__main__':
 
     logger.info(cmd)
 
+    flush_policy = FlushPolicy.construct(cmd.flush)
+    logger.info(flush_policy)
+
     try:
         # ------------------------------------------------------------------------------------------------------------
         # resources...
@@ -108,6 +125,12 @@ if __name__ == '__main__':
         else:
             source = sys.stdin
 
+        if cmd.binary:
+            frame_writer = BinaryFrameWriter()
+
+        node_filter = NodeFilter.construct_from_cmd(cmd)
+        logger.info(node_filter)
+
         if cmd.sequence:
             for document in source:
                 try:
@@ -117,6 +140,11 @@ if __name__ == '__main__':
                     exit(1)
                 break
 
+        if source is sys.stdin:
+            documents = DocumentReader.documents()
+        else:
+            documents = (PathDict.construct_from_jstr(document) for document in source)
+
 
         # ------------------------------------------------------------------------------------------------------------
         # run...
@@ -124,98 +152,25 @@ if __name__ == '__main__':
         if cmd.array:
             print('[', end='')
 
-        node = None
         first = True
 
-        for document in source:
-            datum = PathDict.construct_from_jstr(document)
-
+        for datum in documents:
             if datum is None:
                 continue
 
             document_count += 1
 
-            if cmd.exclude and not cmd.has_sub_paths():
-                continue                                    # everything is excluded
-
-            # --------------------------------------------------------------------------------------------------------
-            # rename...
-
-            if cmd.rename and datum.has_sub_path(sub_path=cmd.rename_from):
-                target = PathDict()
-                rename_len = len(cmd.rename_from)
-
-                for path in datum.paths():
-                    rename_from_match = PathDict.sub_path_includes_path(cmd.rename_from, path)
-
-                    target_path = cmd.rename_to + path[rename_len:] if rename_from_match else path
-                    target.append(target_path, datum.node(path))
-
-                datum = target
-
-            # --------------------------------------------------------------------------------------------------------
-            # merge...
-
-            if cmd.merge and datum.has_sub_path(sub_path=cmd.merge_a) and datum.has_sub_path(sub_path=cmd.merge_b):
-                target = PathDict()
-                a = None
-                a_found = False
-                b = None
-                b_found = False
-                merged = False
-
-                for path in datum.paths():
-                    merge_a_match = PathDict.sub_path_includes_path(cmd.merge_a, path)
-                    merge_b_match = PathDict.sub_path_includes_path(cmd.merge_b, path)
-
-                    if not (merge_a_match or merge_b_match):
-                        target.append(path, datum.node(path))
-                        continue
-
-                    if merged:
-                        continue
-
-                    if merge_a_match:
-                        target.append(cmd.merge_a, datum.node(cmd.merge_a))         # insert A
-                        a = datum.node(cmd.merge_a)
-                        a_found = True
-
-                    if merge_b_match:
-                        b = datum.node(cmd.merge_b)
-                        b_found = True
-
-                    if a_found and b_found:
-                        target.append(cmd.merge_a, cmd.merge_join.join((a, b)))     # update A
-                        merged = True
-
-                datum = target
-
-            # --------------------------------------------------------------------------------------------------------
-            # output...
-
-            if not cmd.has_sub_paths():
-                target = datum                              # everything is included
-
-            else:
-                target = PathDict()
-
-                if cmd.exclude:
-                    # use datum field ordering...
-                    for path in datum.paths():
-                        if cmd.includes(path):
-                            target.append(path, datum.node(path))
-
-                else:
-                    # use cmd.sub_paths field ordering...
-                    for sub_path in cmd.sub_paths:
-                        if datum.has_sub_path(sub_path):
-                            target.append(sub_path, datum.node(sub_path))
+            target = node_filter.datum(datum)
 
             # report...
             if not target:
                 continue                                # skip empty outputs
 
-            if cmd.array:
+            if frame_writer:
+                frame_writer.write(target)
+                output_count += 1
+
+            elif cmd.array:
                 if first:
                     print(JSONify.dumps(target), end='')
                     first = False
@@ -225,7 +180,7 @@ if __name__ == '__main__':
 
             else:
                 print(JSONify.dumps(target, indent=cmd.indent))
-                sys.stdout.flush()
+                flush_policy.flush()
                 output_count += 1
 
 
@@ -239,7 +194,14 @@ if __name__ == '__main__':
         logger.error(repr(ex))
         exit(1)
 
+    except ValueError as ex:
+        logger.error(ex)
+        exit(1)
+
     finally:
+        if frame_writer:
+            frame_writer.close()
+
         if cmd.array:
             print(']')
             output_count = 1
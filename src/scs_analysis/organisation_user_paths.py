@@ -45,8 +45,9 @@ import sys
 
 from scs_analysis.cmd.cmd_organisation_user_paths import CmdOrganisationUserPaths
 
+from scs_analysis.handler.cognito_session_cache import CognitoSessionCache
+
 from scs_core.aws.security.cognito_client_credentials import CognitoClientCredentials
-from scs_core.aws.security.cognito_login_manager import CognitoLoginManager
 
 from scs_core.aws.security.organisation import OrganisationPathRoot, OrganisationUserPath
 from scs_core.aws.security.organisation_manager import OrganisationManager
@@ -105,8 +106,7 @@ if __name__ == '__main__':
         if not credentials:
             exit(1)
 
-        gatekeeper = CognitoLoginManager()
-        auth = gatekeeper.user_login(credentials)
+        auth = CognitoSessionCache.user_login(Host, credentials)
 
         if not auth.is_ok():
             logger.error("login: %s." % auth.authentication_status.description)
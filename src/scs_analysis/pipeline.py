@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+source repo: scs_analysis
+
+DESCRIPTION
+The pipeline utility runs a chain of scs_analysis filters within a single process. Each STAGE is a quoted command
+line, exactly as it would appear in a shell pipe. Documents are passed between stages as in-memory structures,
+so the per-stage JSON parsing and serialisation - and the process start-up cost of each utility - is avoided.
+
+The following utilities are supported as stages:
+csv_reader.py (first stage only), csv_writer.py (last stage only), node.py, sample_aggregate.py and sample_range.py
+
+If the first stage is not csv_reader.py, input is a sequence of JSON documents on stdin. If the last stage is not
+csv_writer.py, output is a sequence of JSON documents on stdout. The output of the pipeline is identical to that of
+the equivalent shell pipe.
+
+The node.py stage does not support the --array, --sequence, --file or --indent options, and the csv_reader.py stage
+does not support the --array option.
+
+SYNOPSIS
+pipeline.py [--flush { line | block | auto }] [-v] STAGE_1 [.. STAGE_N]
+
+EXAMPLES
+pipeline.py "csv_reader.py climate.csv" "node.py rec val" "sample_aggregate.py -p **:/1:00" "csv_writer.py -q"
+
+SEE ALSO
+scs_analysis/csv_reader
+scs_analysis/csv_writer
+scs_analysis/node
+scs_analysis/sample_aggregate
+scs_analysis/sample_range
+"""
+
+import sys
+
+from scs_analysis.cmd.cmd_pipeline import CmdPipeline
+from scs_analysis.handler.flush_policy import FlushPolicy
+from scs_analysis.handler.pipeline_stage import PipelineStage
+
+from scs_core.data.json import JSONify
+from scs_core.data.path_dict import PathDict
+
+from scs_core.sys.logging import Logging
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+def documents():
+    for line in sys.stdin:
+        datum = PathDict.construct_from_jstr(line)
+
+        if datum is None:
+            continue
+
+        yield datum
+
+
+def run(datum, index):
+    global output_count
+
+    if index == len(stages):
+        if not sink:
+            print(JSONify.dumps(datum))
+            flush_policy.flush()
+
+        output_count += 1
+        return
+
+    for target in stages[index].process(datum):
+        run(target, index + 1)
+
+
+def close(index):
+    if index == len(stages):
+        return
+
+    for target in stages[index].close():
+        run(target, index + 1)
+
+    close(index + 1)
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+if __name__ == '__main__':
+
+    stages = []
+    sink = False
+
+    document_count = 0
+    output_count = 0
+
+    # ----------------------------------------------------------------------------------------------------------------
+    # cmd...
+
+    cmd = CmdPipeline()
+
+    if not cmd.is_valid():
+        cmd.print_help(sys.stderr)
+        exit(2)
+
+    Logging.config('pipeline', verbose=cmd.verbose)
+    logger = Logging.getLogger()
+
+    logger.info(cmd)
+
+    flush_policy = FlushPolicy.construct(cmd.flush)
+    logger.info(flush_policy)
+
+    try:
+        # ------------------------------------------------------------------------------------------------------------
+        # resources...
+
+        for specification in cmd.stages:
+            try:
+                stage = PipelineStage.construct(specification)
+
+            except ValueError:
+                logger.error("invalid stage: '%s' - supported utilities are: %s" %
+                             (specification, ', '.join(PipelineStage.utilities())))
+                exit(2)
+
+            if stage.is_source() and stages:
+                logger.error("the stage '%s' must be the first stage." % specification)
+                exit(2)
+
+            if sink:
+                logger.error("the stage '%s' must be the last stage." % cmd.stages[len(stages) - 1])
+                exit(2)
+
+            sink = stage.is_sink()
+
+            logger.info(stage)
+            stages.append(stage)
+
+        source = stages[0].documents() if stages[0].is_source() else documents()
+
+
+        # ------------------------------------------------------------------------------------------------------------
+        # run...
+
+        for datum in source:
+            document_count += 1
+            run(datum, 0)
+
+        close(0)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+    # end...
+
+    except KeyboardInterrupt:
+        print(file=sys.stderr)
+
+    except FileNotFoundError as ex:
+        logger.error("file not found: '%s'." % ex.filename)
+        exit(1)
+
+    finally:
+        logger.info("documents: %d output: %d" % (document_count, output_count))
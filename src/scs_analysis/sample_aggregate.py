@@ -47,12 +47,22 @@ individual aggregates are rejected if less than 75% of the expected data points
 must be supplied, indicating the expected interval between the input samples. The interval may be found
 using the aws_topic_history utility.
 
+If the --group-by flag is used, then an independent aggregation - with its own checkpoints - is performed for each
+value of the given field, such as the device tag, and the field is included in each report. This allows data from
+many devices, interleaved in a single stream, to be aggregated on a single pass. Reports are written in checkpoint
+order. Documents that do not have a value for the field are ignored.
+
+The grouped stream must be in rec order across all groups, as produced by sample_merge or csv_reader --merge. A group's
+checkpoint is reported as soon as a document of any group has a later rec. Documents that arrive after their group's
+checkpoint has been reported - for example, because of clock differences between devices - are discarded, and logged.
+
 WARNING: The The sample_aggregate utility uses the first input document to determine the data type for the regressions.
 If csv_reader is being used to supply data, then the csv_reader's --nullify flag should be used - this will prevent
 numeric fields being incorrectly identified as strings.
 
 SYNOPSIS
-sample_aggregate.py [-p HH:MM:SS [-x] [-r { [DD-]HH:MM[:SS]] | :SS }]] [-m] [-i ISO] [-v] [PATH_1..PATH_N]
+sample_aggregate.py [-p HH:MM:SS [-x] [-r { [DD-]HH:MM[:SS]] | :SS }]] [-m] [-i ISO]
+[-g PATH] [--flush { line | block | auto }] [-v] [PATH_1..PATH_N]
 
 EXAMPLES
 csv_reader.py ref-scs-opc-110-meteo-pmx-Y22-15min-slope-pm10-clean-vB-xm-exg.csv | \
@@ -64,17 +74,19 @@ south-coast-science-production/reference/loc/531/particulates | node.py tag rec
 sample_aggregate.py | csv_writer.py -e 531-particulates-2023-12.csv
 
 csv_reader.py -n gases.csv | sample_aggregate.py -v -r :10 -p **:/15:00
+
+csv_reader.py -n estate-gases.csv | sample_aggregate.py -v -g tag -p **:00:00 val
 """
 
 import sys
 
 from scs_analysis.cmd.cmd_sample_aggregate import CmdSampleAggregate
+from scs_analysis.handler.document_reader import DocumentReader
+from scs_analysis.handler.flush_policy import FlushPolicy
+from scs_analysis.handler.sample_aggregate import SampleAggregate
 
-from scs_core.data.aggregate import Aggregate
 from scs_core.data.checkpoint_generator import CheckpointGenerator
-from scs_core.data.datetime import LocalizedDatetime
 from scs_core.data.json import JSONify
-from scs_core.data.path_dict import PathDict
 
 from scs_core.sys.logging import Logging
 
@@ -82,15 +94,9 @@ from scs_core.sys.logging import Logging
 # --------------------------------------------------------------------------------------------------------------------
 
 if __name__ == '__main__':
-    rec = None
-    prev_checkpoint = None
-    checkpoint = None
-    prev_rec = None
 
+    sample_aggregate = None
     document_count = 0
-    processed_count = 0
-    output_count = 0
-    rejected_count = 0
 
     # ----------------------------------------------------------------------------------------------------------------
     # cmd...
@@ -106,6 +112,9 @@ if __name__ == '__main__':
 
     logger.info(cmd)
 
+    flush_policy = FlushPolicy.construct(cmd.flush)
+    logger.info(flush_policy)
+
 
     # ----------------------------------------------------------------------------------------------------------------
     # validation...
@@ -123,75 +132,25 @@ if __name__ == '__main__':
         # ------------------------------------------------------------------------------------------------------------
         # resources...
 
-        generator = CheckpointGenerator.construct(cmd.checkpoint) if cmd.checkpoint else None
-
-        aggregate = Aggregate(cmd.min_max, cmd.iso, cmd.nodes)
-        logger.info(aggregate)
+        sample_aggregate = SampleAggregate.construct_from_cmd(cmd)
+        logger.info(sample_aggregate)
 
 
         # ------------------------------------------------------------------------------------------------------------
         # run...
 
-        for line in sys.stdin:
+        for datum in DocumentReader.documents():
             # sample...
-            datum = PathDict.construct_from_jstr(line)
-
-            if datum is None:
-                continue
-
             document_count += 1
 
-            try:
-                rec_node = datum.node(cmd.iso)
-            except KeyError:
-                continue
-
-            rec = LocalizedDatetime.construct_from_iso8601(rec_node)
-
-            # set checkpoint...
-            if generator and checkpoint is None:
-                prev_checkpoint = generator.prev_localised_datetime(rec)
-                checkpoint = generator.next_localised_datetime(rec)
-
-            # report and reset...
-            if checkpoint and rec > checkpoint:
-                if cmd.ignore_rule() or aggregate.complies_with_rule(cmd.rule_interval, checkpoint - prev_checkpoint):
-                    print(JSONify.dumps(aggregate.report(checkpoint)))
-                    sys.stdout.flush()
-                    output_count += 1
-
-                else:
-                    rejected_count += 1
-
-                aggregate.reset()
-
-                if generator:
-                    prev_checkpoint = checkpoint
-                    checkpoint = generator.enclosing_localised_datetime(rec)
-
-            # duplicate recs?...
-            if rec == prev_rec:
-                logger.info("discarding duplicate: %s" % line.strip())
-                continue
-
-            # append sample...
-            aggregate.append(rec, datum)
-
-            prev_rec = rec
-            processed_count += 1
+            for report in sample_aggregate.append(datum):
+                print(JSONify.dumps(report))
+                flush_policy.flush()
 
         # report remainder...
-        if generator is None:
-            checkpoint = rec
-
-        if aggregate.has_value() and not cmd.exclude_remainder:
-            if cmd.ignore_rule() or aggregate.complies_with_rule(cmd.rule_interval, checkpoint - prev_checkpoint):
-                print(JSONify.dumps(aggregate.report(checkpoint)))
-                sys.stdout.flush()
-                output_count += 1
-
-            else:
-                rejected_count += 1
+        for report in sample_aggregate.close():
+            print(JSONify.dumps(report))
+            flush_policy.flush()
 
 
     # ----------------------------------------------------------------------------------------------------------------
@@ -201,5 +160,11 @@ if __name__ == '__main__':
         print(file=sys.stderr)
 
     finally:
-        logger.info("documents: %d processed: %d output: %d rejected: %d" %
-                    (document_count, processed_count, output_count, rejected_count))
+        if sample_aggregate is not None:
+            logger.info("documents: %d processed: %d output: %d rejected: %d" %
+                        (document_count, sample_aggregate.processed_count, sample_aggregate.output_count,
+                         sample_aggregate.rejected_count))
+
+            if cmd.group_by:
+                logger.info("groups: %d skipped: %d late: %d" %
+                            (sample_aggregate.group_count, sample_aggregate.skipped_count, sample_aggregate.late_count))
@@ -16,7 +16,7 @@ the document that is to be averaged. The node is typically a leaf node integer o
 sample_average utility includes the source value, and the average value.
 
 SYNOPSIS
-sample_average.py [-t TALLY] [-p PRECISION] [-v] [PATH]
+sample_average.py [-t TALLY] [-p PRECISION] [--flush { line | block | auto }] [-v] [PATH]
 
 EXAMPLES
 aws_topic_history.py -m1 /orgs/south-coast-science-demo/brighton/loc/1/gases | sample_average.py -t3 -p1 val.CO.cnc
@@ -36,6 +36,8 @@ DOCUMENT EXAMPLE - OUTPUT
 import sys
 
 from scs_analysis.cmd.cmd_sample_tally import CmdSampleTally
+from scs_analysis.handler.document_reader import DocumentReader
+from scs_analysis.handler.flush_policy import FlushPolicy
 
 from scs_core.data.average import Average
 from scs_core.data.json import JSONify
@@ -108,6 +110,8 @@ if __name__ == '__main__':
         cmd.print_help(sys.stderr)
         exit(2)
 
+    flush_policy = FlushPolicy.construct(cmd.flush)
+
     if cmd.verbose:
         print("sample_average: %s" % cmd, file=sys.stderr)
 
@@ -125,19 +129,14 @@ if __name__ == '__main__':
         # ------------------------------------------------------------------------------------------------------------
         # run...
 
-        for line in sys.stdin:
-            datum = PathDict.construct_from_jstr(line)
-
-            if datum is None:
-                continue
-
+        for datum in DocumentReader.documents():
             document_count += 1
 
             average = sampler.datum(datum)
 
             if average is not None:
                 print(JSONify.dumps(average))
-                sys.stdout.flush()
+                flush_policy.flush()
 
             processed_count += 1
 
@@ -24,7 +24,8 @@ Two collators are provided in this package: sample_collator collates into separa
 whereas csv_collator collates into separate CSV files (collate to rows).
 
 SYNOPSIS
-sample_collator.py -x IND_PATH [-n NAME] -y DEP_PATH [-l LOWER_BOUND] -u UPPER_BOUND -d DELTA [-v]
+sample_collator.py -x IND_PATH [-n NAME] -y DEP_PATH [-l LOWER_BOUND] -u UPPER_BOUND -d DELTA
+[--flush { line | block | auto }] [-v]
 
 EXAMPLES
 csv_reader.py -v -l 1 scs-pb1-3-ref-opc-r1-error-2019-09-27T11-03-41+01-00-15min-exegesis-error.csv | \
@@ -48,6 +49,8 @@ scs_analysis/csv_collator
 import sys
 
 from scs_analysis.cmd.cmd_sample_collator import CmdSampleCollator
+from scs_analysis.handler.document_reader import DocumentReader
+from scs_analysis.handler.flush_policy import FlushPolicy
 
 from scs_core.data.json import JSONify
 from scs_core.data.path_dict import PathDict
@@ -70,6 +73,8 @@ if __name__ == '__main__':
         cmd.print_help(sys.stderr)
         exit(2)
 
+    flush_policy = FlushPolicy.construct(cmd.flush)
+
     if cmd.verbose:
         print("sample_collator: %s" % cmd, file=sys.stderr)
 
@@ -84,8 +89,7 @@ if __name__ == '__main__':
         # run...
 
         # collect data...
-        for line in sys.stdin:
-            datum = PathDict.construct_from_jstr(line)
+        for datum in DocumentReader.documents():
             paths = datum.paths()
 
             document_count += 1
@@ -122,7 +126,7 @@ if __name__ == '__main__':
                     target.append('.'.join((cmd.dep_path, delta.description())), value)
 
             print(JSONify.dumps(target))
-            sys.stdout.flush()
+            flush_policy.flush()
 
             processed_count += 1
 
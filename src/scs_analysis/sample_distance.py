@@ -40,6 +40,7 @@ https://stackoverflow.com/questions/19412462/getting-distance-between-two-points
 import sys
 
 from scs_analysis.cmd.cmd_sample_distance import CmdSampleDistance
+from scs_analysis.handler.document_reader import DocumentReader
 
 from scs_core.data.json import JSONify
 from scs_core.data.path_dict import PathDict
@@ -83,20 +84,15 @@ if __name__ == '__main__':
 
         min_datum = None
 
-        for line in sys.stdin:
-            datum = PathDict.construct_from_jstr(line)
-
-            if datum is None:
-                continue
-
+        for jstr, datum in DocumentReader.lines():
             document_count += 1
 
             if not datum.has_sub_path(cmd.iso):
-                logger.error("ISO node '%s' not present: %s" % (cmd.iso, line.strip()))
+                logger.error("ISO node '%s' not present: %s" % (cmd.iso, jstr))
                 exit(1)
 
             if not datum.has_sub_path(cmd.path):
-                logger.error("GPS node '%s' not present: %s" % (cmd.path, line.strip()))
+                logger.error("GPS node '%s' not present: %s" % (cmd.path, jstr))
                 exit(1)
 
             gps_node = datum.node(cmd.path)
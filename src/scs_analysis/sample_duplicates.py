@@ -19,11 +19,19 @@ In the default mode, the utility outputs the rows that were duplicates (or conta
 In the --counts mode, the output report is sequence of JSON dictionaries with a field for each value where duplicates
 were found, whose value is the number of matching documents.
 
+Documents are written as soon as they are read, and only the values - not the documents - are retained. By default, a
+digest of each value is held. If the --sorted flag is set, the input must be sorted on the path, and only the previous
+value is held - duplicates that are not adjacent are not found. For very large inputs, the --bloom flag may be used to
+hold the values in a Bloom filter, sized for the given number of unique values. Its memory use is fixed, but a small
+proportion of unique documents (about 1 in 10,000, if the capacity is not exceeded) may be reported as duplicates. The
+--bloom flag may not be used in the --counts mode.
+
 SYNOPSIS
-sample_duplicates.py [{ -x | -c }] [-v] [PATH]
+sample_duplicates.py [{ -x | -c }] [{ -s | -b CAPACITY }] [-v] [PATH]
 
 EXAMPLES
 csv_reader.py climate.csv | sample_duplicates.py -v val.hmd
+aws_topic_history.py -v estate/climate -s 2024-01-01 -e 2025-01-01 | sample_duplicates.py -x -b 100000000 rec
 
 DOCUMENT EXAMPLE - OUTPUT
 default mode:
@@ -37,9 +45,9 @@ counts mode:
 import sys
 
 from scs_analysis.cmd.cmd_sample_duplicates import CmdSampleDuplicates
+from scs_analysis.handler.document_reader import DocumentReader
 
-from scs_core.data.duplicates import Duplicates
-from scs_core.data.path_dict import PathDict
+from scs_analysis.handler.duplicate_filter import BloomDuplicateFilter, DuplicateFilter
 
 from scs_core.sys.logging import Logging
 
@@ -71,30 +79,24 @@ if __name__ == '__main__':
         # ------------------------------------------------------------------------------------------------------------
         # resources...
 
-        dupes = Duplicates()
-        non_dupes = []
+        dupes = DuplicateFilter.construct(sorted_input=cmd.sorted, bloom_capacity=cmd.bloom, retain_keys=cmd.counts)
+        logger.info(dupes)
 
         # ------------------------------------------------------------------------------------------------------------
         # run...
 
-        for line in sys.stdin:
-            jstr = line.strip()
-            datum = PathDict.construct_from_jstr(jstr)
-
-            if datum is None:
-                continue
-
+        for jstr, datum in DocumentReader.lines():
             document_count += 1
 
             if not datum.has_sub_path(cmd.path):
                 continue
 
-            is_duplicate = dupes.test(document_count, datum.node(cmd.path), datum)
+            is_duplicate = dupes.test(datum.node(cmd.path))
 
             if not cmd.counts:
                 if cmd.exclude:
                     if not is_duplicate:
-                        non_dupes.append(jstr)
+                        print(jstr)
                 else:
                     if is_duplicate:
                         print(jstr)
@@ -105,10 +107,6 @@ if __name__ == '__main__':
         # ------------------------------------------------------------------------------------------------------------
         # report...
 
-        if cmd.exclude:
-            for datum in non_dupes:
-                print(datum)
-
         if cmd.counts:
             for count in dupes.match_counts():
                 print(count)
@@ -122,4 +120,14 @@ if __name__ == '__main__':
 
     finally:
         logger.info("documents: %d processed: %d" % (document_count, processed_count))
-        logger.info("values with duplicates: %d total duplicates: %d" % (dupes.matched_key_count, dupes.total_matches))
+
+        if dupes is not None:
+            if isinstance(dupes, BloomDuplicateFilter):
+                logger.info("duplicates: %d" % dupes.duplicate_count)
+
+                if dupes.saturated:
+                    logger.warning("Bloom filter capacity exceeded - the false positive rate is raised.")
+
+            else:
+                logger.info("values with duplicates: %d total duplicates: %d" %
+                            (dupes.matched_key_count, dupes.total_matches))
@@ -17,7 +17,8 @@ floating-point value, the document is ignored. If the specified ERROR_PATH is al
 overwritten.
 
 SYNOPSIS
-sample_error.py { -l | -s } [-p PRECISION] [-v] REFERENCE_PATH REPORTED_PATH ERROR_PATH
+sample_error.py { -l | -s } [-p PRECISION] [--flush { line | block | auto }] [-v]
+REFERENCE_PATH REPORTED_PATH ERROR_PATH
 
 EXAMPLES
 csv_reader.py -v Pi-R1-joined-2019-10-15min.csv | \
@@ -44,9 +45,10 @@ DOCUMENT EXAMPLE - OUTPUT
 import sys
 
 from scs_analysis.cmd.cmd_sample_error import CmdSampleError
+from scs_analysis.handler.document_reader import DocumentReader
+from scs_analysis.handler.flush_policy import FlushPolicy
 
 from scs_core.data.json import JSONify
-from scs_core.data.path_dict import PathDict
 
 
 # --------------------------------------------------------------------------------------------------------------------
@@ -65,6 +67,8 @@ if __name__ == '__main__':
         cmd.print_help(sys.stderr)
         exit(2)
 
+    flush_policy = FlushPolicy.construct(cmd.flush)
+
     if cmd.verbose:
         print("sample_error: %s" % cmd, file=sys.stderr)
         sys.stderr.flush()
@@ -76,12 +80,7 @@ if __name__ == '__main__':
 
         max_datum = None
 
-        for line in sys.stdin:
-            datum = PathDict.construct_from_jstr(line)
-
-            if datum is None:
-                continue
-
+        for datum in DocumentReader.documents():
             document_count += 1
 
             # reference...
@@ -112,7 +111,7 @@ if __name__ == '__main__':
 
             # report...
             datum.append(cmd.error_path, round(error, cmd.precision))
-            sys.stdout.flush()
+            flush_policy.flush()
 
             processed_count += 1
 
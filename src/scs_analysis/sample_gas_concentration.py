@@ -20,7 +20,7 @@ input document indicating density. For example, if the input path is SUB-PATH.dn
 a SUB-PATH.cnc field exists in the input document, it is overwritten.
 
 SYNOPSIS
-sample_gas_concentration.py [-v] GAS DENSITY_PATH T_PATH [{P_PATH | -p PRESSURE}]
+sample_gas_concentration.py [--flush { line | block | auto }] [-v] GAS DENSITY_PATH T_PATH [{P_PATH | -p PRESSURE}]
 
 EXAMPLES
 csv_reader.py joined_2019-02.csv | sample_gas_concentration.py -v NO2 ref.val.NO2.dns praxis.val.sht.tmp
@@ -42,6 +42,8 @@ http://www.apis.ac.uk/unit-conversion
 import sys
 
 from scs_analysis.cmd.cmd_sample_gas_concentration import CmdSampleGasConcentration
+from scs_analysis.handler.document_reader import DocumentReader
+from scs_analysis.handler.flush_policy import FlushPolicy
 
 from scs_core.data.json import JSONify
 from scs_core.data.path_dict import PathDict
@@ -76,6 +78,9 @@ if __name__ == '__main__':
 
     logger.info(cmd)
 
+    flush_policy = FlushPolicy.construct(cmd.flush)
+    logger.info(flush_policy)
+
 
     try:
         # ------------------------------------------------------------------------------------------------------------
@@ -96,13 +101,7 @@ if __name__ == '__main__':
         # ------------------------------------------------------------------------------------------------------------
         # run...
 
-        for line in sys.stdin:
-            jstr = line.strip()
-            datum = PathDict.construct_from_jstr(jstr)
-
-            if datum is None:
-                continue
-
+        for jstr, datum in DocumentReader.lines():
             document_count += 1
 
             paths = datum.paths()
@@ -162,7 +161,7 @@ if __name__ == '__main__':
 
             # report...
             print(JSONify.dumps(target))
-            sys.stdout.flush()
+            flush_policy.flush()
 
             processed_count += 1
 
@@ -30,9 +30,9 @@ DOCUMENT EXAMPLE - OUTPUT
 import sys
 
 from scs_analysis.cmd.cmd_sample_gas_density import CmdSampleGasDensity
+from scs_analysis.handler.document_reader import DocumentReader
 
 from scs_core.data.json import JSONify
-from scs_core.data.path_dict import PathDict
 
 from scs_core.gas.gas import Gas
 
@@ -86,12 +86,7 @@ if __name__ == '__main__':
 
         max_datum = None
 
-        for line in sys.stdin:
-            datum = PathDict.construct_from_jstr(line)
-
-            if datum is None:
-                continue
-
+        for jstr, datum in DocumentReader.lines():
             document_count += 1
 
             value_paths = datum.paths(sub_path=cmd.path)
@@ -103,13 +98,13 @@ if __name__ == '__main__':
                 try:
                     concentration = float(datum.node(sub_path=value_path))
                 except (TypeError, ValueError):
-                    logger.error("invalid value for %s concentration in %s" % (gas_name(value_path), line.strip()))
+                    logger.error("invalid value for %s concentration in %s" % (gas_name(value_path), jstr))
                     exit(1)
 
                 try:
                     density = Gas.density_stp(gas_name(value_path), concentration)
                 except ValueError:
-                    logger.error("unrecognised gas '%s' in %s" % (gas_name(value_path), line.strip()))
+                    logger.error("unrecognised gas '%s' in %s" % (gas_name(value_path), jstr))
                     exit(1)
 
                 datum.append(density_path(value_path), round(density, cmd.precision))
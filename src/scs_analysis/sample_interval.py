@@ -16,7 +16,7 @@ the sample_interval utility includes the date / time value, and the time differe
 in seconds.
 
 SYNOPSIS
-sample_interval.py [-p PRECISION] [-v] [PATH]
+sample_interval.py [-p PRECISION] [--flush { line | block | auto }] [-v] [PATH]
 
 EXAMPLES
 aws_topic_history.py -m1 /orgs/south-coast-science-demo/brighton/loc/1/gases | sample_interval.py -p3 rec
@@ -36,11 +36,12 @@ DOCUMENT EXAMPLE - OUTPUT
 import sys
 
 from scs_analysis.cmd.cmd_sample_interval import CmdSampleInterval
+from scs_analysis.handler.document_reader import DocumentReader
+from scs_analysis.handler.flush_policy import FlushPolicy
 
 from scs_core.data.datetime import LocalizedDatetime
 from scs_core.data.interval import Interval
 from scs_core.data.json import JSONify
-from scs_core.data.path_dict import PathDict
 
 
 # --------------------------------------------------------------------------------------------------------------------
@@ -59,6 +60,8 @@ if __name__ == '__main__':
         cmd.print_help(sys.stderr)
         exit(2)
 
+    flush_policy = FlushPolicy.construct(cmd.flush)
+
     if cmd.verbose:
         print("sample_interval: %s" % cmd, file=sys.stderr)
         sys.stderr.flush()
@@ -70,19 +73,14 @@ if __name__ == '__main__':
 
         prev_time = None
 
-        for line in sys.stdin:
-            datum = PathDict.construct_from_jstr(line)
-
-            if datum is None:
-                break
-
+        for datum in DocumentReader.documents():
             document_count += 1
 
             time = LocalizedDatetime.construct_from_iso8601(datum.node(cmd.path))
 
             interval = Interval.construct(prev_time, time, cmd.precision)
             print(JSONify.dumps(interval))
-            sys.stdout.flush()
+            flush_policy.flush()
 
             prev_time = time
 
@@ -42,7 +42,7 @@ specified.
 
 SYNOPSIS
 sample_iso_8601.py { -z | { -o | -f DATE_FORMAT } [-t TIMEZONE_NAME [-u]] [-i ISO_PATH]
-{ DATETIME_PATH [-n] | DATE_PATH TIME_PATH } } [-s] [-v]
+{ DATETIME_PATH [-n] | DATE_PATH TIME_PATH } } [-s] [--flush { line | block | auto }] [-v]
 
 EXAMPLES
 csv_reader.py 15_min_Praxis_LHR2.csv -l10 | sample_iso_8601.py -v -f DD/MM/YYYY "Max of Time" -t Europe/Athens -u
@@ -70,6 +70,8 @@ https://docs.microsoft.com/en-us/dotnet/api/system.datetime.tooadate?view=netfra
 import sys
 
 from scs_analysis.cmd.cmd_sample_iso_8601 import CmdSampleISO8601
+from scs_analysis.handler.document_reader import DocumentReader
+from scs_analysis.handler.flush_policy import FlushPolicy
 
 from scs_core.data.datetime import DateParser, LocalizedDatetime
 from scs_core.data.json import JSONify
@@ -106,6 +108,9 @@ if __name__ == '__main__':
 
     logger.info(cmd)
 
+    flush_policy = FlushPolicy.construct(cmd.flush)
+    logger.info(flush_policy)
+
     try:
         # ------------------------------------------------------------------------------------------------------------
         # validation...
@@ -144,13 +149,7 @@ if __name__ == '__main__':
                 print(zone, file=sys.stderr)
             exit(0)
 
-        for line in sys.stdin:
-            jstr = line.strip()
-            datum = PathDict.construct_from_jstr(jstr)
-
-            if datum is None:
-                continue
-
+        for jstr, datum in DocumentReader.lines():
             document_count += 1
 
             paths = datum.paths()
@@ -229,7 +228,7 @@ if __name__ == '__main__':
 
             # report...
             print(JSONify.dumps(target))
-            sys.stdout.flush()
+            flush_policy.flush()
 
             processed_count += 1
 
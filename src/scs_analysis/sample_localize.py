@@ -26,7 +26,7 @@ malformed ISO 8601 datetime.
 Note that the timezone of a South Coast Science device is normally reported on its status topic.
 
 SYNOPSIS
-sample_localize.py { -z | -t TIMEZONE_NAME [-i ISO_PATH] [-v]
+sample_localize.py { -z | -t TIMEZONE_NAME [-i ISO_PATH] [--flush { line | block | auto }] [-v]
 
 EXAMPLES
 aws_topic_history.py -s 2023-03-26T00:50:00Z -e 2023-03-26T01:10:00Z \
@@ -54,10 +54,11 @@ http://pytz.sourceforge.net
 import sys
 
 from scs_analysis.cmd.cmd_sample_localize import CmdSampleLocalize
+from scs_analysis.handler.document_reader import DocumentReader
+from scs_analysis.handler.flush_policy import FlushPolicy
 
 from scs_core.data.datetime import LocalizedDatetime
 from scs_core.data.json import JSONify
-from scs_core.data.path_dict import PathDict
 
 from scs_core.location.timezone import Timezone
 
@@ -85,6 +86,9 @@ if __name__ == '__main__':
 
     logger.info(cmd)
 
+    flush_policy = FlushPolicy.construct(cmd.flush)
+    logger.info(flush_policy)
+
     try:
         # ------------------------------------------------------------------------------------------------------------
         # helper...
@@ -109,13 +113,7 @@ if __name__ == '__main__':
         # ------------------------------------------------------------------------------------------------------------
         # run...
 
-        for line in sys.stdin:
-            jstr = line.strip()
-            datum = PathDict.construct_from_jstr(jstr)
-
-            if datum is None:
-                continue
-
+        for jstr, datum in DocumentReader.lines():
             document_count += 1
 
             try:
@@ -134,7 +132,7 @@ if __name__ == '__main__':
 
             # report...
             print(JSONify.dumps(datum))
-            sys.stdout.flush()
+            flush_policy.flush()
 
             processed_count += 1
 
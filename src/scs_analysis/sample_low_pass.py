@@ -16,7 +16,7 @@ the document that is to be filtered. The node is typically a leaf node integer o
 sample_low_pass utility includes the source value, and the smoothed value.
 
 SYNOPSIS
-sample_low_pass.py -d DELTA_T -c CUT_OFF [-p PRECISION] [-v] [PATH]
+sample_low_pass.py -d DELTA_T -c CUT_OFF [-p PRECISION] [--flush { line | block | auto }] [-v] [PATH]
 
 EXAMPLES
 aws_topic_history.py -m60 /orgs/south-coast-science-demo/brighton/loc/1/gases | \
@@ -41,6 +41,8 @@ https://www.embeddedrelated.com/showarticle/779.php
 import sys
 
 from scs_analysis.cmd.cmd_sample_low_pass import CmdLowPass
+from scs_analysis.handler.document_reader import DocumentReader
+from scs_analysis.handler.flush_policy import FlushPolicy
 
 from scs_core.data.json import JSONify
 from scs_core.data.low_pass_filter import LowPassFilter
@@ -63,6 +65,8 @@ if __name__ == '__main__':
         cmd.print_help(sys.stderr)
         exit(2)
 
+    flush_policy = FlushPolicy.construct(cmd.flush)
+
     if cmd.verbose:
         print("sample_low_pass: %s" % cmd, file=sys.stderr)
 
@@ -80,12 +84,7 @@ if __name__ == '__main__':
         # ------------------------------------------------------------------------------------------------------------
         # run...
 
-        for line in sys.stdin:
-            datum = PathDict.construct_from_jstr(line)
-
-            if datum is None:
-                break
-
+        for datum in DocumentReader.documents():
             document_count += 1
 
             value = datum.node(cmd.path)
@@ -102,7 +101,7 @@ if __name__ == '__main__':
             target.append(cmd.path + '.lpf', round(lpf.line(value), cmd.precision))
 
             print(JSONify.dumps(target.node()))
-            sys.stdout.flush()
+            flush_policy.flush()
 
             processed_count += 1
 
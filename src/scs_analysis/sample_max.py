@@ -42,9 +42,9 @@ DOCUMENT EXAMPLE - OUTPUT
 import sys
 
 from scs_analysis.cmd.cmd_sample_compare import CmdSampleCompare
+from scs_analysis.handler.document_reader import DocumentReader
 
 from scs_core.data.json import JSONify
-from scs_core.data.path_dict import PathDict
 
 
 # --------------------------------------------------------------------------------------------------------------------
@@ -74,12 +74,7 @@ if __name__ == '__main__':
 
         max_datum = None
 
-        for line in sys.stdin:
-            datum = PathDict.construct_from_jstr(line)
-
-            if datum is None:
-                continue
-
+        for datum in DocumentReader.documents():
             document_count += 1
 
             if cmd.path not in datum.paths():
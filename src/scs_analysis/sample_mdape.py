@@ -38,9 +38,9 @@ import json
 import sys
 
 from scs_analysis.cmd.cmd_sample_mdape import CmdSampleMdAPE
+from scs_analysis.handler.document_reader import DocumentReader
 
 from scs_core.data.mdape import MdAPE
-from scs_core.data.path_dict import PathDict
 
 from scs_core.sys.logging import Logging
 
@@ -52,11 +52,11 @@ def node(path):
         return float(datum.node(path))
 
     except KeyError:
-        logger.error("missing value for '%s': %s" % (path, line.strip()))
+        logger.error("missing value for '%s': %s" % (path, jstr))
         exit(1)
 
     except ValueError:
-        logger.error("invalid value for '%s': %s" % (path, line.strip()))
+        logger.error("invalid value for '%s': %s" % (path, jstr))
         exit(1)
 
     except TypeError:
@@ -96,12 +96,7 @@ if __name__ == '__main__':
 
         errors = []
 
-        for line in sys.stdin:
-            datum = PathDict.construct_from_jstr(line)
-
-            if datum is None:
-                continue
-
+        for jstr, datum in DocumentReader.lines():
             document_count += 1
 
             reference = node(cmd.reference_path)
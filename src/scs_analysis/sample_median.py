@@ -12,17 +12,24 @@ The sample_median utility provides a median filter - the filter maintains an odd
 data sequence, and outputs the middle item in the sorted list of items. The user can specify the
 size of the window.
 
-Input data is typically in the form of a JSON document. A command parameter specifies the path to the node within
-the document that is to be filtered. The node is typically a leaf node integer or float. The output of the
-sample_median utility includes the source value, and the smoothed value.
+Input data is typically in the form of a JSON document. Command parameters specify the paths to the nodes within
+the document that are to be filtered - each path is filtered independently, in a single pass. Each node is typically
+a leaf node integer or float. The output of the sample_median utility includes the source value, and the smoothed
+value, for each path. Documents with no value for any of the paths are skipped.
+
+The median is maintained on a pair of heaps, so the cost of each update grows only with the logarithm of the window
+size - large windows may be used on high-rate data.
 
 SYNOPSIS
-sample_median.py [-w SIZE] [-p PRECISION] [-v] [PATH]
+sample_median.py [-w SIZE] [-p PRECISION] [--flush { line | block | auto }] [-v] PATH_1 [.. PATH_N]
 
 EXAMPLES
 aws_topic_history.py -m60 /orgs/south-coast-science-demo/brighton/loc/1/gases | \
 sample_median.py -w 3 -p 1 val.CO.cnc
 
+aws_topic_history.py -m60 /orgs/south-coast-science-demo/brighton/loc/1/gases | \
+sample_median.py -w 31 -p 1 val.CO.cnc val.NO2.cnc
+
 DOCUMENT EXAMPLE - INPUT
 {"tag": "scs-bgx-401", "rec": "2018-03-27T09:54:41.042+00:00", "val": {
 "NO2": {"weV": 0.29563, "aeV": 0.280879, "weC": 0.009569, "cnc": 61.0},
@@ -42,9 +49,11 @@ https://en.wikipedia.org/wiki/Median_filter
 import sys
 
 from scs_analysis.cmd.cmd_sample_median import CmdSampleMedian
+from scs_analysis.handler.document_reader import DocumentReader
+from scs_analysis.handler.flush_policy import FlushPolicy
+from scs_analysis.handler.rolling_median import RollingMedian
 
 from scs_core.data.json import JSONify
-from scs_core.data.median_filter import MedianFilter
 from scs_core.data.path_dict import PathDict
 
 
@@ -64,6 +73,8 @@ if __name__ == '__main__':
         cmd.print_help(sys.stderr)
         exit(2)
 
+    flush_policy = FlushPolicy.construct(cmd.flush)
+
     if cmd.verbose:
         print("sample_median: %s" % cmd, file=sys.stderr)
 
@@ -71,39 +82,43 @@ if __name__ == '__main__':
     # ----------------------------------------------------------------------------------------------------------------
     # resources...
 
-    median_filter = MedianFilter(cmd.window)
+    median_filters = {path: RollingMedian(cmd.window) for path in cmd.paths}
 
     if cmd.verbose:
-        print("sample_median: %s" % median_filter, file=sys.stderr)
+        for median_filter in median_filters.values():
+            print("sample_median: %s" % median_filter, file=sys.stderr)
+
         sys.stderr.flush()
 
     try:
         # ------------------------------------------------------------------------------------------------------------
         # run...
 
-        for line in sys.stdin:
-            datum = PathDict.construct_from_jstr(line)
-
-            if datum is None:
-                continue
-
+        for datum in DocumentReader.documents():
             document_count += 1
 
-            value = datum.node(cmd.path)
-
-            if value is None:
-                continue
-
             target = PathDict()
+            filtered = False
 
             if datum.has_path('rec'):
                 target.copy(datum, 'rec')
 
-            target.append(cmd.path + '.src', value)
-            target.append(cmd.path + '.med', round(median_filter.compute(value), cmd.precision))
+            for path in cmd.paths:
+                value = datum.node(path)
+
+                if value is None:
+                    continue
+
+                target.append(path + '.src', value)
+                target.append(path + '.med', round(median_filters[path].compute(value), cmd.precision))
+
+                filtered = True
+
+            if not filtered:
+                continue
 
             print(JSONify.dumps(target.node()))
-            sys.stdout.flush()
+            flush_policy.flush()
 
             processed_count += 1
 
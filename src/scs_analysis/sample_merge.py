@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+source repo: scs_analysis
+
+DESCRIPTION
+The sample_merge utility is used to combine a number of sequences of JSON documents into a single sequence, ordered by
+the field at the given key path. Each input must already be in order of the key - typically, the inputs are the
+histories of a number of devices or topics. The output is the same as that of concatenating the inputs and sorting the
+result with sample_sort, but the merge is performed on a single pass, and memory use does not grow with the length of
+the inputs.
+
+Inputs are files. Files with the extension .csv are read as CSV, as by csv_reader, otherwise files may contain JSON
+documents or binary frames. Where keys are ISO 8601 datetimes, they are compared as instants, so inputs may use
+different timezones. Where documents in different inputs have equal keys, they are output in the order of the inputs.
+
+If the --source flag is used, the name of each document's input file is added to the document at the given path.
+
+The sample_merge utility terminates with an error if an input is found not to be in order, or if a document does
+not contain the key field.
+
+SYNOPSIS
+sample_merge.py [-k KEY_PATH] [-s SOURCE_PATH] [--flush { line | block | auto }] [-v] FILENAME_1 [.. FILENAME_N]
+
+EXAMPLES
+sample_merge.py -v -s src scs-bgx-431-gases-2023-12.json scs-bgx-432-gases-2023-12.json | \
+sample_aggregate.py -g tag -p **:00:00 val
+
+DOCUMENT EXAMPLE - INPUT
+scs-bgx-431-gases-2023-12.json:
+{"rec": "2023-12-01T00:00:00Z", "tag": "scs-bgx-431", "val": {"NO2": {"cnc": 21.6}}}
+{"rec": "2023-12-01T00:01:00Z", "tag": "scs-bgx-431", "val": {"NO2": {"cnc": 22.3}}}
+
+scs-bgx-432-gases-2023-12.json:
+{"rec": "2023-12-01T00:00:30Z", "tag": "scs-bgx-432", "val": {"NO2": {"cnc": 18.2}}}
+
+DOCUMENT EXAMPLE - OUTPUT
+{"rec": "2023-12-01T00:00:00Z", "tag": "scs-bgx-431", "val": {"NO2": {"cnc": 21.6}},
+"src": "scs-bgx-431-gases-2023-12.json"}
+{"rec": "2023-12-01T00:00:30Z", "tag": "scs-bgx-432", "val": {"NO2": {"cnc": 18.2}},
+"src": "scs-bgx-432-gases-2023-12.json"}
+{"rec": "2023-12-01T00:01:00Z", "tag": "scs-bgx-431", "val": {"NO2": {"cnc": 22.3}},
+"src": "scs-bgx-431-gases-2023-12.json"}
+
+SEE ALSO
+scs_analysis/sample_sort
+"""
+
+import sys
+
+from scs_analysis.cmd.cmd_sample_merge import CmdSampleMerge
+from scs_analysis.handler.document_reader import DocumentReader
+from scs_analysis.handler.flush_policy import FlushPolicy
+from scs_analysis.handler.sample_merge import SampleMerge
+
+from scs_core.csv.csv_reader import CSVReader, CSVReaderException
+from scs_core.data.path_dict import PathDict
+
+from scs_core.sys.logging import Logging
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+def csv_lines(csv_reader):
+    for jstr in csv_reader.rows():
+        yield jstr, PathDict.construct_from_jstr(jstr)
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+if __name__ == '__main__':
+
+    document_count = 0
+    sample_merge = None
+    files = []
+
+    # ----------------------------------------------------------------------------------------------------------------
+    # cmd...
+
+    cmd = CmdSampleMerge()
+
+    if not cmd.is_valid():
+        cmd.print_help(sys.stderr)
+        exit(2)
+
+    Logging.config('sample_merge', verbose=cmd.verbose)
+    logger = Logging.getLogger()
+
+    logger.info(cmd)
+
+    flush_policy = FlushPolicy.construct(cmd.flush)
+    logger.info(flush_policy)
+
+    try:
+        # ------------------------------------------------------------------------------------------------------------
+        # resources...
+
+        sources = []
+
+        for filename in cmd.filenames:
+            if filename.lower().endswith('.csv'):
+                reader = CSVReader.construct_for_file(filename)
+                files.append(reader)
+                sources.append((filename, csv_lines(reader)))
+
+            else:
+                file = open(filename)
+                files.append(file)
+                sources.append((filename, DocumentReader.lines(stream=file)))
+
+        sample_merge = SampleMerge(cmd.key, source_path=cmd.source)
+        logger.info(sample_merge)
+
+
+        # ------------------------------------------------------------------------------------------------------------
+        # run...
+
+        for jstr in sample_merge.merge(sources):
+            print(jstr)
+            flush_policy.flush()
+
+            document_count += 1
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+    # end...
+
+    except KeyboardInterrupt:
+        print(file=sys.stderr)
+
+    except FileNotFoundError as ex:
+        logger.error("file not found: '%s'." % ex.filename)
+        exit(1)
+
+    except KeyError as ex:
+        logger.error("key field not present: %s" % ex)
+        exit(1)
+
+    except (CSVReaderException, ValueError) as ex:
+        logger.error(ex)
+        exit(1)
+
+    finally:
+        for file in files:
+            file.close()
+
+        if sample_merge is not None:
+            for filename, count in sample_merge.counts.items():
+                logger.info("%s: %d" % (filename, count))
+
+        logger.info("documents: %d" % document_count)
@@ -16,7 +16,7 @@ the document that is to be averaged. The node is typically a leaf node integer o
 sample_midpoint utility includes the source value, and the midpoint value.
 
 SYNOPSIS
-sample_midpoint.py [-t TALLY] [-p PRECISION] [-v] [PATH]
+sample_midpoint.py [-t TALLY] [-p PRECISION] [--flush { line | block | auto }] [-v] [PATH]
 
 EXAMPLES
 aws_topic_history.py -m60 /orgs/south-coast-science-demo/brighton/loc/1/gases | \
@@ -39,10 +39,11 @@ DOCUMENT EXAMPLE - OUTPUT
 import sys
 
 from scs_analysis.cmd.cmd_sample_tally import CmdSampleTally
+from scs_analysis.handler.document_reader import DocumentReader
+from scs_analysis.handler.flush_policy import FlushPolicy
 from scs_analysis.handler.sample_midpoint import SampleMidpoint
 
 from scs_core.data.json import JSONify
-from scs_core.data.path_dict import PathDict
 
 
 # --------------------------------------------------------------------------------------------------------------------
@@ -61,6 +62,8 @@ if __name__ == '__main__':
         cmd.print_help(sys.stderr)
         exit(2)
 
+    flush_policy = FlushPolicy.construct(cmd.flush)
+
     if cmd.verbose:
         print("sample_midpoint: %s" % cmd, file=sys.stderr)
 
@@ -78,19 +81,14 @@ if __name__ == '__main__':
         # ------------------------------------------------------------------------------------------------------------
         # run...
 
-        for line in sys.stdin:
-            datum = PathDict.construct_from_jstr(line)
-
-            if datum is None:
-                continue
-
+        for datum in DocumentReader.documents():
             document_count += 1
 
             min_avg_max = sampler.datum(datum)
 
             if min_avg_max is not None:
                 print(JSONify.dumps(min_avg_max))
-                sys.stdout.flush()
+                flush_policy.flush()
 
             processed_count += 1
 
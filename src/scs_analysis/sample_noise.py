@@ -17,7 +17,7 @@ the document that is to be examined. The node is typically a leaf node integer o
 sample_noise utility includes the source value, aggregate, and the error.
 
 SYNOPSIS
-sample_noise.py [-p PRECISION] [-v] [PATH]
+sample_noise.py [-p PRECISION] [--flush { line | block | auto }] [-v] [PATH]
 
 EXAMPLES
 aws_topic_history.py -t 10 /orgs/south-coast-science-demo/brighton/loc/1/gases | sample_noise.py -p 3 val.CO.cnc
@@ -37,6 +37,8 @@ DOCUMENT EXAMPLE - OUTPUT
 import sys
 
 from scs_analysis.cmd.cmd_sample_filter import CmdSampleFilter
+from scs_analysis.handler.document_reader import DocumentReader
+from scs_analysis.handler.flush_policy import FlushPolicy
 
 from scs_core.data.json import JSONify
 from scs_core.data.path_dict import PathDict
@@ -116,6 +118,8 @@ if __name__ == '__main__':
         cmd.print_help(sys.stderr)
         exit(2)
 
+    flush_policy = FlushPolicy.construct(cmd.flush)
+
     if cmd.verbose:
         print("sample_noise: %s" % cmd, file=sys.stderr)
 
@@ -133,19 +137,14 @@ if __name__ == '__main__':
         # ------------------------------------------------------------------------------------------------------------
         # run...
 
-        for line in sys.stdin:
-            datum = PathDict.construct_from_jstr(line)
-
-            if datum is None:
-                continue
-
+        for datum in DocumentReader.documents():
             document_count += 1
 
             error_datum = err.datum(datum)
 
             if error_datum is not None:
                 print(JSONify.dumps(error_datum))
-                sys.stdout.flush()
+                flush_policy.flush()
 
             processed_count += 1
 
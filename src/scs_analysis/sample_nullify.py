@@ -20,7 +20,7 @@ Both upper and lower bounds are optional. If both are present, then the lower bo
 upper bounding value.
 
 SYNOPSIS
-sample_nullify.py -t TARGET_PATH -s SOURCE_PATH [-l LOWER] [-u UPPER] [-v]
+sample_nullify.py -t TARGET_PATH -s SOURCE_PATH [-l LOWER] [-u UPPER] [--flush { line | block | auto }] [-v]
 
 EXAMPLES
 csv_reader.py -v scs-bgx-405-corrected-2019-04-1min.csv | sample_nullify.py -v -u 80 -s meteo.val.hmd -t proc_PM10 |
@@ -42,9 +42,10 @@ DOCUMENT EXAMPLE - OUTPUT
 import sys
 
 from scs_analysis.cmd.cmd_sample_nullify import CmdSampleNullify
+from scs_analysis.handler.document_reader import DocumentReader
+from scs_analysis.handler.flush_policy import FlushPolicy
 
 from scs_core.data.json import JSONify
-from scs_core.data.path_dict import PathDict
 
 
 # --------------------------------------------------------------------------------------------------------------------
@@ -64,6 +65,8 @@ if __name__ == '__main__':
         cmd.print_help(sys.stderr)
         exit(2)
 
+    flush_policy = FlushPolicy.construct(cmd.flush)
+
     if cmd.verbose:
         print("sample_nullify: %s" % cmd, file=sys.stderr)
         sys.stderr.flush()
@@ -72,13 +75,7 @@ if __name__ == '__main__':
         # ------------------------------------------------------------------------------------------------------------
         # run...
 
-        for line in sys.stdin:
-            jstr = line.strip()
-            datum = PathDict.construct_from_jstr(jstr)
-
-            if datum is None:
-                continue
-
+        for jstr, datum in DocumentReader.lines():
             document_count += 1
 
             paths = datum.paths()
@@ -101,7 +98,7 @@ if __name__ == '__main__':
                     nullified_count += 1
 
             print(JSONify.dumps(datum))
-            sys.stdout.flush()
+            flush_policy.flush()
 
             processed_count += 1
 
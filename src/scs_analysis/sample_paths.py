@@ -22,9 +22,9 @@ csv_reader.py -v -l 1 ref-scs-opc-116-gases-2021H1-vcal-slp-err-vE-exg.csv | sam
 import sys
 
 from scs_analysis.cmd.cmd_sample_paths import CmdSamplePaths
+from scs_analysis.handler.document_reader import DocumentReader
 
 from scs_core.data.json import JSONify
-from scs_core.data.path_dict import PathDict
 
 from scs_core.sys.logging import Logging
 
@@ -54,15 +54,10 @@ if __name__ == '__main__':
         # ------------------------------------------------------------------------------------------------------------
         # run...
 
-        for line in sys.stdin:
+        for datum in DocumentReader.documents():
             if paths:
                 continue
 
-            datum = PathDict.construct_from_jstr(line)
-
-            if datum is None:
-                continue
-
             paths = datum.paths()
 
 
@@ -36,10 +36,10 @@ scs_analysis/gas_response_summary
 import sys
 
 from scs_analysis.cmd.cmd_sample_range import CmdSampleRange
+from scs_analysis.handler.document_reader import DocumentReader
+from scs_analysis.handler.sample_range import SampleRange
 
 from scs_core.data.json import JSONify
-from scs_core.data.path_dict import PathDict
-from scs_core.data.range import Range
 
 from scs_core.sys.logging import Logging
 
@@ -67,34 +67,19 @@ if __name__ == '__main__':
 
     try:
         # ------------------------------------------------------------------------------------------------------------
-        # run...
-
-        for line in sys.stdin:
-            datum = PathDict.construct_from_jstr(line)
-            sample_range = Range(precision=cmd.precision)
-            target = PathDict()
-
-            if datum is None:
-                continue
-
-            document_count += 1
+        # resources...
 
-            for path in datum.paths():
-                if cmd.sub_node not in path:
-                    target.append(path, datum.node(path))
-                    continue
+        sample_range = SampleRange.construct_from_cmd(cmd)
+        logger.info(sample_range)
 
-                sample_range.append(path, datum.node(path))
-                target.append(path, datum.node(path))
 
-                if sample_range.is_complete():
-                    if cmd.full:
-                        target.append(*sample_range.full_range())
+        # ------------------------------------------------------------------------------------------------------------
+        # run...
 
-                    if cmd.upper:
-                        target.append(*sample_range.upper_range())
+        for datum in DocumentReader.documents():
+            document_count += 1
 
-                    sample_range.reset()
+            target = sample_range.datum(datum)
 
             print(JSONify.dumps(target))
 
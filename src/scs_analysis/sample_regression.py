@@ -15,7 +15,7 @@ the document that is to be averaged. The node is typically a leaf node integer o
 sample_regression utility includes the last source value, slope and intercept.
 
 SYNOPSIS
-sample_regression.py [-t TALLY] [-p PRECISION] [-v] [PATH]
+sample_regression.py [-t TALLY] [-p PRECISION] [--flush { line | block | auto }] [-v] [PATH]
 
 EXAMPLES
 aws_topic_history.py -m60 /orgs/south-coast-science-demo/brighton/loc/1/gases | \
@@ -36,11 +36,12 @@ DOCUMENT EXAMPLE - OUTPUT
 import sys
 
 from scs_analysis.cmd.cmd_sample_tally import CmdSampleTally
+from scs_analysis.handler.document_reader import DocumentReader
+from scs_analysis.handler.flush_policy import FlushPolicy
 
 from scs_analysis.handler.sample_regression import SampleRegression
 
 from scs_core.data.json import JSONify
-from scs_core.data.path_dict import PathDict
 
 
 # --------------------------------------------------------------------------------------------------------------------
@@ -59,6 +60,8 @@ if __name__ == '__main__':
         cmd.print_help(sys.stderr)
         exit(2)
 
+    flush_policy = FlushPolicy.construct(cmd.flush)
+
     if cmd.verbose:
         print("sample_regression: %s" % cmd, file=sys.stderr)
 
@@ -76,19 +79,14 @@ if __name__ == '__main__':
         # ------------------------------------------------------------------------------------------------------------
         # run...
 
-        for line in sys.stdin:
-            datum = PathDict.construct_from_jstr(line)
-
-            if datum is None:
-                continue
-
+        for datum in DocumentReader.documents():
             document_count += 1
 
             regression = sampler.datum(datum)
 
             if regression is not None:
                 print(JSONify.dumps(regression))
-                sys.stdout.flush()
+                flush_policy.flush()
 
             processed_count += 1
 
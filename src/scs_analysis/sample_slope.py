@@ -8,26 +8,36 @@ Created on 23 Oct 2020
 source repo: scs_analysis
 
 DESCRIPTION
-The sample_slope utility it used to find the slope for a given field in a sequence of JSON documents. Slope is
-defined as delta value / delta time (in seconds).
+The sample_slope utility it used to find the slope for one or more fields in a sequence of JSON documents. Slope is
+defined as delta value / delta time (in seconds). Where several paths are given, a regression is maintained for each
+path, and all the slopes are found in a single pass. Each regression is updated incrementally, so the cost of each
+sample does not grow with the tally.
 
 The output document replaced the input field with field.cur (the current value) and field.slope. For the initial
 input document, the corresponding output document's field.slope value is null. A --tally flag specifies the number
 of rolling samples in the regression.
 
-The --max-interval flag is intended to prevent slope analyses covering long periods such as device downtime.
+The --max-interval flag is intended to prevent slope analyses covering long periods such as device downtime. The
+reset is applied to each path independently.
 
 If the --exclude-incomplete flag is set, then any data proir to the required number of tallies is not output. Where
+several paths are given, a document is output only when the tallies for all of its paths are complete. Where
 a chain of slope analyses are being performed, the flag should only be used on the last (highest tally) pass.
 
 SYNOPSIS
-sample_slope.py -n NAME [-i ISO] [-t TALLY] [-m [DD-]HH:MM[:SS]] [-x] [-p PRECISION] [-v] PATH
+sample_slope.py -n NAME [-i ISO] [-t TALLY] [-m [DD-]HH:MM[:SS]] [-x] [-p PRECISION]
+[--flush { line | block | auto }] [-v]
+PATH_1 [.. PATH_N]
 
 EXAMPLES
 bruno:scs-opc-164 bruno$ csv_reader.py -v scs-opc-164-meteo-pmx-2022-15min.csv | \
 sample_slope.py -v -n 15min -t2 -m 00:15:00 -x meteo.val.hmd | \
 csv_writer.py -v scs-opc-164-meteo-pmx-2022-15min-slope.csv
 
+csv_reader.py -v scs-opc-164-meteo-pmx-2022-15min.csv | \
+sample_slope.py -v -n 15min -t2 -m 00:15:00 -x meteo.val.hmd meteo.val.tmp pmx.val.pm1 pmx.val.pm2p5 pmx.val.pm10 | \
+csv_writer.py -v scs-opc-164-meteo-pmx-2022-15min-slope.csv
+
 DOCUMENT EXAMPLE - INPUT
 {"rec": "2022-09-13T13:30:00Z", "val": {"hmd": 72.5, "tmp": 22.2,
 "bar": {"pA": 100.964}}, "ver": 1.0, "tag": "scs-opc-125"}
@@ -40,11 +50,13 @@ DOCUMENT EXAMPLE - OUTPUT
 import sys
 
 from scs_analysis.cmd.cmd_sample_slope import CmdSampleSlope
+from scs_analysis.handler.document_reader import DocumentReader
+from scs_analysis.handler.flush_policy import FlushPolicy
+from scs_analysis.handler.running_regression import RunningRegression
 
 from scs_core.data.datetime import LocalizedDatetime
 from scs_core.data.datum import Datum
 from scs_core.data.json import JSONify
-from scs_core.data.linear_regression import LinearRegression
 from scs_core.data.path_dict import PathDict
 
 from scs_core.sys.logging import Logging
@@ -75,27 +87,25 @@ if __name__ == '__main__':
 
     logger.info(cmd)
 
+    flush_policy = FlushPolicy.construct(cmd.flush)
+    logger.info(flush_policy)
+
     try:
         # ------------------------------------------------------------------------------------------------------------
         # resources...
 
-        regression = LinearRegression(tally=cmd.tally)
+        max_interval = cmd.max_interval
+
+        regressions = {path: RunningRegression(tally=cmd.tally) for path in cmd.paths}
+        source_paths = {path: path for path in cmd.paths}
+        prev_recs = {path: None for path in cmd.paths}
+        sample_counts = {path: 0 for path in cmd.paths}
 
-        source_path = cmd.path
 
         # ------------------------------------------------------------------------------------------------------------
         # run...
 
-        prev_rec = None
-        prev_value = None
-
-        for line in sys.stdin:
-            jstr = line.strip()
-            datum = PathDict.construct_from_jstr(jstr)
-
-            if datum is None:
-                continue
-
+        for jstr, datum in DocumentReader.lines():
             document_count += 1
 
             paths = datum.paths()
@@ -112,54 +122,62 @@ if __name__ == '__main__':
                 logger.error("invalid ISO 8601 value '%s' in %s." % (rec_node, jstr))
                 exit(1)
 
-            # exclude long intervals...
-            if cmd.max_interval and prev_rec is not None and rec - prev_rec > cmd.max_interval:
-                logger.info("regression reset on %s" % jstr)
-                regression.reset()
-
-            # value...
-            if source_path not in paths:
-                if source_path + '.cur' in paths:
-                    source_path += '.cur'               # we are extending an existing slope analysis
-                else:
-                    logger.error("field %s not present in %s." % (cmd.path, jstr))
-                    exit(1)
+            slopes = {}
+            complete = True
 
-            value_node = datum.node(source_path)
-            value = Datum.float(value_node)
+            for path in cmd.paths:
+                regression = regressions[path]
 
-            if value is None:
-                logger.error("invalid numeric value '%s' in %s." % (value_node, jstr))
-                exit(1)
+                # exclude long intervals...
+                if max_interval and prev_recs[path] is not None and rec - prev_recs[path] > max_interval:
+                    logger.info("regression reset for %s on %s" % (path, jstr))
+                    regression.reset()
+
+                # value...
+                if source_paths[path] not in paths:
+                    if source_paths[path] + '.cur' in paths:
+                        source_paths[path] += '.cur'        # we are extending an existing slope analysis
+                    else:
+                        logger.error("field %s not present in %s." % (path, jstr))
+                        exit(1)
+
+                value_node = datum.node(source_paths[path])
+                value = Datum.float(value_node)
+
+                if value is None:
+                    logger.error("invalid numeric value '%s' in %s." % (value_node, jstr))
+                    exit(1)
 
-            # slope...
-            regression.append(rec, value)
+                # slope...
+                regression.append(rec, value)
+                sample_counts[path] += 1
 
-            if regression.has_regression():
                 slope = regression.slope(precision=cmd.precision)
+                slopes[source_paths[path]] = (path, value, slope)
+
+                prev_recs[path] = rec
 
-            else:
-                slope = None
+                if slope is None or sample_counts[path] < cmd.tally:
+                    complete = False
 
             # target...
             target = PathDict()
 
-            for path in datum.paths():
-                if path == source_path:
-                    target.append('.'.join((cmd.path, 'cur')), value)
-                    target.append('.'.join((cmd.path, 'slp' + cmd.name)), slope)
+            for path in paths:
+                if path in slopes:
+                    target_path, value, slope = slopes[path]
+
+                    target.append('.'.join((target_path, 'cur')), value)
+                    target.append('.'.join((target_path, 'slp' + cmd.name)), slope)
                     continue
 
                 target.copy(datum, path)
 
-            prev_rec = rec
-            prev_value = value
-
-            if cmd.exclude_incomplete and (slope is None or document_count < cmd.tally):
+            if cmd.exclude_incomplete and not complete:
                 continue
 
             print(JSONify.dumps(target))
-            sys.stdout.flush()
+            flush_policy.flush()
 
             processed_count += 1
 
@@ -12,11 +12,15 @@ The sample_sort utility is used to sort the JSON documents provided on stdin, ac
 by the given paths. It is up to the user to ensure that each document contains a leaf node for each path, and that the
 type of each node is compatible (i.e. all values for a given path are numeric or are strings).
 
+Documents are sorted within a memory budget: when the JSON held in memory exceeds the budget, it is sorted and
+spilled to a temporary file as a run, and the runs are finally merged. Input that is already in order is passed
+through without sorting. The sort is stable - documents with equal sort values retain their input order.
+
 WARNING: no support is given for localised datetimes. Therefore, for example, 2022-09-16T09:00:00Z is considered
 not equal to 2022-09-16T10:00:00+01:00.
 
 SYNOPSIS
-sample_sort.py [-r] [-v] SORT_PATH_1 [...SORT_PATH_N]
+sample_sort.py [-r] [-m MEGABYTES] [-v] SORT_PATH_1 [...SORT_PATH_N]
 
 EXAMPLES
 csv_reader.py -v ref-scs-bgx-508-20H1-slp16-vcal-err-clean-on-train-vE-exg.csv | \
@@ -27,9 +31,8 @@ csv_writer.py -v ref-scs-bgx-508-20H1-slp16-vcal-err-clean-on-train-vE-exg-sorte
 import sys
 
 from scs_analysis.cmd.cmd_sample_sort import CmdSampleSort
-
-from scs_core.data.json import JSONify
-from scs_core.data.path_dict import PathDict
+from scs_analysis.handler.document_reader import DocumentReader
+from scs_analysis.handler.external_sort import ExternalSort
 
 from scs_core.sys.logging import Logging
 
@@ -54,26 +57,20 @@ if __name__ == '__main__':
 
     logger.info(cmd)
 
+    sorter = None
+
     try:
         # ------------------------------------------------------------------------------------------------------------
-        # run...
-
-        data = []
+        # resources...
 
-        # ingest...
-        for line in sys.stdin:
-            datum = PathDict.construct_from_jstr(line, sort_paths=cmd.sort_paths)
+        sorter = ExternalSort(cmd.sort_paths, reverse=cmd.reverse, budget=cmd.memory * 1024 * 1024)
 
-            if datum is None:
-                continue
 
-            document_count += 1
-
-            data.append(datum)
+        # ------------------------------------------------------------------------------------------------------------
+        # run...
 
-        # report...
-        for datum in sorted(data, reverse=cmd.reverse):
-            print(JSONify.dumps(datum))
+        for jstr in sorter.sort(DocumentReader.lines()):
+            print(jstr)
 
 
     # ----------------------------------------------------------------------------------------------------------------
@@ -87,4 +84,8 @@ if __name__ == '__main__':
         exit(1)
 
     finally:
+        if sorter is not None:
+            document_count = sorter.document_count
+            logger.info(sorter)
+
         logger.info("documents: %d" % document_count)
@@ -44,8 +44,12 @@ In analytic mode, report fields are:
 
 A minimum of two input documents are required.
 
+By default, statistics are computed in constant memory, on a single pass: the mean and variance are exact, but the
+median is an estimate, using the P-square algorithm. If the --exact flag is set, all values are held in memory, and
+the median is exact.
+
 SYNOPSIS
-sample_stats.py [-t] [-p PRECISION] [-a] [-r] [-v] PATH1 [PATH2 .. PATHN]
+sample_stats.py [-t TAG] [-e] [-i] [-p PRECISION] [-a] [-r] [-v] PATH1 [PATH2 .. PATHN]
 
 EXAMPLES
 csv_reader.py -v scs-bgx-621-gases-2022-07-04-1min.csv | \
@@ -81,6 +85,8 @@ https://en.wikipedia.org/wiki/Standard_deviation
 import sys
 
 from scs_analysis.cmd.cmd_sample_stats import CmdSampleStats
+from scs_analysis.handler.document_reader import DocumentReader
+from scs_analysis.handler.streaming_stats import StreamingStats
 
 from scs_core.data.json import JSONify
 from scs_core.data.path_dict import PathDict
@@ -116,14 +122,9 @@ if __name__ == '__main__':
         # run...
 
         # data...
-        values = {path: [] for path in cmd.paths}
-
-        for line in sys.stdin:
-            datum = PathDict.construct_from_jstr(line)
-
-            if datum is None:
-                continue
+        values = {path: [] if cmd.exact else StreamingStats() for path in cmd.paths}
 
+        for jstr, datum in DocumentReader.lines():
             if cmd.include_tag and tag is None:
                 try:
                     tag = datum.node(cmd.tag)
@@ -134,7 +135,7 @@ if __name__ == '__main__':
 
             for path in cmd.paths:
                 if not datum.has_path(path):
-                    logger.error("path '%s' not in datum: %s" % (path, line.strip()))
+                    logger.error("path '%s' not in datum: %s" % (path, jstr))
                     exit(1)
 
                 try:
@@ -154,7 +155,10 @@ if __name__ == '__main__':
         report = PathDict()
 
         for path in cmd.paths:
-            stats = Stats.construct(values[path], prec=cmd.precision)
+            if cmd.exact:
+                stats = Stats.construct(values[path], prec=cmd.precision)
+            else:
+                stats = values[path].stats(prec=cmd.precision)
 
             if cmd.analytic:
                 stats = StatsAnalysis.construct_from_stats(stats, prec=cmd.precision)
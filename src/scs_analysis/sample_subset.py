@@ -31,7 +31,8 @@ If the --exclusions flag is used, the sample_subset utility outputs only the doc
 specification. Note that, in this case, documents with missing or empty fields are still discarded.
 
 SYNOPSIS
-sample_subset.py { -i | -n  | -s } { [-e EQUAL] | [-l LOWER] [-u UPPER] } [-s] [-x] [-v] PATH
+sample_subset.py { -i | -n  | -s } { [-e EQUAL] | [-l LOWER] [-u UPPER] } [-s] [-x]
+[--flush { line | block | auto }] [-v] PATH
 
 EXAMPLES
 csv_reader.py praxis_303.csv | \
@@ -45,10 +46,11 @@ csv_writer.py -v scs-bgx-431-ref-meteo-gases-2020-H1-slp-no2.csv
 import sys
 
 from scs_analysis.cmd.cmd_sample_subset import CmdSampleSubset
+from scs_analysis.handler.document_reader import DocumentReader
+from scs_analysis.handler.flush_policy import FlushPolicy
 
 from scs_core.data.datetime import LocalizedDatetime
 from scs_core.data.datum import Datum
-from scs_core.data.path_dict import PathDict
 
 from scs_core.sys.logging import Logging
 
@@ -80,6 +82,9 @@ if __name__ == '__main__':
 
     logger.info(cmd)
 
+    flush_policy = FlushPolicy.construct(cmd.flush)
+    logger.info(flush_policy)
+
     try:
         # ------------------------------------------------------------------------------------------------------------
         # resources...
@@ -106,15 +111,9 @@ if __name__ == '__main__':
         # ------------------------------------------------------------------------------------------------------------
         # run...
 
-        for line in sys.stdin:
+        for jstr, datum in DocumentReader.lines():
             is_member = True
 
-            jstr = line.strip()
-            datum = PathDict.construct_from_jstr(jstr)
-
-            if datum is None:
-                continue
-
             document_count += 1
 
             paths = datum.paths()
@@ -178,7 +177,7 @@ if __name__ == '__main__':
 
             # report...
             print(jstr)
-            sys.stdout.flush()
+            flush_policy.flush()
 
             output_count += 1
 
@@ -15,7 +15,7 @@ data set. This is useful when reference data is labelled for the beginning of th
 The path to the ISO 8601 recording datetime may be given, otherwise it defaults to 'rec'.
 
 SYNOPSIS
-sample_time_shift.py -t { + | - } [[DD-]HH:]MM[:SS] [-v] [PATH]
+sample_time_shift.py -t { + | - } [[DD-]HH:]MM[:SS] [--flush { line | block | auto }] [-v] [PATH]
 
 EXAMPLES
 csv_reader.py -v mfidikwe.csv | sample_time_shift.py -v -t + 00:01:00 | csv_writer.py -v mfidikwe_shifted.csv
@@ -36,10 +36,11 @@ scs_analysis/sample_localize
 import sys
 
 from scs_analysis.cmd.cmd_sample_time_shift import CmdSampleTimeShift
+from scs_analysis.handler.document_reader import DocumentReader
+from scs_analysis.handler.flush_policy import FlushPolicy
 
 from scs_core.data.datetime import LocalizedDatetime
 from scs_core.data.json import JSONify
-from scs_core.data.path_dict import PathDict
 
 from scs_core.sys.logging import Logging
 
@@ -69,16 +70,14 @@ if __name__ == '__main__':
 
     logger.info(cmd)
 
+    flush_policy = FlushPolicy.construct(cmd.flush)
+    logger.info(flush_policy)
+
     try:
         # ------------------------------------------------------------------------------------------------------------
         # run...
 
-        for line in sys.stdin:
-            datum = PathDict.construct_from_jstr(line)
-
-            if datum is None:
-                break
-
+        for datum in DocumentReader.documents():
             document_count += 1
 
             rec = LocalizedDatetime.construct_from_iso8601(datum.node(cmd.path))
@@ -87,7 +86,7 @@ if __name__ == '__main__':
             datum.append(cmd.path, shifted.as_iso8601())
 
             print(JSONify.dumps(datum))
-            sys.stdout.flush()
+            flush_policy.flush()
 
             processed_count += 1
 
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+DocumentReader must not lose or join lines where the first line is shorter than the binary frame MAGIC, and must
+return binary frame input unchanged.
+"""
+
+import io
+
+from collections import OrderedDict
+
+from scs_analysis.handler.binary_frame import BinaryFrameWriter
+from scs_analysis.handler.document_reader import DocumentReader
+
+from scs_core.data.json import JSONify
+from scs_core.data.path_dict import PathDict
+
+
+# --------------------------------------------------------------------------------------------------------------------
+# JSON lines...
+
+cases = [
+    (b'{}\n{"a":1}\n{"a":2}\n', ['{}', '{"a":1}', '{"a":2}']),
+    (b'1\n{"a":1}\n{"a":2}\n', ['1', '{"a":1}', '{"a":2}']),
+    (b'\n\n{"a":1}\n', ['{"a":1}']),
+    (b'{"a":1}\n{"a":2}', ['{"a":1}', '{"a":2}']),
+    (b'{"a"', []),
+    (b'', []),
+]
+
+for content, expected in cases:
+    jstrs = [jstr for jstr, _ in DocumentReader.lines(stream=io.TextIOWrapper(io.BytesIO(content)))]
+    print("%s: %s" % (content, jstrs))
+
+    assert jstrs == expected, jstrs
+
+print("-")
+
+
+# --------------------------------------------------------------------------------------------------------------------
+# binary frames...
+
+documents = [
+    OrderedDict([('rec', '2026-10-18T12:00:00Z'), ('val', OrderedDict([('tmp', 12.5), ('hmd', 68)])), ('tag', 'é')]),
+    OrderedDict([('rec', '2026-10-18T12:01:00Z'), ('val', OrderedDict([('tmp', 12.75), ('hmd', 69)])), ('tag', 'b')]),
+    OrderedDict([('rec', '2026-10-18T12:02:00Z'), ('val', OrderedDict([('tmp', None), ('hmd', 70)])), ('tag', 'c')]),
+]
+
+buffer = io.BytesIO()
+writer = BinaryFrameWriter(stream=buffer, frame_rows=2)
+
+for document in documents:
+    writer.write(PathDict(document))
+
+writer.close()
+
+stream = io.TextIOWrapper(io.BytesIO(buffer.getvalue()))
+jstrs = [JSONify.dumps(datum) for datum in DocumentReader.documents(stream=stream)]
+
+for jstr in jstrs:
+    print(jstr)
+
+assert jstrs == [JSONify.dumps(document) for document in documents], jstrs